@@ -0,0 +1,77 @@
+"""Image assets (public/images) for the PDF generators.
+
+SVG logos are drawn as native PDF vectors by fpdf2's SVG renderer. Each
+placement box is parsed and transformed once per process, so repeated
+renders only serialize the ready-made path.
+"""
+
+import functools
+import hashlib
+from pathlib import Path
+
+from fpdf import FPDF
+from fpdf.drawing import GraphicsContext, Transform
+from fpdf.svg import SVGObject, apply_svg_transform_to_user_space_gradients
+
+IMAGES_DIR = Path(__file__).resolve().parent.parent / "public" / "images"
+
+# Print resolution and JPEG quality of photos placed in documents (see thumbnails).
+PHOTO_DPI = 150
+JPEG_QUALITY = 85
+
+
+@functools.lru_cache(maxsize=64)
+def _read(path: Path, mtime_ns: int, size: int) -> tuple[bytes, str]:
+    data = path.read_bytes()
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def read_asset(path: Path) -> tuple[bytes, str]:
+    """Return the bytes of ``path`` and their SHA-256, re-reading only after a change."""
+    stat = path.stat()
+    return _read(path, stat.st_mtime_ns, stat.st_size)
+
+
+# --- vector logos ------------------------------------------------------------
+
+@functools.lru_cache(maxsize=64)
+def _svg_size(digest: str, data: bytes) -> tuple[float, float]:
+    svg = SVGObject(data)
+    if svg.width and svg.height:
+        return float(svg.width), float(svg.height)
+    _, _, width, height = svg.viewbox
+    return float(width), float(height)
+
+
+@functools.lru_cache(maxsize=256)
+def _svg_path(digest: str, data: bytes, x: float, y: float, w: float, h: float) -> GraphicsContext:
+    # Parsed afresh per box: fpdf's transforms mutate the SVG's gradients.
+    svg = SVGObject(data)
+    _, _, path = svg.transform_to_rect_viewport(scale=1, width=w, height=h, ignore_svg_top_attrs=True)
+    path.transform = path.transform @ Transform.translation(x, y)
+    apply_svg_transform_to_user_space_gradients(path)
+    return path
+
+
+def place_svg(
+    pdf: FPDF, source: Path, x: float, y: float, w: float | None = None, h: float | None = None,
+) -> tuple[float, float]:
+    """Draw the SVG ``source`` as vectors in the box at ``(x, y)`` and return its ``(w, h)``.
+
+    Give ``w``, ``h`` or both; a missing side keeps the SVG's aspect ratio.
+    """
+    data, digest = read_asset(source)
+    if w is None or h is None:
+        svg_w, svg_h = _svg_size(digest, data)
+        if w is None and h is None:
+            raise ValueError(f"{source.name}: give w= or h=")
+        w = w if w is not None else h * svg_w / svg_h
+        h = h if h is not None else w * svg_h / svg_w
+    path = _svg_path(digest, data, x, y, w, h)
+    old_x, old_y = pdf.x, pdf.y
+    pdf.set_xy(0, 0)
+    try:
+        pdf.draw_path(path, copy=False)
+    finally:
+        pdf.set_xy(old_x, old_y)
+    return w, h
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""Benchmark the PDF generators in documents.py.
+
+Each scenario runs in a fresh Python process so that peak RSS is measured
+per scenario and process-wide caches (e.g. the layout cache) start cold.
+Reported per scenario: render wall time (module import is reported
+separately as import_s), peak RSS, bytes written, pages and pages per second.
+
+Usage:
+    python bench_pdfs.py                          # all scenarios, table output
+    python bench_pdfs.py memo onepager-1k         # selected scenarios
+    python bench_pdfs.py --json results.json      # also write machine-readable results
+    python bench_pdfs.py --compare baseline.json  # show change against an earlier run
+"""
+
+import argparse
+import csv
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+HERE = Path(__file__).resolve().parent
+
+
+def _synthetic_trader(i: int) -> dict[str, str]:
+    return {
+        "shop_id": f"AR-{i:05d}",
+        "shop_name": f"Ikenna & Sons Footwear No. {i}",
+        "owner": "Ikenna Okafor",
+        "market": "Ariaria International Market",
+        "line": "A-Line",
+        "category": "Footwear",
+        "nin_verified": "yes" if i % 3 else "no",
+        "monthly_volume": str(250_000 + 7_919 * i % 9_000_000),
+    }
+
+
+MARKETS = ("Ariaria International Market", "Ahia Ohuru (New Market)", "Ekeoha Shopping Centre", "Cemetery Market")
+CATEGORIES = ("Footwear", "Garments", "Leather Goods", "Textiles", "Electronics")
+
+
+def _synthetic_transaction(i: int) -> tuple:
+    """Return row ``i`` of a month-long transaction log (see ``market_analytics``)."""
+    amount = 2_000 + 7_919 * i % 398_000
+    status = ("released",) * 16 + ("held", "held", "refunded", "disputed")
+    return (
+        f"T{i:08d}", f"2026-01-{1 + i % 31:02d}", f"AR-{i * 37 % 5_000:05d}",
+        MARKETS[i % len(MARKETS)], CATEGORIES[i * 7 % len(CATEGORIES)],
+        amount, f"{amount * 0.015:.2f}", status[i % 20], i * 13 % 96 if i % 20 < 16 else "",
+    )
+
+
+def _synthetic_script(sections: int) -> str:
+    """Return video-script Markdown with ``sections`` timestamped sections."""
+    parts = [
+        "# Video Walkthrough Script: Synthetic Benchmark",
+        "",
+        "**Purpose:** Scale benchmark for the Markdown script renderer",
+        "",
+        "---",
+    ]
+    for n in range(1, sections + 1):
+        minute, second = divmod(n * 30, 60)
+        parts += [
+            "",
+            f"## SECTION {n}: SYNTHETIC SECTION {n} [{minute}:{second:02d} - {minute}:{second + 29:02d}]",
+            "",
+            f"[SCREEN DIRECTION: Scroll to card {n} on the dashboard and pause for two seconds.]",
+            "",
+            f"Section {n} walks through **37,000 shops** and the **live government dashboard**, "
+            "showing how verified traders, escrow payments and monthly reports turn informal "
+            "trade into visible economic infrastructure.",
+            "",
+            "That is what this platform does.",
+        ]
+    return "\n".join(parts) + "\n"
+
+
+def _run_generators(out_dir: Path, jobs: list[tuple[str, dict]]) -> list[Path]:
+    import documents
+
+    outputs = []
+    for i, (name, kwargs) in enumerate(jobs):
+        outputs.append(documents.GENERATORS[name](output=out_dir / f"{name}-{i}.pdf", **kwargs))
+    return outputs
+
+
+def _one_pagers(count: int) -> Callable[[Path], list[Path]]:
+    return lambda out_dir: _run_generators(
+        out_dir, [("onepager", {"trader": _synthetic_trader(i)}) for i in range(count)],
+    )
+
+
+def _long_script(sections: int) -> Callable[[Path], list[Path]]:
+    def _run(out_dir: Path) -> list[Path]:
+        source = out_dir / f"synthetic-script-{sections}.md"
+        source.write_text(_synthetic_script(sections))
+        return _run_generators(out_dir, [("script-md", {"source": source})])
+    return _run
+
+
+def _synthetic_product(i: int, count: int) -> tuple:
+    """Return product ``i`` of ``count``, grouped by market and category like a catalog export."""
+    group = i * len(MARKETS) * len(CATEGORIES) // count
+    category = CATEGORIES[group % len(CATEGORIES)]
+    return (
+        f"SKU-{i:07d}", f"{category} item {i} ({('hand-stitched', 'Aba made', 'export grade')[i % 3]})",
+        f"AR-{i * 37 % 5_000:05d}", f"Shop {i * 37 % 5_000} Enterprises",
+        MARKETS[group // len(CATEGORIES)], category, 1_500 + 7_919 * i % 250_000, ("pair", "piece", "yard")[i % 3],
+    )
+
+
+def _synthetic_registry(out_dir: Path, rows: int) -> Path:
+    registry = out_dir / f"registry-{rows}.csv"
+    with registry.open("w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(_synthetic_trader(0)))
+        writer.writeheader()
+        writer.writerows(_synthetic_trader(i) for i in range(rows))
+    return registry
+
+
+def _registry_annex(rows: int) -> Callable[[Path], list[Path]]:
+    def _run(out_dir: Path) -> list[Path]:
+        import documents
+
+        registry = _synthetic_registry(out_dir, rows)
+        return [documents.generate_registry_annex(registry, out_dir / f"annex-{rows}.pdf")]
+    return _run
+
+
+def _certificates(rows: int) -> Callable[[Path], list[Path]]:
+    def _run(out_dir: Path) -> list[Path]:
+        import documents
+
+        registry = _synthetic_registry(out_dir, rows)
+        return [documents.generate_certificates(registry, out_dir / f"certificates-{rows}.pdf")]
+    return _run
+
+
+def _market_report(rows: int) -> Callable[[Path], list[Path]]:
+    def _run(out_dir: Path) -> list[Path]:
+        import documents
+        import market_analytics
+
+        log = out_dir / f"transactions-{rows}.csv"
+        with log.open("w", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(market_analytics.TRANSACTION_FIELDS)
+            writer.writerows(_synthetic_transaction(i) for i in range(rows))
+        summary = market_analytics.summarize(log)
+        return [documents.generate_market_report(summary, out_dir / f"market-report-{rows}.pdf")]
+    return _run
+
+
+def _synthetic_photos(out_dir: Path, count: int) -> list[str]:
+    """Write ``count`` distinct 12-megapixel phone-sized JPEGs and return their file names."""
+    from PIL import Image, ImageDraw
+
+    names = []
+    for i in range(count):
+        image = Image.new("RGB", (4000, 3000), (40 + 7 * i % 200, 90, 160 - 5 * i % 150))
+        draw = ImageDraw.Draw(image)
+        for k in range(12):
+            x, y = (i * 131 + k * 337) % 3400, (i * 71 + k * 211) % 2500
+            draw.rectangle((x, y, x + 600, y + 500), fill=(k * 20, 255 - i % 256, 120))
+        names.append(f"photo-{i}.jpg")
+        image.save(out_dir / names[-1], quality=90)
+    return names
+
+
+def _catalog(products: int, photos: int = 0) -> Callable[[Path], list[Path]]:
+    def _run(out_dir: Path) -> list[Path]:
+        import documents
+        from generate_pdfs import PRODUCT_FIELDS
+
+        names = _synthetic_photos(out_dir, photos)
+        export = out_dir / f"products-{products}.csv"
+        with export.open("w", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(PRODUCT_FIELDS if photos else PRODUCT_FIELDS[:-1])
+            writer.writerows(
+                (*_synthetic_product(i, products), *((names[i % photos],) if photos else ()))
+                for i in range(products)
+            )
+        return [documents.generate_catalog(export, out_dir / f"catalog-{products}.pdf")]
+    return _run
+
+
+def _charts(count: int) -> Callable[[Path], list[Path]]:
+    """Render ``count`` charts, eight per page, cycling through the chart types."""
+    def _run(out_dir: Path) -> list[Path]:
+        from fpdf import FPDF
+
+        import charts
+        from generate_pdfs import write_pdf
+
+        values = [float(200 + 7_919 * i % 500) for i in range(31)]
+        labels = [str(i + 1) if i % 5 == 0 else "" for i in range(31)]
+        pdf = FPDF(unit="mm", format="A4")
+        for i in range(count):
+            if i % 8 == 0:
+                pdf.add_page()
+            x, y = 15 + i % 2 * 95, 15 + i % 8 // 2 * 68
+            kind = i % 4
+            if kind == 0:
+                charts.bar_chart(pdf, x, y, 85, 60, values, labels)
+            elif kind == 1:
+                charts.stacked_bar_chart(pdf, x, y, 85, 60, {"a": values, "b": values[::-1]}, labels)
+            elif kind == 2:
+                charts.line_chart(pdf, x, y, 85, 60, {"a": values, "b": [v / 2 for v in values]}, labels)
+            else:
+                charts.sparkline(pdf, x, y, 85, 10, values)
+        return [write_pdf(pdf, out_dir / f"charts-{count}.pdf")]
+    return _run
+
+
+SCENARIOS: dict[str, Callable[[Path], list[Path]]] = {
+    "memo": lambda out_dir: _run_generators(out_dir, [("memo", {})]),
+    "script": lambda out_dir: _run_generators(out_dir, [("script", {})]),
+    "onepager": lambda out_dir: _run_generators(out_dir, [("onepager", {})]),
+    "onepager-1k": _one_pagers(1_000),
+    "onepager-10k": _one_pagers(10_000),
+    "script-200-sections": _long_script(200),
+    "annex-50k": _registry_annex(50_000),
+    # About 1k and 5k pages. Peak RSS should grow only by the output file,
+    # which run_scenario reads back whole to count its pages.
+    "catalog-50k": _catalog(50_000),
+    "catalog-250k": _catalog(250_000),
+    # 100 phone photos, each placed on 50 products. Wall time includes
+    # writing the photos, about 60 ms each.
+    "catalog-photos-5k": _catalog(5_000, photos=100),
+    "market-report-100k": _market_report(100_000),
+    "market-report-1m": _market_report(1_000_000),
+    "charts-2k": _charts(2_000),
+    # Two in three synthetic traders are NIN-verified: 10k certificate pages.
+    "certificates-15k": _certificates(15_000),
+}
+
+
+def run_scenario(name: str) -> dict:
+    """Run one scenario in this process and return its measurements."""
+    sys.path.insert(0, str(HERE))
+    start = time.perf_counter()
+    import documents  # noqa: F401 - timed separately from rendering
+    import pdf_optimize
+    import_s = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        outputs = SCENARIOS[name](Path(tmp))
+        wall = time.perf_counter() - start
+        pdfs = [p for p in outputs if p.suffix == ".pdf"]
+        size = sum(p.stat().st_size for p in pdfs)
+        pages = sum(pdf_optimize.page_count(p.read_bytes()) for p in pdfs)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_kb = rss // 1024 if sys.platform == "darwin" else rss
+    return {
+        "scenario": name,
+        "documents": len(pdfs),
+        "pages": pages,
+        "bytes": size,
+        "wall_s": round(wall, 4),
+        "import_s": round(import_s, 4),
+        "peak_rss_kb": rss_kb,
+        "pages_per_s": round(pages / wall, 2) if wall else 0.0,
+    }
+
+
+def _run_isolated(name: str) -> dict:
+    proc = subprocess.run(
+        [sys.executable, __file__, "--run-one", name],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def _metadata() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=HERE, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+    from fpdf import __version__ as fpdf_version
+
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "fpdf2": fpdf_version,
+        "machine": platform.machine(),
+    }
+
+
+def _change(new: float, old: float) -> str:
+    return f"{100 * (new - old) / old:+.1f}%" if old else "n/a"
+
+
+def print_table(results: list[dict], baseline: dict[str, dict] | None = None) -> None:
+    header = f"{'scenario':<22}{'docs':>7}{'pages':>8}{'bytes':>12}{'wall s':>10}{'rss MB':>9}{'pages/s':>10}"
+    if baseline:
+        header += f"{'wall':>10}{'rss':>9}{'bytes':>9}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        line = (
+            f"{r['scenario']:<22}{r['documents']:>7,}{r['pages']:>8,}{r['bytes']:>12,}"
+            f"{r['wall_s']:>10.3f}{r['peak_rss_kb'] / 1024:>9.1f}{r['pages_per_s']:>10,.1f}"
+        )
+        old = (baseline or {}).get(r["scenario"])
+        if old:
+            line += (
+                f"{_change(r['wall_s'], old['wall_s']):>10}"
+                f"{_change(r['peak_rss_kb'], old['peak_rss_kb']):>9}"
+                f"{_change(r['bytes'], old['bytes']):>9}"
+            )
+        print(line)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Aba Digital Marketplace PDF generators.")
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO",
+                        help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--json", type=Path, metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", type=Path, metavar="PATH", help="JSON results of an earlier run")
+    parser.add_argument("--run-one", metavar="SCENARIO", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_one:
+        print(json.dumps(run_scenario(args.run_one)))
+        return 0
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    results = []
+    for name in args.scenarios or SCENARIOS:
+        print(f"  running {name} ...", file=sys.stderr)
+        results.append(_run_isolated(name))
+
+    baseline = None
+    if args.compare:
+        baseline = {r["scenario"]: r for r in json.loads(args.compare.read_text())["results"]}
+    print_table(results, baseline)
+
+    if args.json:
+        args.json.write_text(json.dumps({"meta": _metadata(), "results": results}, indent=2) + "\n")
+        print(f"\nResults written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
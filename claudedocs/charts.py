@@ -0,0 +1,321 @@
+"""Vector charts drawn with plain PDF path operators.
+
+Bar, stacked bar, line and sparkline charts for the report PDFs, without
+a plotting library or embedded images. A chart is a few dozen rectangles
+and line segments, so instead of one fpdf call per shape (each with its
+graphics-state bookkeeping) its geometry is formatted into one block of
+content-stream operators, wrapped in ``q``/``Q`` so fpdf's own colors and
+line width are left alone, and appended to the page at once, as
+``table_engine`` does for table rows. Labels are measured with the font's
+glyph widths and written as one text object after the shapes; the first
+label of a chart goes through ``FPDF.text``, which registers the font on
+the page, and every label is encoded by the current font, so the Unicode
+fonts of localized documents work too.
+
+All positions and sizes are in the document's unit (mm), with ``x``/``y``
+the top-left corner of the chart's box, axis and labels included.
+"""
+
+import math
+from dataclasses import dataclass, replace
+from typing import Callable, Mapping, Sequence
+
+from fpdf import FPDF
+
+RGB = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class ChartStyle:
+    """Colors and sizes shared by the charts of a document."""
+
+    # Series colors in order: navy, gold, then tints of both and a gray.
+    colors: tuple[RGB, ...] = ((0, 40, 104), (201, 162, 39), (110, 134, 172), (228, 208, 147), (160, 160, 160))
+    text: RGB = (100, 100, 100)
+    grid: RGB = (225, 225, 225)
+    axis: RGB = (180, 180, 180)
+    font_size: float = 6
+    line_width: float = 0.5
+    # Gridlines (value steps) the value axis aims for.
+    steps: int = 4
+    # Share of each category's band taken by its bar.
+    bar_share: float = 0.7
+
+
+DEFAULT_STYLE = ChartStyle()
+
+
+def compact(value: float) -> str:
+    """Format a value as 950, 12.5k, 3.4m or 1.2bn."""
+    for scale, suffix in ((1e9, "bn"), (1e6, "m"), (1e3, "k")):
+        if abs(value) >= scale:
+            return f"{value / scale:,.1f}".removesuffix(".0") + suffix
+    return f"{value:,.0f}" if value == int(value) else f"{value:g}"
+
+
+def nice_scale(low: float, high: float, steps: int = 4) -> tuple[float, float, float]:
+    """Return ``(low, high, step)`` rounded outwards to about ``steps`` round steps."""
+    if high <= low:
+        high = low + 1
+    raw = (high - low) / steps
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw * (1 - 1e-9))
+    return math.floor(low / step + 1e-9) * step, math.ceil(high / step - 1e-9) * step, step
+
+
+class _Path:
+    """Content-stream operators for one chart, taking positions in document units."""
+
+    def __init__(self, pdf: FPDF) -> None:
+        self.pdf = pdf
+        self.k = pdf.k
+        self.page_h = pdf.h
+        self.ops = ["q"]
+        self.labels: list[tuple[float, float, str]] = []
+
+    def text_width(self, text: str) -> float:
+        pdf = self.pdf
+        return pdf.current_font.get_text_width(text, pdf.font_size_pt, None)[1] / self.k
+
+    def text(self, x: float, baseline: float, text: str, align: str = "L") -> None:
+        """Queue a label in the current font, ``align`` ("L", "C" or "R") relative to ``x``."""
+        if align != "L":
+            width = self.text_width(text)
+            x -= width if align == "R" else width / 2
+        self.labels.append((x, baseline, text))
+
+    def fill(self, color: RGB) -> None:
+        self.ops.append("{:.3f} {:.3f} {:.3f} rg".format(*(c / 255 for c in color)))
+
+    def stroke(self, color: RGB, width: float) -> None:
+        self.ops.append("{:.3f} {:.3f} {:.3f} RG".format(*(c / 255 for c in color)) + f" {width * self.k:.2f} w")
+
+    def rects(self, rects: Sequence[tuple[float, float, float, float]]) -> None:
+        """Fill ``(x, y, w, h)`` rectangles with the current fill color."""
+        if not rects:
+            return
+        k, page_h = self.k, self.page_h
+        self.ops.append(" ".join(
+            f"{x * k:.2f} {(page_h - y - h) * k:.2f} {w * k:.2f} {h * k:.2f} re" for x, y, w, h in rects
+        ) + " f")
+
+    def lines(self, points: Sequence[tuple[float, float]], close: bool = False) -> None:
+        """Stroke a polyline through ``points`` with the current stroke color."""
+        k, page_h = self.k, self.page_h
+        ops = [f"{x * k:.2f} {(page_h - y) * k:.2f} l" for x, y in points]
+        ops[0] = ops[0][:-1] + "m"
+        self.ops.append(" ".join(ops) + (" h" if close else "") + " S")
+
+    def segments(self, segments: Sequence[tuple[float, float, float, float]]) -> None:
+        """Stroke separate ``(x1, y1, x2, y2)`` segments with the current stroke color."""
+        if not segments:
+            return
+        k, page_h = self.k, self.page_h
+        self.ops.append(" ".join(
+            f"{x1 * k:.2f} {(page_h - y1) * k:.2f} m {x2 * k:.2f} {(page_h - y2) * k:.2f} l"
+            for x1, y1, x2, y2 in segments
+        ) + " S")
+
+    def write(self, text_color: RGB = (0, 0, 0)) -> None:
+        """Append the shapes, then the labels, to the current page."""
+        pdf = self.pdf
+        labels = self.labels
+        if labels:
+            # Through fpdf, so the font lands in the page's resources.
+            x, baseline, text = labels[0]
+            pdf.text(x, baseline, text)
+        if len(labels) > 1:
+            font = pdf.current_font
+            k, page_h = self.k, self.page_h
+            self.fill(text_color)
+            self.ops.append(f"BT /F{font.i} {pdf.font_size_pt:.2f} Tf")
+            self.ops.extend(
+                f"1 0 0 1 {x * k:.2f} {(page_h - baseline) * k:.2f} Tm {font.encode_text(pdf.normalize_text(text))}"
+                for x, baseline, text in labels[1:]
+            )
+            self.ops.append("ET")
+        self.ops.append("Q\n")
+        pdf.pages[pdf.page].contents.extend("\n".join(self.ops).encode("latin-1"))
+
+
+@dataclass
+class _Plot:
+    """The plot area of a chart and its value axis."""
+
+    x: float
+    y: float
+    w: float
+    h: float
+    low: float
+    high: float
+
+    def value_y(self, value: float) -> float:
+        return self.y + self.h * (self.high - value) / (self.high - self.low)
+
+
+def _frame(
+    pdf: FPDF, path: _Path, x: float, y: float, w: float, h: float,
+    low: float, high: float, labels: Sequence[str], legend: Sequence[tuple[str, RGB]],
+    style: ChartStyle, value_format: Callable[[float], str],
+) -> _Plot:
+    """Draw the legend, value axis and gridlines; return the plot area left for the data."""
+    pdf.set_font("Helvetica", "", style.font_size)
+    pdf.set_text_color(*style.text)
+    font_h = style.font_size / pdf.k
+
+    top = y
+    if legend:
+        key_x = x
+        swatches = []
+        for name, color in legend:
+            swatches.append((key_x, y + 0.1 * font_h, 0.8 * font_h, 0.8 * font_h, color))
+            path.text(key_x + 1.2 * font_h, y + 0.85 * font_h, name)
+            key_x += 1.2 * font_h + path.text_width(name) + 3
+        for sx, sy, sw, sh, color in swatches:
+            path.fill(color)
+            path.rects([(sx, sy, sw, sh)])
+        top += font_h + 2
+
+    low, high, step = nice_scale(low, high, style.steps)
+    ticks = [low + i * step for i in range(round((high - low) / step) + 1)]
+    tick_labels = [value_format(tick) for tick in ticks]
+    axis_w = max(map(path.text_width, tick_labels)) + 1.5
+    # Half a line of headroom for the top tick label.
+    plot = _Plot(x + axis_w, top + font_h / 2, w - axis_w, h - (top - y) - font_h / 2, low, high)
+    if labels:
+        plot.h -= font_h + 1.5
+
+    gridlines = []
+    for tick, label in zip(ticks, tick_labels):
+        tick_y = plot.value_y(tick)
+        path.text(plot.x - 1.5, tick_y + 0.35 * font_h, label, align="R")
+        if tick != 0:
+            gridlines.append((plot.x, tick_y, plot.x + plot.w, tick_y))
+    path.stroke(style.grid, 0.2)
+    path.segments(gridlines)
+    path.stroke(style.axis, 0.3)
+    baseline = plot.value_y(min(max(0.0, low), high))
+    path.segments([(plot.x, baseline, plot.x + plot.w, baseline)])
+    return plot
+
+
+def _category_labels(path: _Path, plot: _Plot, centers: Sequence[float], labels: Sequence[str], style: ChartStyle) -> None:
+    baseline = plot.y + plot.h + 1.5 + style.font_size / path.k * 0.8
+    for center, label in zip(centers, labels):
+        if label:
+            path.text(center, baseline, label, align="C")
+
+
+def stacked_bar_chart(
+    pdf: FPDF, x: float, y: float, w: float, h: float,
+    series: Mapping[str, Sequence[float]], labels: Sequence[str] = (), *,
+    style: ChartStyle = DEFAULT_STYLE, legend: bool = True,
+    value_format: Callable[[float], str] = compact,
+) -> None:
+    """Draw one bar per category, stacking the values of every series (in order, bottom up).
+
+    ``labels`` name the categories under the bars; empty labels are skipped,
+    so long axes can label every n-th bar only.
+    """
+    columns = list(zip(*series.values()))
+    colors = [style.colors[i % len(style.colors)] for i in range(len(series))]
+    highs = [sum(v for v in column if v > 0) for column in columns]
+    lows = [sum(v for v in column if v < 0) for column in columns]
+    path = _Path(pdf)
+    plot = _frame(
+        pdf, path, x, y, w, h, min(lows, default=0.0), max(highs, default=0.0), labels,
+        list(zip(series, colors)) if legend and len(series) > 1 else (), style, value_format,
+    )
+    band = plot.w / max(len(columns), 1)
+    bar_w = band * style.bar_share
+    rects: list[list[tuple[float, float, float, float]]] = [[] for _ in series]
+    # Positive values stack up from the zero line, negative ones down.
+    scale = plot.h / (plot.high - plot.low)
+    zero = plot.value_y(0.0)
+    for index, column in enumerate(columns):
+        left = plot.x + index * band + (band - bar_w) / 2
+        up = down = zero
+        for bars, value in zip(rects, column):
+            height = value * scale
+            if height > 0.01:
+                up -= height
+                bars.append((left, up, bar_w, height))
+            elif height < -0.01:
+                bars.append((left, down, bar_w, -height))
+                down -= height
+    for bars, color in zip(rects, colors):
+        path.fill(color)
+        path.rects(bars)
+    _category_labels(path, plot, [plot.x + (i + 0.5) * band for i in range(len(columns))], labels, style)
+    path.write(style.text)
+
+
+def bar_chart(
+    pdf: FPDF, x: float, y: float, w: float, h: float,
+    values: Sequence[float], labels: Sequence[str] = (), *,
+    style: ChartStyle = DEFAULT_STYLE, color: RGB | None = None,
+    value_format: Callable[[float], str] = compact,
+) -> None:
+    """Draw one bar per value (see ``stacked_bar_chart`` for ``labels``)."""
+    if color is not None:
+        style = replace(style, colors=(color,))
+    stacked_bar_chart(
+        pdf, x, y, w, h, {"": values}, labels, style=style, legend=False, value_format=value_format,
+    )
+
+
+def line_chart(
+    pdf: FPDF, x: float, y: float, w: float, h: float,
+    series: Mapping[str, Sequence[float]], labels: Sequence[str] = (), *,
+    style: ChartStyle = DEFAULT_STYLE, legend: bool = True,
+    value_format: Callable[[float], str] = compact, low: float | None = None,
+) -> None:
+    """Draw one line per series over evenly spaced points (see ``stacked_bar_chart`` for ``labels``).
+
+    The value axis starts at zero unless ``low`` is given (or a value is negative).
+    """
+    values = [v for line in series.values() for v in line] + ([0.0] if low is None else [low])
+    points = max(map(len, series.values()), default=0)
+    colors = [style.colors[i % len(style.colors)] for i in range(len(series))]
+    path = _Path(pdf)
+    plot = _frame(
+        pdf, path, x, y, w, h, min(values), max(values),
+        labels, list(zip(series, colors)) if legend and len(series) > 1 else (), style, value_format,
+    )
+    spacing = plot.w / (points - 1) if points > 1 else 0.0
+    centers = [plot.x + i * spacing if points > 1 else plot.x + plot.w / 2 for i in range(points)]
+    for line, color in zip(series.values(), colors):
+        if not line:
+            continue
+        coords = [(cx, plot.value_y(v)) for cx, v in zip(centers, line)]
+        if len(coords) > 1:
+            path.stroke(color, style.line_width)
+            path.lines(coords)
+        else:
+            dot = 3 * style.line_width
+            path.fill(color)
+            path.rects([(coords[0][0] - dot / 2, coords[0][1] - dot / 2, dot, dot)])
+    _category_labels(path, plot, centers, labels, style)
+    path.write(style.text)
+
+
+def sparkline(
+    pdf: FPDF, x: float, y: float, w: float, h: float, values: Sequence[float], *,
+    style: ChartStyle = DEFAULT_STYLE, color: RGB | None = None, mark_last: bool = True,
+) -> None:
+    """Draw a bare trend line of ``values`` filling the box, its last point marked."""
+    if not values:
+        return
+    low, high = min(values), max(values)
+    span = (high - low) or 1.0
+    step = w / (len(values) - 1) if len(values) > 1 else 0.0
+    coords = [(x + i * step, y + h - h * (v - low) / span) for i, v in enumerate(values)]
+    path = _Path(pdf)
+    path.stroke(color or style.colors[0], style.line_width * 0.6)
+    path.lines(coords if len(coords) > 1 else [coords[0], (x + w, coords[0][1])])
+    if mark_last:
+        dot = 0.9
+        last_x, last_y = coords[-1]
+        path.fill(style.colors[1 % len(style.colors)])
+        path.rects([(last_x - dot / 2, last_y - dot / 2, dot, dot)])
+    path.write()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Check that the generators still render byte-identical PDFs.
+
+Every case renders a document reproducibly (with the fixed creation date of
+``generate_pdfs --reproducible``) twice in one process: cold, then with the
+layout, memo-body, font and asset caches warm. Both renders must match the
+SHA-256 recorded in goldens.json. Run it after a performance change to show
+the change leaves the output alone; as Python randomizes string hashing per
+process, repeated runs also catch output that depends on set or dict order.
+
+The Unicode-font cases depend on the installed DejaVu fonts, and every case
+on the fpdf2 and zlib versions; a warning is printed when the environment
+differs from the one the goldens were recorded in.
+
+Usage:
+    python check_goldens.py                  # check every case
+    python check_goldens.py memo bundle      # selected cases
+    python check_goldens.py --update         # record goldens after an intended change
+    python check_goldens.py --list
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Callable
+
+HERE = Path(__file__).resolve().parent
+GOLDENS_PATH = HERE / "goldens.json"
+
+TRADER = {
+    "shop_id": "AR-00042",
+    "shop_name": "Ikenna & Sons Footwear",
+    "owner": "Ikenna Okafor",
+    "market": "Ariaria International Market",
+    "line": "A-Line",
+    "category": "Footwear",
+    "nin_verified": "yes",
+    "monthly_volume": "1250000",
+}
+LOCALIZED_TRADER = {**TRADER, "shop_name": "Ọ̀kọ̀ Ṣàngó Footwear", "owner": "Adéwálé Ọládipọ̀"}
+RECIPIENT = {"id": "lga-aba-north", "to": "Chairman, Aba North LGA", "date": "March 2026"}
+
+
+def _registry_row(i: int) -> dict[str, str]:
+    return {
+        **TRADER,
+        "shop_id": f"AR-{i:05d}",
+        "shop_name": f"Shop {i} {('Footwear', 'Leather Goods', 'Garments')[i % 3]}",
+        "nin_verified": "yes" if i % 4 else "no",
+        "monthly_volume": str(150_000 + 7_919 * i),
+    }
+
+
+def _render(name: str, **kwargs) -> Callable[[], bytes]:
+    def _run() -> bytes:
+        import documents
+
+        return documents.render_bytes(name, **kwargs)
+    return _run
+
+
+def _with_registry(rows: int, render: Callable[[Path, io.BytesIO], None]) -> Callable[[], bytes]:
+    def _run() -> bytes:
+        with tempfile.TemporaryDirectory() as tmp:
+            registry = Path(tmp) / "registry.csv"
+            with registry.open("w", newline="", encoding="utf-8") as fh:
+                writer = csv.DictWriter(fh, fieldnames=list(TRADER))
+                writer.writeheader()
+                writer.writerows(_registry_row(i) for i in range(rows))
+            buffer = io.BytesIO()
+            render(registry, buffer)
+            return buffer.getvalue()
+    return _run
+
+
+def _annex(registry: Path, buffer: io.BytesIO) -> None:
+    import documents
+
+    documents.generate_registry_annex(registry, buffer)
+
+
+def _bundle(registry: Path, buffer: io.BytesIO) -> None:
+    import documents
+
+    documents.generate_bundle([_registry_row(i) for i in range(3)], registry, buffer)
+
+
+def _market_report(rows: int) -> Callable[[], bytes]:
+    def _run() -> bytes:
+        import documents
+        import market_analytics
+
+        statuses = ("released",) * 16 + ("held", "held", "refunded", "disputed")
+        with tempfile.TemporaryDirectory() as tmp:
+            log = Path(tmp) / "transactions.csv"
+            with log.open("w", newline="", encoding="utf-8") as fh:
+                writer = csv.writer(fh)
+                writer.writerow(market_analytics.TRANSACTION_FIELDS)
+                writer.writerows(
+                    (
+                        f"T{i:06d}", f"2026-01-{1 + i % 31:02d}", f"AR-{i * 37 % 900:05d}",
+                        TRADER["market"] if i % 3 else "Ahia Ohuru (New Market)",
+                        ("Footwear", "Leather Goods", "Garments")[i // 3 % 3],
+                        str(2_000 + 7_919 * i % 398_000), "", statuses[i % 20], str(i * 13 % 96),
+                    )
+                    for i in range(rows)
+                )
+            buffer = io.BytesIO()
+            documents.generate_market_report(market_analytics.summarize(log, chunk_rows=1_000), buffer)
+            return buffer.getvalue()
+    return _run
+
+
+def _catalog(products: int, photos: int = 0) -> Callable[[], bytes]:
+    def _run() -> bytes:
+        import documents
+        from PIL import Image
+
+        markets = (TRADER["market"], "Ọ̀jà Ahia Ohuru")
+        categories = ("Footwear", "Leather Goods", "Garments")
+        with tempfile.TemporaryDirectory() as tmp:
+            for i in range(photos):
+                Image.new("RGB", (640, 480), (30 * i % 256, 90, 200 - 20 * i % 200)).save(Path(tmp) / f"{i}.jpg")
+            buffer = io.BytesIO()
+            # Seven-page chunks, so the catalog is merged from several.
+            documents.build_catalog(
+                (
+                    {
+                        "sku": f"SKU-{i:06d}", "product": f"Product {i}",
+                        "shop_name": f"Shop {i % 90}", "market": markets[i * 2 // products],
+                        "category": categories[i * 6 // products % 3], "price": str(1_500 + 7_919 * i % 250_000),
+                        "unit": ("pair", "piece")[i % 2],
+                        **({"image": f"{i % photos}.jpg" if i % 10 else ""} if photos else {}),
+                    }
+                    for i in range(products)
+                ),
+                buffer, chunk_pages=7, images=Path(tmp),
+            )
+        return buffer.getvalue()
+    return _run
+
+
+def _certificates(registry: Path, buffer: io.BytesIO) -> None:
+    import documents
+    import generate_pdfs
+
+    # Seven-page chunks, as for the catalog; issued on the goldens' creation date.
+    documents.generate_certificates(registry, buffer, chunk_pages=7, issued=generate_pdfs.REPRODUCIBLE_DATE.date())
+
+
+def _localized_bundle(lang: str) -> Callable[[], bytes]:
+    def _run() -> bytes:
+        import documents
+
+        buffer = io.BytesIO()
+        documents.generate_bundle([LOCALIZED_TRADER], output=buffer, lang=lang)
+        return buffer.getvalue()
+    return _run
+
+
+CASES: dict[str, Callable[[], bytes]] = {
+    "memo": _render("memo"),
+    "script": _render("script"),
+    "onepager": _render("onepager"),
+    "memo-md": _render("memo-md"),
+    "script-md": _render("script-md"),
+    "onepager-trader": _render("onepager", trader=TRADER),
+    "memo-stamped": _render("memo", recipient=RECIPIENT, stamp=True),
+    "memo-igbo": _render("memo", lang="igbo"),
+    "script-md-yoruba": _render("script-md", lang="yoruba"),
+    "onepager-hausa": _render("onepager", lang="hausa"),
+    "onepager-trader-yoruba": _render("onepager", trader=LOCALIZED_TRADER, lang="yoruba"),
+    # English, so in the core fonts: the diacritics are folded rather than fatal.
+    "onepager-trader-folded": _render("onepager", trader={**LOCALIZED_TRADER, "market": "Ọ̀jà Ahia Ohuru"}),
+    "annex-500": _with_registry(500, _annex),
+    "bundle": _with_registry(40, _bundle),
+    "bundle-pidgin": _localized_bundle("pidgin"),
+    "market-report-5k": _market_report(5_000),
+    "catalog-3k": _catalog(3_000),
+    "catalog-photos-300": _catalog(300, photos=6),
+    "certificates-40": _with_registry(40, _certificates),
+}
+
+
+def environment() -> dict[str, str]:
+    """Return the versions (and font hash) the rendered bytes depend on."""
+    import PIL
+    from fontTools import version as fonttools_version
+    from fpdf import __version__ as fpdf_version
+
+    import unicode_fonts
+
+    return {
+        "fpdf2": fpdf_version,
+        "fonttools": fonttools_version,
+        "pillow": PIL.__version__,
+        "zlib": zlib.ZLIB_RUNTIME_VERSION,
+        "unicode_font": hashlib.sha256(unicode_fonts.find_font("").read_bytes()).hexdigest()[:16],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare rendered PDFs against golden SHA-256 hashes.")
+    parser.add_argument("cases", nargs="*", metavar="CASE", help=f"cases to check (default: all of {len(CASES)})")
+    parser.add_argument("--update", action="store_true", help=f"record the current hashes in {GOLDENS_PATH.name}")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(CASES))
+        return 0
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(sorted(unknown))}")
+
+    sys.path.insert(0, str(HERE))
+    import generate_pdfs
+
+    # Pinned rather than reproducible_date(), so SOURCE_DATE_EPOCH cannot move the goldens.
+    generate_pdfs.CREATION_DATE = generate_pdfs.REPRODUCIBLE_DATE
+    try:
+        recorded = json.loads(GOLDENS_PATH.read_text())
+    except FileNotFoundError:
+        recorded = {"environment": {}, "cases": {}}
+    goldens: dict[str, str] = recorded["cases"]
+    env = environment()
+    drift = {key: (recorded["environment"].get(key), value) for key, value in env.items()}
+    drift = {key: pair for key, pair in drift.items() if pair[0] != pair[1]}
+    if recorded["environment"] and drift and not args.update:
+        print("warning: goldens were recorded with " + ", ".join(
+            f"{key} {old} (now {new})" for key, (old, new) in drift.items()
+        ) + "\n")
+
+    failures = unstable = 0
+    for name in args.cases or CASES:
+        start = time.perf_counter()
+        cold = hashlib.sha256(CASES[name]()).hexdigest()
+        warm = hashlib.sha256(CASES[name]()).hexdigest()
+        seconds = time.perf_counter() - start
+        if warm != cold:
+            status = "UNSTABLE"
+            unstable += 1
+        elif args.update:
+            status = "RECORDED" if goldens.get(name) != cold else "OK"
+            goldens[name] = cold
+        elif name not in goldens:
+            status = "NEW"
+        elif goldens[name] != cold:
+            status = "CHANGED"
+        else:
+            status = "OK"
+        failures += status in ("UNSTABLE", "NEW", "CHANGED")
+        print(f"  [{status}] {name:<24}{cold[:16]}  ({seconds:.2f}s)")
+
+    if args.update:
+        if unstable:
+            print(f"\n{unstable} case(s) render differently when repeated; goldens not written")
+            return 1
+        GOLDENS_PATH.write_text(json.dumps(
+            {"environment": env, "cases": dict(sorted(goldens.items()))}, indent=1,
+        ) + "\n")
+        print(f"\nGoldens written to {GOLDENS_PATH}")
+        return 0
+    if failures:
+        print(f"\n{failures} case(s) differ from {GOLDENS_PATH.name}; "
+              "if the change is intended, re-record with --update")
+        return 1
+    print("\nAll outputs match their goldens.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
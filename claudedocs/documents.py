@@ -0,0 +1,2167 @@
+"""Document drawing code for the Aba Digital Marketplace PDFs.
+
+Everything that needs fpdf2 lives here: the page styles, the memo, script
+and one-pager generators, the Markdown renderers, the registry annex, the
+product catalog, the trader certificates, the market report and the
+bundle. ``generate_pdfs`` imports this module only when a document is
+actually rendered, so listing targets, planning a build or a fully cached
+run start without loading fpdf2 and fontTools.
+"""
+
+import functools
+import gc
+import io
+import os
+import unicodedata
+from datetime import date
+from itertools import chain, groupby, islice
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable
+
+from fpdf import FPDF
+from fpdf import __version__ as FPDF_VERSION
+from fpdf.errors import FPDFException
+
+import assets
+import charts
+import layout_cache
+import markdown_ir
+import pdf_optimize
+import qr_code
+import thumbnails
+import unicode_fonts
+from generate_pdfs import (
+    ANNEX_PATH,
+    BUNDLE_PATH,
+    CATALOG_PATH,
+    CERTIFICATES_PATH,
+    DEFAULT_FILENAMES,
+    LANGUAGES,
+    OUTPUT_DIR,
+    REPORT_PATH,
+    PdfOutput,
+    iter_registry,
+    pdf_bytes,
+    pdf_merger,
+    seller_url,
+    write_pdf,
+)
+from market_analytics import ESCROW_STATUSES, GroupTotals, MarketSummary
+from markdown_ir import Block, load_document
+from pdf_merge import OutlineEntry
+from table_engine import Column, StreamingTable
+from unicode_fonts import UnicodePDF
+
+# Memoize multi_cell line breaks across every document rendered in this process.
+LAYOUT_CACHE = layout_cache.install()
+
+# Color constants
+NAVY = (0, 40, 104)       # #002868
+GOLD = (201, 162, 39)     # #C9A227
+BLACK = (0, 0, 0)
+DARK_GRAY = (50, 50, 50)
+MEDIUM_GRAY = (100, 100, 100)
+LIGHT_GRAY = (200, 200, 200)
+WHITE = (255, 255, 255)
+RULE_GRAY = (180, 180, 180)
+
+
+def new_document(lang: str | None = None) -> FPDF:
+    """Return an empty A4 document; with ``lang`` its text uses embedded Unicode fonts."""
+    if lang is None:
+        return FPDF(orientation="P", unit="mm", format="A4")
+    if lang not in LANGUAGES:
+        raise ValueError(f"unknown language {lang!r}; expected one of {', '.join(LANGUAGES)}")
+    return UnicodePDF(orientation="P", unit="mm", format="A4")
+
+
+class BundlePDF(FPDF):
+    """A document that several generators draw into, one after another.
+
+    Each part is bookmarked at its first page and the section headings
+    inside it become nested bookmarks (see ``bookmark``).
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.section_level = 1
+        self._pending: list[tuple[str, int]] = []
+
+    def begin_part(self, title: str, level: int = 0) -> None:
+        """Bookmark ``title`` on the next page added; later sections nest below it."""
+        self._pending.append((title, level))
+        self.section_level = level + 1
+
+    def add_page(self, *args: Any, **kwargs: Any) -> None:
+        super().add_page(*args, **kwargs)
+        for title, level in self._pending:
+            self.start_section(title, level)
+        self._pending.clear()
+
+
+def bookmark(pdf: FPDF, title: str) -> None:
+    """Add a section bookmark at the current position; only bundles have an outline."""
+    if isinstance(pdf, BundlePDF):
+        pdf.start_section(title, pdf.section_level)
+
+
+# ---------------------------------------------------------------------------
+# Shared helper styles
+# ---------------------------------------------------------------------------
+
+class MemoStyle:
+    """Text styles of the governor memo: 25 mm margins, 9.5 pt body."""
+
+    left = 25
+    right = 185
+    usable_w = 210 - 50  # page width minus left+right margins
+    body_size = 9.5
+    line_h = 4.2
+
+    def __init__(self, pdf: FPDF) -> None:
+        self.pdf = pdf
+
+    def title(self, text: str) -> None:
+        """Centered 20 pt document title at the top of the page."""
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "B", 20)
+        pdf.set_text_color(*BLACK)
+        pdf.set_xy(self.left, 18)
+        pdf.cell(self.usable_w, 10, text, align="C", new_x="LMARGIN", new_y="NEXT")
+
+    def rule(self, gap_before: float, gap_after: float) -> None:
+        """Full-width gray horizontal rule."""
+        pdf = self.pdf
+        y_rule = pdf.get_y() + gap_before
+        pdf.set_draw_color(*RULE_GRAY)
+        pdf.set_line_width(0.5)
+        pdf.line(self.left, y_rule, self.right, y_rule)
+        pdf.set_y(y_rule + gap_after)
+
+    def field(self, label: str, value: str) -> None:
+        """TO: / FROM: / DATE: / RE: header field."""
+        pdf = self.pdf
+        pdf.set_x(self.left)
+        pdf.set_font("Helvetica", "B", 10)
+        pdf.cell(18, 5, label, new_x="END")
+        pdf.set_font("Helvetica", "", 10)
+        pdf.multi_cell(self.usable_w - 18, 5, value, new_x="LMARGIN", new_y="NEXT")
+
+    def line(self, text: str, bold: bool = False) -> None:
+        """Single unwrapped line, e.g. the salutation or signature."""
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "B" if bold else "", self.body_size)
+        pdf.set_text_color(*(BLACK if bold else DARK_GRAY))
+        pdf.set_x(self.left)
+        pdf.cell(self.usable_w, self.line_h, text, new_x="LMARGIN", new_y="NEXT")
+
+    def body(self, text: str) -> None:
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "", self.body_size)
+        pdf.set_text_color(*DARK_GRAY)
+        pdf.set_x(self.left)
+        pdf.multi_cell(self.usable_w, self.line_h, text, new_x="LMARGIN", new_y="NEXT")
+        pdf.set_y(pdf.get_y() + 2)
+
+    def section_header(self, text: str) -> None:
+        pdf = self.pdf
+        bookmark(pdf, text.rstrip("."))
+        pdf.set_font("Helvetica", "B", self.body_size)
+        pdf.set_text_color(*BLACK)
+        pdf.set_x(self.left)
+        # Print header inline then continue with body
+        pdf.cell(pdf.get_string_width(text) + 1, self.line_h, text, new_x="END")
+
+    def section_body_inline(self, text: str) -> None:
+        """Continue on the same line after a bold header."""
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "", self.body_size)
+        pdf.set_text_color(*DARK_GRAY)
+        remaining_w = self.right - pdf.get_x()
+        # Use multi_cell for wrapping from current position
+        pdf.multi_cell(remaining_w, self.line_h, text, new_x="LMARGIN", new_y="NEXT")
+        pdf.set_y(pdf.get_y() + 1.5)
+
+    def body_full(self, text: str, markdown: bool = False) -> None:
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "", self.body_size)
+        pdf.set_text_color(*DARK_GRAY)
+        pdf.set_x(self.left)
+        pdf.multi_cell(
+            self.usable_w, self.line_h, text,
+            new_x="LMARGIN", new_y="NEXT", markdown=markdown,
+        )
+        pdf.set_y(pdf.get_y() + 1.5)
+
+    def bullet(self, text: str, markdown: bool = False) -> None:
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "", self.body_size)
+        pdf.set_text_color(*DARK_GRAY)
+        pdf.set_x(self.left + 5)
+        pdf.cell(5, self.line_h, "-", new_x="END")
+        pdf.multi_cell(
+            self.usable_w - 10, self.line_h, text,
+            new_x="LMARGIN", new_y="NEXT", markdown=markdown,
+        )
+
+
+class ScriptStyle:
+    """Text styles of the video script: 20 mm margins, navy section headers."""
+
+    left = 20
+    usable_w = 210 - 40
+
+    def __init__(self, pdf: FPDF) -> None:
+        self.pdf = pdf
+
+    def title(self, title: str, subtitle: str, info: str) -> None:
+        """Title block: navy title, gray subtitle, italic info line and a rule."""
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "B", 22)
+        pdf.set_text_color(*NAVY)
+        pdf.cell(self.usable_w, 12, title, align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_y(pdf.get_y() + 2)
+
+        pdf.set_font("Helvetica", "", 12)
+        pdf.set_text_color(*MEDIUM_GRAY)
+        pdf.cell(self.usable_w, 7, subtitle, align="C", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_y(pdf.get_y() + 1)
+
+        pdf.set_font("Helvetica", "I", 9)
+        pdf.set_text_color(*MEDIUM_GRAY)
+        pdf.multi_cell(self.usable_w, 5, info, align="C", new_x="LMARGIN", new_y="NEXT")
+
+        # Rule
+        pdf.set_y(pdf.get_y() + 4)
+        pdf.set_draw_color(*NAVY)
+        pdf.set_line_width(0.8)
+        pdf.line(20, pdf.get_y(), 190, pdf.get_y())
+        pdf.set_y(pdf.get_y() + 6)
+
+    def section_header(self, number: int, title: str, timestamp: str) -> None:
+        """Print section header like SECTION 1: OPENING [0:00 - 0:30]"""
+        pdf = self.pdf
+        # Check if we need a new page (need at least 40mm for header + some content)
+        if pdf.get_y() > 250:
+            pdf.add_page()
+        bookmark(pdf, f"{number}. {title.capitalize()}")
+        pdf.set_font("Helvetica", "B", 13)
+        pdf.set_text_color(*NAVY)
+        pdf.set_x(self.left)
+        text = f"SECTION {number}: {title}  [{timestamp}]"
+        pdf.cell(self.usable_w, 8, text, new_x="LMARGIN", new_y="NEXT")
+        pdf.set_y(pdf.get_y() + 1)
+        # Thin rule under section header
+        pdf.set_draw_color(*GOLD)
+        pdf.set_line_width(0.4)
+        pdf.line(20, pdf.get_y(), 100, pdf.get_y())
+        pdf.set_y(pdf.get_y() + 4)
+
+    def screen_direction(self, text: str) -> None:
+        """Print screen direction in italic gray."""
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "I", 9)
+        pdf.set_text_color(*MEDIUM_GRAY)
+        pdf.set_x(self.left + 5)
+        pdf.multi_cell(self.usable_w - 10, 4.5, text, new_x="LMARGIN", new_y="NEXT")
+        pdf.set_y(pdf.get_y() + 2)
+
+    def narration(self, text: str, markdown: bool = False) -> None:
+        """Print spoken narration in normal black text, optionally with **bold**."""
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "", 10)
+        pdf.set_text_color(*DARK_GRAY)
+        pdf.set_x(self.left)
+        pdf.multi_cell(
+            self.usable_w, 5, text, new_x="LMARGIN", new_y="NEXT", markdown=markdown,
+        )
+        pdf.set_y(pdf.get_y() + 2)
+
+    def narration_bold_phrase(self, parts: list[tuple[str, bool]]) -> None:
+        """Print narration with mixed bold/normal segments using multi_cell with markdown."""
+        # Build markdown string for fpdf2
+        md_text = ""
+        for text, bold in parts:
+            if bold:
+                md_text += f"**{text}**"
+            else:
+                md_text += text
+        self.narration(md_text, markdown=True)
+
+    def spacer(self, h: float = 3) -> None:
+        self.pdf.set_y(self.pdf.get_y() + h)
+
+    def notes_header(self, text: str) -> None:
+        """Navy rule and 14 pt heading that open the production notes."""
+        pdf = self.pdf
+        # Force new page if less than 60mm remaining
+        if pdf.get_y() > 220:
+            pdf.add_page()
+        bookmark(pdf, text.capitalize())
+
+        self.spacer(5)
+        pdf.set_draw_color(*NAVY)
+        pdf.set_line_width(0.8)
+        pdf.line(20, pdf.get_y(), 190, pdf.get_y())
+        pdf.set_y(pdf.get_y() + 5)
+
+        pdf.set_font("Helvetica", "B", 14)
+        pdf.set_text_color(*NAVY)
+        pdf.set_x(self.left)
+        pdf.cell(self.usable_w, 8, text, new_x="LMARGIN", new_y="NEXT")
+        self.spacer(3)
+
+    def notes_line(self, text: str) -> None:
+        """Bold standalone line in the production notes."""
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "B", 10)
+        pdf.set_text_color(*BLACK)
+        pdf.set_x(self.left)
+        pdf.cell(self.usable_w, 6, text, new_x="LMARGIN", new_y="NEXT")
+        self.spacer(3)
+
+    def production_heading(self, text: str) -> None:
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "B", 10)
+        pdf.set_text_color(*BLACK)
+        pdf.set_x(self.left)
+        pdf.cell(self.usable_w, 6, text, new_x="LMARGIN", new_y="NEXT")
+        pdf.set_y(pdf.get_y() + 1)
+
+    def production_bullet(self, text: str) -> None:
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "", 9)
+        pdf.set_text_color(*DARK_GRAY)
+        pdf.set_x(self.left + 5)
+        pdf.cell(5, 4.5, "-", new_x="END")
+        pdf.multi_cell(self.usable_w - 10, 4.5, text, new_x="LMARGIN", new_y="NEXT")
+
+
+class OnePagerStyle:
+    """Text styles of the benefits one-pager: 15 mm margins, compact 8 pt bullets.
+
+    With ``measure`` nothing is drawn: each helper only adds the height it
+    would take to ``height``, so a layout can be sized before it is rendered.
+    """
+
+    margin_l = 15
+    usable_w = 210 - 30
+    section_title_size = 10.5
+    # Title cell, underline offset and gap below the underline.
+    section_title_h = 5.5 + 0.5 + 2
+
+    def __init__(
+        self, pdf: FPDF, body_size: float = 8, bullet_line_h: float = 3.6, section_gap: float = 3.5,
+        measure: bool = False,
+    ) -> None:
+        self.pdf = pdf
+        self.body_size = body_size
+        self.bullet_line_h = bullet_line_h
+        self.section_gap = section_gap
+        self.measure = measure
+        self.height = 0.0
+
+    def section_title(self, icon: str, title: str) -> None:
+        if self.measure:
+            self.height += self.section_title_h
+            return
+        pdf = self.pdf
+        bookmark(pdf, title.capitalize())
+        pdf.set_font("Helvetica", "B", self.section_title_size)
+        pdf.set_text_color(*NAVY)
+        pdf.set_x(self.margin_l)
+        pdf.cell(self.usable_w, 5.5, f"{icon}  {title}", new_x="LMARGIN", new_y="NEXT")
+        # Thin navy underline
+        y_ul = pdf.get_y() + 0.5
+        pdf.set_draw_color(*NAVY)
+        pdf.set_line_width(0.3)
+        pdf.line(self.margin_l, y_ul, self.margin_l + 90, y_ul)
+        pdf.set_y(y_ul + 2)
+
+    def bullet(self, text: str, markdown: bool = False) -> None:
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "", self.body_size)
+        if self.measure:
+            self.height += pdf.multi_cell(
+                self.usable_w - 7, self.bullet_line_h, text,
+                markdown=markdown, dry_run=True, output="HEIGHT",
+            )
+            return
+        pdf.set_text_color(*DARK_GRAY)
+        pdf.set_x(self.margin_l + 3)
+        pdf.cell(4, self.bullet_line_h, "-", new_x="END")
+        pdf.multi_cell(
+            self.usable_w - 7, self.bullet_line_h, text,
+            new_x="LMARGIN", new_y="NEXT", markdown=markdown,
+        )
+
+    def bullet_bold_value(self, text: str) -> None:
+        """Bullet with markdown bold support."""
+        self.bullet(text, markdown=True)
+
+    def section_spacer(self) -> None:
+        if self.measure:
+            self.height += self.section_gap
+            return
+        self.pdf.set_y(self.pdf.get_y() + self.section_gap)
+
+
+# ---------------------------------------------------------------------------
+# PDF 1: Governor Memo
+# ---------------------------------------------------------------------------
+
+MEMO_FIELDS = {
+    "to": "His Excellency Dr. Alex Chioma Otti, OFR, Executive Governor of Abia State",
+    "from": "Stringz Technologies LLC",
+    "date": "February 2026",
+    "re": "Proposal for a 90-Day Pilot -- Aba Digital Marketplace (madeinaba.net)",
+}
+
+# Rendered memo body content streams, keyed by the y position the body starts
+# at (which depends only on how many lines the header fields wrap to).
+_MEMO_BODY_CACHE: dict[float, tuple[bytes, dict[str, int]]] = {}
+
+
+def generate_governor_memo(
+    recipient: dict[str, str] | None = None,
+    output: PdfOutput | None = None,
+    stamp: bool = False,
+    lang: str | None = None,
+) -> PdfOutput:
+    """Generate a clean, formal 1-page memorandum PDF.
+
+    ``recipient`` overrides any of the ``MEMO_FIELDS`` header values. With
+    ``stamp`` the invariant body is laid out once per process and reused for
+    every later memo whose header fields end at the same height. With
+    ``lang`` the memo is set in Unicode fonts, for recipients whose names
+    carry Igbo, Yoruba or Hausa diacritics; without it they are folded.
+    A memo merge row (see ``memo_merge_jobs``) also needs an ``id``.
+    """
+    if recipient is not None and "id" in recipient and not recipient["id"]:
+        raise ValueError(f"recipient row needs an id: {recipient!r}")
+    pdf = new_document(lang)
+    draw_governor_memo(pdf, recipient, stamp)
+    return write_pdf(pdf, output or OUTPUT_DIR / DEFAULT_FILENAMES["memo"])
+
+
+def draw_governor_memo(pdf: FPDF, recipient: dict[str, str] | None = None, stamp: bool = False) -> None:
+    """Add the memo page to ``pdf`` (see ``generate_governor_memo``)."""
+    pdf.set_auto_page_break(auto=False)
+    pdf.add_page()
+    pdf.set_margins(25, 20, 25)
+    style = MemoStyle(pdf)
+    text = str if isinstance(pdf, UnicodePDF) else _core_font_text
+    fields = {**MEMO_FIELDS, **{k: text(v) for k, v in (recipient or {}).items() if k in MEMO_FIELDS}}
+
+    # --- MEMORANDUM header ---
+    style.title("MEMORANDUM")
+    style.rule(2, 4)
+
+    # --- TO / FROM / DATE / RE fields ---
+    _field = style.field
+
+    _field("TO:", fields["to"])
+    pdf.set_y(pdf.get_y() + 1)
+    _field("FROM:", fields["from"])
+    pdf.set_y(pdf.get_y() + 1)
+    _field("DATE:", fields["date"])
+    pdf.set_y(pdf.get_y() + 1)
+    _field("RE:", fields["re"])
+
+    # Stamped bodies are only reusable with core fonts: text in an embedded
+    # font is encoded against each document's own glyph subset.
+    if stamp and not isinstance(pdf, UnicodePDF):
+        _stamp_memo_body(pdf, style)
+    else:
+        _memo_body(pdf, style)
+
+
+def _stamp_memo_body(pdf: FPDF, style: MemoStyle) -> None:
+    """Append the cached memo body for the current height, rendering it on a miss.
+
+    The body is positioned absolutely and the header fields always leave the
+    same font and color state behind, so the body's content stream is identical
+    for every recipient whose fields wrap to the same number of lines.
+    """
+    contents = pdf.pages[pdf.page].contents
+    key = round(pdf.get_y(), 4)
+    fonts = {fontkey: font.i for fontkey, font in pdf.fonts.items()}
+    cached = _MEMO_BODY_CACHE.get(key)
+    if cached is not None and cached[1] == fonts:
+        contents.extend(cached[0])
+        return
+
+    start = len(contents)
+    _memo_body(pdf, style)
+    # Only reuse bodies that registered no fonts of their own, since a stamped
+    # memo would otherwise reference fonts missing from its resources.
+    if {fontkey: font.i for fontkey, font in pdf.fonts.items()} == fonts:
+        _MEMO_BODY_CACHE[key] = (bytes(contents[start:]), fonts)
+
+
+def _memo_body(pdf: FPDF, style: MemoStyle) -> None:
+    """Lay out everything below the header fields, which is the same for every recipient."""
+    # Second rule
+    style.rule(3, 5)
+
+    # --- Body helpers ---
+    _section_header = style.section_header
+    _section_body_inline = style.section_body_inline
+    _body_full = style.body_full
+    _bullet = style.bullet
+
+    # Salutation
+    style.line("Your Excellency,")
+    pdf.set_y(pdf.get_y() + 2)
+
+    _body_full(
+        "We write to present a ready-to-deploy digital marketplace platform purpose-built "
+        "for Aba's trading economy. A five-minute video walkthrough accompanies this memo. "
+        "We respectfully request your consideration of a structured pilot that would make "
+        "Abia the first Nigerian state to operate a government-backed digital marketplace at scale."
+    )
+
+    # The Opportunity
+    _section_header("The Opportunity.")
+    _section_body_inline(
+        " Aba's markets generate an estimated 144 billion naira in annual trade volume, yet "
+        "virtually none of this commerce is visible online. Across Ariaria International Market "
+        "alone, over 70,000 shops and 160,000 artisans operate without a digital registry, without "
+        "e-commerce infrastructure, and almost entirely on cash. Buyers who would purchase Aba-made "
+        "goods -- across Nigeria and the diaspora -- simply cannot find them. This is a solvable problem."
+    )
+
+    # What We Have Built
+    _section_header("What We Have Built.")
+    _section_body_inline(
+        " At our own cost, Stringz Technologies has designed and developed a working prototype of "
+        "the Aba Digital Marketplace, accessible at madeinaba.net. The platform enables trader "
+        "onboarding, product listing, buyer discovery, and a real-time government analytics dashboard. "
+        "Critically, it is built for Aba's traders as they are today: the system operates via WhatsApp, "
+        "USSD, and web, so traders do not need smartphones or technical literacy to participate. The "
+        "enclosed video walkthrough demonstrates the full platform in under five minutes."
+    )
+
+    # The Ask
+    _section_header("The Ask.")
+    _section_body_inline(
+        " We propose a 90-day pilot scoped to a single market zone -- the A-Line section of Ariaria "
+        "-- with milestone-based funding of 100 million naira, disbursed against verified deliverables:"
+    )
+
+    _bullet("Day 30: 500 verified traders onboarded, 2,000+ products live on the platform")
+    _bullet(
+        "Day 90: 2,000 verified traders, 10,000+ products, and a live government dashboard "
+        "reporting trade activity, trader data, and market analytics"
+    )
+    pdf.set_y(pdf.get_y() + 1)
+
+    _body_full(
+        "Payments would be tied to the achievement of each milestone. If deliverables are not met, "
+        "remaining funds are not disbursed."
+    )
+
+    # Why Now
+    _section_header("Why Now.")
+    _section_body_inline(
+        " Three conditions make this the right moment. First, the Phase II reconstruction of the "
+        "A-Line market creates a natural integration point -- digital infrastructure alongside "
+        "physical rebuilding. Second, the Government of Abia Digital Agency (GADA) already exists "
+        "as the institutional home for this initiative. Third, no other Nigerian state has moved on "
+        "this; Abia has the opportunity to lead. Conservative revenue projections place the platform's "
+        "potential at 107 to 178 million naira annually within the first two years through listing "
+        "fees, promotion tools, and transaction services."
+    )
+
+    # Request
+    _section_header("Request.")
+    _section_body_inline(
+        " We respectfully request an audience with Your Excellency or your designated representative "
+        "to present the platform in detail and discuss pilot terms. We are prepared to begin within "
+        "30 days of approval."
+    )
+
+    _body_full(
+        "We thank Your Excellency for your time and your continued commitment to the economic "
+        "transformation of Abia State."
+    )
+
+    # Closing
+    pdf.set_y(pdf.get_y() + 3)
+    style.line("Respectfully submitted,")
+    pdf.set_y(pdf.get_y() + 4)
+    style.line("Stringz Technologies LLC", bold=True)
+
+
+# ---------------------------------------------------------------------------
+# PDF 2: Video Script
+# ---------------------------------------------------------------------------
+
+def generate_video_script(output: PdfOutput | None = None, lang: str | None = None) -> PdfOutput:
+    """Generate a presenter-friendly video walkthrough script PDF (in Unicode fonts with ``lang``)."""
+    pdf = new_document(lang)
+    draw_video_script(pdf)
+    return write_pdf(pdf, output or OUTPUT_DIR / DEFAULT_FILENAMES["script"])
+
+
+def draw_video_script(pdf: FPDF) -> None:
+    """Add the video script's pages to ``pdf``."""
+    pdf.set_auto_page_break(auto=True, margin=20)
+    pdf.set_margins(20, 20, 20)
+
+    pdf.add_page()
+    style = ScriptStyle(pdf)
+
+    # --- Title page header ---
+    style.title(
+        "VIDEO WALKTHROUGH SCRIPT",
+        "Aba Digital Marketplace -- Presentation to HE Governor Alex Otti",
+        "Site: madeinaba.net  |  Access Code: StringzAbia2026  |  Target Runtime: 4-5 minutes",
+    )
+
+    # --- Helper functions ---
+    _section_header = style.section_header
+    _screen_direction = style.screen_direction
+    _narration = style.narration
+    _narration_bold_phrase = style.narration_bold_phrase
+    _spacer = style.spacer
+
+    # ===== SECTION 1: OPENING =====
+    _section_header(1, "OPENING", "0:00 - 0:30")
+    _screen_direction("FACE TO CAMERA -- Clean background. Professional but warm. Look directly at the lens.")
+    _narration("Good day, Your Excellency.")
+    _narration("My name is [PRESENTER NAME], and I lead the team at Stringz Technologies.")
+    _narration_bold_phrase([
+        ("I want to take ", False), ("four minutes", True),
+        (" of your time to show you something we built -- specifically for Abia State.", False),
+    ])
+    _narration_bold_phrase([
+        ("We spent months studying Aba's markets, talking to traders, reading the data. "
+         "And we believe there is an opportunity here that ", False),
+        ("no other state in Nigeria has captured yet", True), (".", False),
+    ])
+    _narration("What I am about to show you is live, right now, at madeinaba.net.")
+    _narration("Let me walk you through it.")
+
+    # ===== SECTION 2: THE PROBLEM AND THE RESEARCH =====
+    _section_header(2, "THE PROBLEM AND THE RESEARCH", "0:30 - 1:30")
+    _screen_direction(
+        "Switch to screen share. Browser is open to madeinaba.net. Enter the access code: "
+        "StringzAbia2026. The Overview screen loads."
+    )
+    _screen_direction(
+        "The Research Foundation screen is now visible. Scroll slowly past the Governor's "
+        "photo and vision statement at the top."
+    )
+    _narration_bold_phrase([
+        ("Your Excellency, this entire proposal is built on evidence. Not assumptions -- ", False),
+        ("research", True), (".", False),
+    ])
+    _screen_direction(
+        "Pause on the KEY RESEARCH FINDINGS stat cards -- 37,000 shops, N144B trade volume, "
+        "110,000+ shoemakers, 50,000+ garment makers."
+    )
+    _narration_bold_phrase([
+        ("Look at these numbers. Ariaria alone has ", False),
+        ("37,000 shops", True),
+        (". Aba's annual trade is estimated at ", False),
+        ("one hundred and forty-four billion naira", True),
+        (". There are over ", False),
+        ("110,000 shoemakers", True),
+        (" and 50,000 garment makers. This is a manufacturing city.", False),
+    ])
+    _narration("But here is the problem.")
+    _screen_direction("Scroll down to THE POWER CRISIS section with the red-bordered stats.")
+    _narration_bold_phrase([
+        ("32,000 of those shops had no power after the failed 2019 solar project. Traders spend ", False),
+        ("one billion naira a year", True),
+        (" just on generators. And despite all of this activity, Abia ranked ", False),
+        ("35th out of 37 states", True), (" in economic growth.", False),
+    ])
+    _narration("The talent is there. The products are there. The infrastructure is not.")
+    _screen_direction("Scroll down to WHAT ABA TRADERS ARE SAYING -- the trader quotes section.")
+    _narration_bold_phrase([
+        ("And these are not our words. These are ", False),
+        ("real traders, real quotes", True),
+        (", gathered from investigative journalism.", False),
+    ])
+    _screen_direction("Pause briefly on Joseph Nmeri's quote about labeling shoes \"Made in China.\"")
+    _narration_bold_phrase([
+        ("This man, Joseph Nmeri -- Chairman of the Power Line Shoe Manufacturers -- said his "
+         "members were ", False),
+        ("forced to label their shoes \"Made in China\"", True),
+        (" because customers would not buy shoes labeled \"Made in Aba.\"", False),
+    ])
+    _narration_bold_phrase([
+        ("That is the problem we are solving. ", False),
+        ("Visibility. Trust. Access.", True),
+    ])
+
+    # ===== SECTION 3: THE SOLUTION =====
+    _section_header(3, "THE SOLUTION", "1:30 - 2:30")
+    _screen_direction("Click the \"Why Aba\" tab in the navigation.")
+    _screen_direction(
+        "Scroll past the hero section to \"THE PROBLEM: INVISIBLE ECONOMY\" -- the two-column comparison."
+    )
+    _narration_bold_phrase([
+        ("Your Excellency, this is what we call the ", False),
+        ("invisible economy", True),
+        (". On the left -- today's reality. No trader registry. Cash only. No audit trail. "
+         "Revenue leakage everywhere. Buyers have to ", False),
+        ("physically travel to Aba", True),
+        (" to buy anything.", False),
+    ])
+    _narration_bold_phrase([
+        ("On the right -- what a digital layer creates. NIN-verified traders. Escrow payments. "
+         "A real-time dashboard. Online catalog. ", False),
+        ("For the first time, the government can actually see what is happening in its own markets.", True),
+    ])
+    _screen_direction("Scroll to the thesis statement card -- the one highlighted in blue.")
+    _narration("This is the core idea. Read it with me:")
+    _narration_bold_phrase([
+        ("\"A digital layer turns informal trade into visible economic infrastructure -- "
+         "measurable, taxable, and investable.\"", True),
+    ])
+    _narration("That is what this platform does.")
+    _screen_direction(
+        "Scroll down to \"WHY NOT JUST USE JUMIA OR INSTAGRAM?\" -- the four-column comparison."
+    )
+    _narration("Now, someone will ask -- why not just use Jumia? Why not Instagram?")
+    _narration_bold_phrase([
+        ("Here is the difference. Jumia takes ", False),
+        ("15 to 25 percent commission", True),
+        (". Instagram has no escrow, no verification, no data. Neither of them gives "
+         "government anything.", False),
+    ])
+    _narration_bold_phrase([
+        ("This platform is ", False),
+        ("state-owned", True),
+        (". Low fees. NIN verification. The government owns the data, owns the trader registry, "
+         "owns the infrastructure. It is not a website. ", False),
+        ("It is an economic asset.", True),
+    ])
+    _screen_direction("Scroll to the \"WHY NOW\" section showing the three timing cards.")
+    _narration_bold_phrase([
+        ("And the timing is right. ", False),
+        ("Phase II of the A-Line rebuild just flagged off.", True),
+        (" New physical infrastructure is going up -- this is the digital layer that sits on top "
+         "of it. GADA already has the mandate. And no other state has done this. ", False),
+        ("The window is open.", True),
+    ])
+
+    # ===== SECTION 4: WHAT IS ACHIEVABLE =====
+    _section_header(4, "WHAT IS ACHIEVABLE", "2:30 - 3:15")
+    _screen_direction("Click the \"Quick Wins\" tab in the navigation.")
+    _screen_direction("Pause on the 30-DAY section.")
+    _narration_bold_phrase([
+        ("Here is what we can deliver in ", False),
+        ("30 days", True),
+        (". 500 NIN-verified sellers. Over 2,000 product listings. All from the A-Line "
+         "pilot zone -- aligned with the rebuild.", False),
+    ])
+    _narration("And here is the headline that is ready for the press on Day 30:")
+    _screen_direction("Point to or highlight the green ANNOUNCEMENT READY box.")
+    _narration_bold_phrase([
+        ("\"Abia launches Nigeria's first verified trader marketplace -- 500 Aba artisans "
+         "now discoverable online.\"", True),
+    ])
+    _narration_bold_phrase([
+        ("That is an announcement ", False),
+        ("no other governor in Nigeria can make today", True),
+        (".", False),
+    ])
+    _screen_direction("Scroll down to the 90-DAY section.")
+    _narration_bold_phrase([
+        ("By Day 90 -- ", False),
+        ("2,000 verified sellers", True),
+        (". Over 10,000 product listings. Three logistics partners onboarded. And a ", False),
+        ("live government dashboard", True),
+        (" showing real-time data on traders, products, orders, and revenue.", False),
+    ])
+    _screen_direction("Scroll to \"WHAT GOVERNMENT RECEIVES AT 90 DAYS\" -- the deliverables list.")
+    _narration_bold_phrase([
+        ("At the end of 90 days, the government receives a permanent NIN-verified trader "
+         "registry, a live analytics dashboard, monthly economic reports, and a catalogued "
+         "product database. These are ", False),
+        ("state assets", True),
+        (". They do not disappear when the project ends.", False),
+    ])
+
+    # ===== SECTION 5: THE ASK =====
+    _section_header(5, "THE ASK", "3:15 - 3:45")
+    _screen_direction("Click the \"Pilot Ask\" tab in the navigation.")
+    _screen_direction("The bold N100M pilot parameters section is visible.")
+    _narration("Your Excellency, the ask is straightforward.")
+    _narration_bold_phrase([
+        ("One hundred million naira. 90 days. One market zone -- Ariaria A-Line.", True),
+    ])
+    _screen_direction("Scroll to the budget breakdown.")
+    _narration(
+        "Every naira is accounted for. Platform development and infrastructure -- 38 million. "
+        "Trader onboarding and field operations -- 22 million. Training, support and operations "
+        "-- 15 million. Marketing and activation -- 15 million. Contingency -- 10 million."
+    )
+    _screen_direction("Scroll to the milestone-based payment note.")
+    _narration_bold_phrase([
+        ("And this is ", False),
+        ("milestone-based", True),
+        (". Government pays in three tranches. 40 percent at kickoff. 30 percent at Day 30 "
+         "-- only after verified deliverables. 30 percent at Day 90. ", False),
+        ("No delivery, no payment.", True),
+    ])
+    _screen_direction(
+        "Scroll quickly past the success criteria -- 500+ traders, 2000+ products, "
+        "500+ transactions, N5M+ volume, live dashboard."
+    )
+    _narration(
+        "These are the success criteria. Clear numbers. Either we hit them, or we did not. "
+        "There is no ambiguity."
+    )
+
+    # ===== SECTION 6: THE LIVE DEMO =====
+    _section_header(6, "THE LIVE DEMO", "3:45 - 4:15")
+    _screen_direction("Click the \"Home\" tab in the navigation.")
+    _narration("Now, let me show you what this actually looks like.")
+    _screen_direction(
+        "The Home screen loads with the hero section, AI search bar, categories, and featured products."
+    )
+    _narration(
+        "This is the marketplace. Government-branded. NIN-verified sellers. Every product "
+        "shows a \"Made in Aba\" badge. Buyers can shop by category -- footwear, bags, fashion, "
+        "leather goods."
+    )
+    _screen_direction("Click the \"Products\" tab to go to the Listings screen.")
+    _narration_bold_phrase([
+        ("Here are live product listings. Real Aba products with prices, ratings, verified "
+         "seller badges. A buyer in Lagos can find and order from an Aba trader ", False),
+        ("without ever visiting Ariaria", True),
+        (".", False),
+    ])
+    _screen_direction("Click back to \"Home\" and scroll to the AI Shopping Assistant search box.")
+    _narration("And here is what makes this different from anything else in Nigeria.")
+    _screen_direction(
+        "Click the \"Igbo\" language button in the AI search. Type or show a sample query "
+        "like \"Achoro m akpukpo ukwu maka agbamakwukwo\" and press search."
+    )
+    _narration_bold_phrase([
+        ("This is an ", False),
+        ("AI shopping assistant that speaks Igbo", True),
+        (". And Yoruba. And Hausa. And Pidgin. A buyer can type \"I wan buy wedding shoe "
+         "size 43\" in Pidgin, and the AI understands, finds matching products, and suggests "
+         "options.", False),
+    ])
+    _screen_direction("Click the \"AI Platform\" tab to briefly show the WhatsApp AI demo.")
+    _narration_bold_phrase([
+        ("It works through WhatsApp too. Traders can send a product photo and the AI creates "
+         "the listing automatically. Buyers can track orders. Government officials can ", False),
+        ("ask the dashboard questions in plain English", True),
+        (" and get answers.", False),
+    ])
+    _narration_bold_phrase([("This already works.", True)])
+
+    # ===== SECTION 7: CLOSING =====
+    _section_header(7, "CLOSING", "4:15 - 4:45")
+    _screen_direction("FACE TO CAMERA -- Same setup as the opening. Calm, direct, respectful.")
+    _narration("Your Excellency, let me close with this.")
+    _narration_bold_phrase([
+        ("Abia State has the traders. It has the products. It has a governor who is already ", False),
+        ("rebuilding the physical markets", True),
+        (" through the A-Line project and the GADA mandate.", False),
+    ])
+    _narration_bold_phrase([
+        ("What is missing is the digital layer. The part that makes Aba's economy ", False),
+        ("visible to the world", True),
+        (".", False),
+    ])
+    _narration_bold_phrase([
+        ("No Nigerian state has built this.", True),
+        (" Not Lagos. Not Kano. Not Ogun. Abia can be the first. And it can be done in 90 days.", False),
+    ])
+    _narration_bold_phrase([
+        ("We are not asking you to take our word for it. We are asking for ", False),
+        ("a meeting", True),
+        (" -- 30 minutes with your team -- to walk through this in detail and answer "
+         "every question.", False),
+    ])
+    _narration_bold_phrase([
+        ("The platform is live at ", False),
+        ("madeinaba.net", True),
+        (". The research is real. The numbers are sourced. And we built this on our own, at our "
+         "own cost, because we believe in what Abia can become.", False),
+    ])
+    _narration("Thank you for your time, sir.")
+    _screen_direction(
+        "PAUSE -- Hold eye contact with the camera for two full seconds before ending the recording."
+    )
+
+    # ===== PRODUCTION NOTES =====
+    style.notes_header("PRODUCTION NOTES")
+    style.notes_line("Total runtime target: 4 minutes 15 seconds to 4 minutes 45 seconds")
+
+    _production_heading = style.production_heading
+    _production_bullet = style.production_bullet
+
+    _production_heading("Pacing guidance:")
+    _production_bullet(
+        "Do not rush sections 2 and 3. The research and the problem statement are what "
+        "build credibility. Let the numbers breathe."
+    )
+    _production_bullet(
+        "Sections 5 and 6 should be brisk. The governor already understands the value by "
+        "this point -- move with confidence."
+    )
+    _production_bullet("The closing must be slow. Every word deliberate.")
+    _spacer(2)
+
+    _production_heading("Screen recording tips:")
+    _production_bullet("Use a clean browser with no bookmarks bar, no other tabs visible.")
+    _production_bullet("Set browser zoom to 110% so text is clearly readable in the recording.")
+    _production_bullet("Scroll smoothly -- do not jump. Let the viewer read along with you.")
+    _production_bullet("When pausing on a stat or quote, give it a full 2-3 seconds of silence.")
+    _spacer(2)
+
+    _production_heading("Key phrases to emphasize (bold in script):")
+    key_phrases = [
+        "\"No other state in Nigeria has captured yet\"",
+        "\"37,000 shops\"",
+        "\"One hundred and forty-four billion naira\"",
+        "\"Forced to label their shoes Made in China\"",
+        "\"Measurable, taxable, and investable\"",
+        "\"It is an economic asset\"",
+        "\"No delivery, no payment\"",
+        "\"This already works\"",
+        "\"No Nigerian state has built this\"",
+    ]
+    for phrase in key_phrases:
+        _production_bullet(phrase)
+    _spacer(2)
+
+    _production_heading("What NOT to do:")
+    _production_bullet("Do not apologize for the prototype being a demo. Present it as a working platform.")
+    _production_bullet(
+        "Do not use tech jargon (API, frontend, backend, React). The governor is a banker "
+        "-- speak in outcomes and assets."
+    )
+    _production_bullet("Do not read the screen word for word. Talk over it like you know it by heart.")
+    _production_bullet(
+        "Do not oversell the revenue projections. Let the numbers on screen do that work."
+    )
+    _production_bullet("Do not exceed 5 minutes. Respect the governor's time and he will respect yours.")
+
+
+# ---------------------------------------------------------------------------
+# PDF 3: Benefits One-Pager
+# ---------------------------------------------------------------------------
+
+def check_trader(trader: dict[str, str]) -> None:
+    """Raise ``ValueError`` unless a registry row has the fields every one-pager needs."""
+    if not (trader.get("shop_id") and trader.get("shop_name")):
+        raise ValueError(f"registry row needs shop_id and shop_name: {trader!r}")
+
+
+def generate_benefits_one_pager(
+    trader: dict[str, str] | None = None, output: PdfOutput | None = None, lang: str | None = None,
+) -> PdfOutput:
+    """Generate a 1-page strategic benefits overview PDF.
+
+    When ``trader`` is a registry row (see ``REGISTRY_FIELDS``) the page is
+    personalized for that shop (see ``merge_output_path`` for its file name),
+    with the shop's photo if the row has a ``photo`` path.
+    With ``lang`` (see ``LANGUAGES``) it greets the shop and signs off in
+    that language, in Unicode fonts.
+    """
+    if trader is not None:
+        check_trader(trader)
+    pdf = new_document(lang)
+    draw_benefits_one_pager(pdf, trader, lang)
+    return write_pdf(pdf, output or OUTPUT_DIR / DEFAULT_FILENAMES["onepager"])
+
+
+def draw_benefits_one_pager(pdf: FPDF, trader: dict[str, str] | None = None, lang: str | None = None) -> None:
+    """Add the one-pager to ``pdf`` (see ``generate_benefits_one_pager``)."""
+    pdf.set_auto_page_break(auto=False)
+    pdf.add_page()
+
+    page_w = 210
+    margin_l = 15
+    margin_r = 15
+    usable_w = page_w - margin_l - margin_r
+
+    # ===== HEADER SECTION =====
+    pdf.set_xy(margin_l, 10)
+    pdf.set_font("Helvetica", "B", 20)
+    pdf.set_text_color(*NAVY)
+    pdf.cell(usable_w, 10, "ABA DIGITAL MARKETPLACE", align="C", new_x="LMARGIN", new_y="NEXT")
+
+    pdf.set_x(margin_l)
+    pdf.set_font("Helvetica", "", 11)
+    pdf.set_text_color(*GOLD)
+    pdf.cell(
+        usable_w, 6,
+        "Strategic Benefits for His Excellency & Abia State",
+        align="C", new_x="LMARGIN", new_y="NEXT",
+    )
+
+    # Gold accent line
+    y_line = pdf.get_y() + 2
+    pdf.set_draw_color(*GOLD)
+    pdf.set_line_width(0.6)
+    pdf.line(margin_l + 30, y_line, page_w - margin_r - 30, y_line)
+    pdf.set_y(y_line + 4)
+
+    # ===== PER-TRADER BLOCK (mail-merge only) =====
+    if trader is not None:
+        block_x, block_w, block_top = margin_l, usable_w, pdf.get_y()
+        if trader.get("photo"):
+            # Shop photo on the left; the centered text narrows on both sides to clear it.
+            size = ONE_PAGER_PHOTO_MM
+            photo = thumbnails.THUMBNAILS.get(Path(trader["photo"]), size, size)
+            thumbnails.place_thumbnail(pdf, photo, margin_l, block_top, size, size)
+            block_x, block_w = margin_l + size + 4, usable_w - 2 * (size + 4)
+        # Registry names are often Igbo or Yoruba; the core fonts get them folded.
+        text = str if isinstance(pdf, UnicodePDF) else _core_font_text
+        pdf.set_x(block_x)
+        pdf.set_font("Helvetica", "B", 9)
+        pdf.set_text_color(*BLACK)
+        salutation = f"{LANGUAGES[lang]['greeting']}, " if lang else "Prepared for: "
+        pdf.multi_cell(
+            block_w, 5, f"{salutation}{text(trader['shop_name'])}",
+            align="C", new_x="LMARGIN", new_y="NEXT",
+        )
+        details = "  |  ".join(
+            text(trader[key]) for key in ("owner", "market", "line", "category") if trader.get(key)
+        )
+        if details:
+            pdf.set_x(block_x)
+            pdf.set_font("Helvetica", "", 8)
+            pdf.set_text_color(*MEDIUM_GRAY)
+            pdf.multi_cell(block_w, 4, details, align="C", new_x="LMARGIN", new_y="NEXT")
+        if trader.get("photo"):
+            pdf.set_y(max(pdf.get_y(), block_top + ONE_PAGER_PHOTO_MM))
+        pdf.set_y(pdf.get_y() + 3)
+
+    # ===== SECTIONS, sized to end above the bottom bar =====
+    style = OnePagerStyle(
+        pdf, *fit_one_pager(ONE_PAGER_BODY_LIMIT - pdf.get_y(), isinstance(pdf, UnicodePDF)),
+    )
+    _one_pager_body(style)
+
+    # ===== BOTTOM BAR =====
+    bar_y = 282
+    bar_h = 8
+    pdf.set_fill_color(*NAVY)
+    pdf.rect(0, bar_y, page_w, bar_h, "F")
+    assets.place_svg(pdf, ONE_PAGER_ICON, x=6, y=bar_y + 1.5, h=5)
+    pdf.set_xy(0, bar_y + 1.5)
+    pdf.set_font("Helvetica", "", 7.5)
+    pdf.set_text_color(*WHITE)
+    site = seller_url(trader) if trader is not None else "madeinaba.net"
+    thanks = f"{LANGUAGES[lang]['thanks']}   |   " if lang else ""
+    pdf.cell(
+        page_w, 5,
+        f"{thanks}Prepared by Stringz Technologies LLC   |   {site}   |   Confidential",
+        align="C",
+    )
+
+
+def _one_pager_body(style: OnePagerStyle) -> None:
+    """Lay out the five benefit sections from the current y position."""
+    # ===== SECTION RENDERING HELPERS =====
+    _section_title = style.section_title
+    _bullet = style.bullet
+    _bullet_bold_value = style.bullet_bold_value
+    _section_spacer = style.section_spacer
+
+    # ===== SECTION 1: DIRECT REVENUE STREAMS =====
+    _section_title("$", "DIRECT REVENUE STREAMS")
+    _bullet("Transaction levies (1-1.5% on every digital transaction -- automated, no leakage)")
+    _bullet_bold_value("Annual trader registration fees (N5-10K per trader x thousands of traders)")
+    _bullet_bold_value("Premium listing fees (N5-15K/month for featured placement)")
+    _bullet_bold_value("**Conservative Year 1-2 projection: N107-178M annually**")
+    _bullet_bold_value("**Full potential Year 3-5: N632M - N1B annually**")
+    _section_spacer()
+
+    # ===== SECTION 2: NEW BUSINESSES =====
+    _section_title("+", "NEW BUSINESSES THE STATE CAN SPIN UP")
+    _bullet("State-backed logistics network (delivery fleet serving buyers & sellers -- per-delivery fees)")
+    _bullet("Warehousing & fulfillment centers (storage hubs in Aba -- rental income)")
+    _bullet("Quality certification body (\"Made in Aba\" verification -- certification fees)")
+    _bullet("Trade finance / micro-lending (data-backed loans to verified traders -- interest revenue)")
+    _bullet("Packaging & branding services (professional packaging for e-commerce -- service fees)")
+    _section_spacer()
+
+    # ===== SECTION 3: DATA & INTELLIGENCE =====
+    _section_title("~", "DATA & INTELLIGENCE (THE HIDDEN GOLD)")
+    _bullet("First-ever digital trader registry (NIN-verified -- who trades, what, where, how much)")
+    _bullet("Real-time economic activity data (transaction volumes, growth trends, seasonal patterns)")
+    _bullet("Tax & levy optimization (data-driven collection replaces manual guesswork)")
+    _bullet("Policy planning intelligence (which sectors grow, which need support, where to invest)")
+    _bullet("Investor pitch material (hard data to attract FDI and federal funding)")
+    _bullet("Citizen database asset (traders' information, business profiles, economic contributions)")
+    _section_spacer()
+
+    # ===== SECTION 4: LEGACY & POLITICAL CAPITAL =====
+    _section_title("*", "LEGACY & POLITICAL CAPITAL")
+    _bullet("\"First Nigerian state to build a digital marketplace\" -- national press headline")
+    _bullet("Visible modernization aligned with A-Line market rebuild")
+    _bullet("Demonstrable economic data for federal engagement")
+    _bullet("Blueprint other states will want to license (additional revenue)")
+    _bullet("International recognition (\"China of Africa goes digital\")")
+    _bullet("Permanent infrastructure that outlasts any administration")
+    _section_spacer()
+
+    # ===== SECTION 5: SOCIAL IMPACT =====
+    _section_title("#", "SOCIAL IMPACT")
+    _bullet("Traders reach buyers nationwide without leaving Aba")
+    _bullet("Women and youth traders gain equal digital visibility")
+    _bullet("\"Made in Aba\" brand rehabilitation (no more labeling goods \"Made in China\")")
+    _bullet("Financial inclusion through escrow and digital payments")
+    _bullet("USSD and WhatsApp access means no trader is excluded")
+
+
+# Lowest y the one-pager sections may reach, leaving clearance above the
+# navy bottom bar at y=282.
+ONE_PAGER_BODY_LIMIT = 282 - 4
+ONE_PAGER_ICON = assets.IMAGES_DIR / "stringz-icon-white.svg"
+# Shop photo of a registry row with a ``photo`` column.
+ONE_PAGER_PHOTO_MM = 16
+
+# Body font sizes the fit solver tries, largest first. 8 pt is the designed
+# size, so pages that already fit are rendered exactly as designed.
+ONE_PAGER_BODY_SIZES = tuple(8 - 0.25 * i for i in range(9))
+
+
+def one_pager_metrics(body_size: float) -> tuple[float, float, float]:
+    """Return ``(body_size, bullet_line_h, section_gap)`` scaled from the 8 pt design."""
+    return body_size, round(body_size * 0.45, 3), round(body_size * 0.4375, 3)
+
+
+@functools.lru_cache(maxsize=2)
+def _measure_pdf(unicode: bool = False) -> FPDF:
+    """Scratch document for dry-run measurement; nothing is ever drawn on it."""
+    pdf = UnicodePDF() if unicode else FPDF(orientation="P", unit="mm", format="A4")
+    pdf.add_page()
+    return pdf
+
+
+@functools.lru_cache(maxsize=None)
+def one_pager_body_height(body_size: float, unicode: bool = False) -> float:
+    """Measure the height of the one-pager sections at ``body_size`` without rendering."""
+    style = OnePagerStyle(_measure_pdf(unicode), *one_pager_metrics(body_size), measure=True)
+    _one_pager_body(style)
+    return style.height
+
+
+def fit_one_pager(available: float, unicode: bool = False) -> tuple[float, float, float]:
+    """Return the largest one-pager metrics whose sections fit in ``available`` mm.
+
+    ``unicode`` measures with the Unicode fonts of localized documents.
+
+    Each candidate size is measured once per process, so fitting a page in a
+    large batch costs a few dictionary lookups rather than trial renders.
+    """
+    for body_size in ONE_PAGER_BODY_SIZES:
+        if one_pager_body_height(body_size, unicode) <= available:
+            return one_pager_metrics(body_size)
+    raise ValueError(
+        f"one-pager sections need {one_pager_body_height(ONE_PAGER_BODY_SIZES[-1], unicode):.1f} mm "
+        f"at {ONE_PAGER_BODY_SIZES[-1]} pt but only {available:.1f} mm is left"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Markdown sources
+# ---------------------------------------------------------------------------
+
+MARKDOWN_SOURCES = {
+    "memo-md": OUTPUT_DIR / "governor-memo.md",
+    "script-md": OUTPUT_DIR / "video-script.md",
+}
+
+
+def markdown_source(name: str, lang: str | None = None) -> Path:
+    """Return the source of ``name`` in ``lang`` (e.g. ``governor-memo.igbo.md``) if translated."""
+    source = MARKDOWN_SOURCES[name]
+    if lang is not None:
+        translated = source.with_suffix(f".{lang}.md")
+        if translated.exists():
+            return translated
+    return source
+
+
+def render_memo_blocks(pdf: FPDF, blocks: list[Block]) -> None:
+    """Lay out parsed memo Markdown with the governor memo styles.
+
+    Paragraphs ending in a comma are set as single lines (salutation and
+    valediction); a fully bold paragraph is set as the signature.
+    """
+    style = MemoStyle(pdf)
+    previous = ""
+    seen_body = False
+    for block in blocks:
+        if previous == "bullet" and block.kind != "bullet":
+            pdf.set_y(pdf.get_y() + 1)
+
+        if block.kind == "title":
+            style.title(block.text)
+        elif block.kind == "rule":
+            style.rule(*((2, 4) if previous == "title" else (3, 5)))
+        elif block.kind == "field":
+            if previous == "field":
+                pdf.set_y(pdf.get_y() + 1)
+            style.field(block.label, block.text)
+        elif block.kind == "lead":
+            style.section_header(block.label)
+            style.section_body_inline(f" {block.text}")
+            seen_body = True
+        elif block.kind == "bullet":
+            style.bullet(block.text, markdown=True)
+        elif block.text.startswith("**") and block.text.endswith("**"):
+            pdf.set_y(pdf.get_y() + 4)
+            style.line(block.text.strip("*"), bold=True)
+        elif block.text.endswith(","):
+            if seen_body:
+                pdf.set_y(pdf.get_y() + 3)
+            style.line(block.text)
+            if not seen_body:
+                pdf.set_y(pdf.get_y() + 2)
+        else:
+            style.body_full(block.text, markdown="**" in block.text)
+            seen_body = True
+        previous = block.kind
+
+
+def render_script_blocks(pdf: FPDF, blocks: list[Block]) -> None:
+    """Lay out parsed video-script Markdown with the video script styles.
+
+    The ``# Title: Subtitle`` heading and the fields before the first section
+    form the title block; ``##`` headings other than sections open the
+    production notes.
+    """
+    style = ScriptStyle(pdf)
+    title = next((b.text for b in blocks if b.kind == "title"), "")
+    heading, _, subtitle = title.partition(":")
+    first_body = next(
+        (i for i, b in enumerate(blocks) if b.kind in ("section", "heading")), len(blocks),
+    )
+    info = "  |  ".join(
+        f"{b.label} {b.text}" for b in blocks[:first_body] if b.kind == "field"
+    )
+    style.title(heading.strip().upper(), subtitle.strip(), info)
+
+    previous = ""
+    for block in blocks[first_body:]:
+        if block.kind == "section":
+            style.section_header(block.number, block.text, block.timestamp)
+        elif block.kind == "heading":
+            style.notes_header(block.text.upper())
+        elif block.kind == "direction":
+            style.screen_direction(block.text)
+        elif block.kind == "field" and block.text:
+            style.notes_line(f"{block.label} {block.text}")
+        elif block.kind == "field":
+            if previous == "bullet":
+                style.spacer(2)
+            style.production_heading(block.label)
+        elif block.kind == "bullet":
+            style.production_bullet(block.text.replace("**", ""))
+        elif block.kind == "lead":
+            style.narration(f"**{block.label}** {block.text}", markdown=True)
+        elif block.kind == "paragraph":
+            style.narration(block.text, markdown="**" in block.text)
+        previous = block.kind
+
+
+def generate_memo_from_markdown(
+    output: PdfOutput | None = None, source: Path | None = None, lang: str | None = None,
+) -> PdfOutput:
+    """Generate the governor memo from ``governor-memo.md`` (or ``source``).
+
+    With ``lang`` it uses the translated source when there is one, in Unicode fonts.
+    """
+    pdf = new_document(lang)
+    pdf.set_auto_page_break(auto=False)
+    pdf.add_page()
+    pdf.set_margins(25, 20, 25)
+    render_memo_blocks(pdf, load_document(source or markdown_source("memo-md", lang)))
+
+    return write_pdf(pdf, output or OUTPUT_DIR / DEFAULT_FILENAMES["memo-md"])
+
+
+def generate_script_from_markdown(
+    output: PdfOutput | None = None, source: Path | None = None, lang: str | None = None,
+) -> PdfOutput:
+    """Generate the video script from ``video-script.md`` (or ``source``), like the memo."""
+    pdf = new_document(lang)
+    pdf.set_auto_page_break(auto=True, margin=20)
+    pdf.set_margins(20, 20, 20)
+    pdf.add_page()
+    render_script_blocks(pdf, load_document(source or markdown_source("script-md", lang)))
+
+    return write_pdf(pdf, output or OUTPUT_DIR / DEFAULT_FILENAMES["script-md"])
+
+
+# ---------------------------------------------------------------------------
+# Generator registry
+# ---------------------------------------------------------------------------
+
+GENERATORS: dict[str, Callable[..., PdfOutput]] = {
+    "memo": generate_governor_memo,
+    "script": generate_video_script,
+    "onepager": generate_benefits_one_pager,
+    "memo-md": generate_memo_from_markdown,
+    "script-md": generate_script_from_markdown,
+}
+
+
+def render_bytes(name: str, **kwargs: Any) -> bytes:
+    """Render generator ``name`` in memory and return the PDF bytes."""
+    buffer = io.BytesIO()
+    GENERATORS[name](output=buffer, **kwargs)
+    return buffer.getvalue()
+
+
+# Extra files (sources, images, fonts) each generator reads; their bytes are
+# part of the generator's cache key.
+GENERATOR_ASSETS: dict[str, tuple[Path, ...]] = {
+    name: (source, *sorted(source.parent.glob(f"{source.stem}.*.md")), Path(markdown_ir.__file__))
+    for name, source in MARKDOWN_SOURCES.items()
+}
+GENERATOR_ASSETS["onepager"] = (ONE_PAGER_ICON, Path(assets.__file__), Path(thumbnails.__file__))
+# Localized renders of every generator depend on the Unicode font code, and
+# every render on the line breaks memoized by layout_cache and the bytes
+# pdf_optimize writes.
+for _name in GENERATORS:
+    GENERATOR_ASSETS[_name] = (
+        *GENERATOR_ASSETS.get(_name, ()),
+        Path(unicode_fonts.__file__), Path(layout_cache.__file__), Path(pdf_optimize.__file__),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Registry annex
+# ---------------------------------------------------------------------------
+
+def _verified(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "y", "verified")
+
+
+def _yes_no(value: str) -> str:
+    return "Yes" if _verified(value) else "No"
+
+
+def _naira(value: str) -> str:
+    try:
+        return f"{float(value.replace(',', '')):,.0f}"
+    except ValueError:
+        return value
+
+
+# Punctuation outside Latin-1 that names and prices commonly carry.
+_CORE_FONT_PUNCTUATION = {
+    "\u2018": "'", "\u2019": "'", "\u201a": "'", "\u201c": '"', "\u201d": '"', "\u201e": '"',
+    "\u2013": "-", "\u2014": "-", "\u2026": "...", "\u2022": "-", "\u20ac": "EUR", "\u20a6": "N",
+}
+
+
+def _core_font_text(text: str) -> str:
+    """Fold ``text`` into Latin-1 for the core fonts: Ọ̀jà becomes Ojà and “Aba’s” "Aba's", not ???."""
+    if text.isascii():
+        return text
+    folded = []
+    for ch in unicodedata.normalize("NFC", text):
+        if ord(ch) < 256:
+            folded.append(ch)
+        elif ch in _CORE_FONT_PUNCTUATION:
+            folded.append(_CORE_FONT_PUNCTUATION[ch])
+        elif not unicodedata.combining(ch):
+            base = "".join(c for c in unicodedata.normalize("NFKD", ch) if ord(c) < 256)
+            folded.append(base or "?")
+    return "".join(folded)
+
+
+# Names are folded for the core fonts; the table engine only encodes Latin-1.
+ANNEX_COLUMNS = (
+    Column("shop_id", "Shop ID", max_share=0.12),
+    Column("shop_name", "Shop name", format=_core_font_text),
+    Column("market", "Market", max_share=0.25, format=_core_font_text),
+    Column("category", "Category", max_share=0.18, format=_core_font_text),
+    Column("nin_verified", "NIN verified", align="C", format=_yes_no, max_share=0.1),
+    Column("monthly_volume", "Monthly volume (N)", align="R", format=_naira, max_share=0.15),
+)
+
+
+def build_registry_annex(registry: Path) -> tuple[FPDF, StreamingTable]:
+    """Lay out the registry annex, streaming rows from ``registry``."""
+    pdf = FPDF(orientation="P", unit="mm", format="A4")
+    table = draw_registry_annex(
+        pdf, registry,
+        footer=lambda page: f"Aba Digital Marketplace   |   Trader registry annex   |   Page {page} of {{nb}}",
+    )
+    return pdf, table
+
+
+def draw_registry_annex(pdf: FPDF, registry: Path, footer: Callable[[int], str]) -> StreamingTable:
+    """Add the annex's pages to ``pdf`` and return the table that laid them out."""
+    pdf.set_auto_page_break(auto=False)
+    pdf.add_page()
+
+    pdf.set_xy(15, 15)
+    pdf.set_font("Helvetica", "B", 14)
+    pdf.set_text_color(*NAVY)
+    pdf.cell(180, 8, "ANNEX: ARIARIA TRADER REGISTRY", new_x="LMARGIN", new_y="NEXT")
+    pdf.set_x(15)
+    pdf.set_font("Helvetica", "", 9)
+    pdf.set_text_color(*MEDIUM_GRAY)
+    pdf.cell(
+        180, 5, "Every registered shop, its market, category, NIN verification and monthly volume",
+        new_x="LMARGIN", new_y="NEXT",
+    )
+
+    table = StreamingTable(pdf, ANNEX_COLUMNS, header_fill=NAVY, text_color=DARK_GRAY, footer=footer)
+    table.render(iter_registry(registry), first_top=pdf.get_y() + 4)
+    return table
+
+
+def generate_registry_annex(registry: Path, output: PdfOutput | None = None) -> PdfOutput:
+    """Generate the registry annex: one table row per shop in ``registry``."""
+    pdf, _ = build_registry_annex(registry)
+    return write_pdf(pdf, output or ANNEX_PATH)
+
+
+# ---------------------------------------------------------------------------
+# Product catalog
+# ---------------------------------------------------------------------------
+
+# Pages per chunk. A chunk is merged into the catalog file as soon as it is
+# full and then dropped, so memory use depends on this, not on the page count.
+CATALOG_CHUNK_PAGES = 200
+CATALOG_TITLE = "Aba Digital Marketplace product catalog"
+CATALOG_TABLE_TOP = 27
+
+CATALOG_COLUMNS = (
+    Column("sku", "SKU"),
+    Column("product", "Product", format=_core_font_text),
+    Column("shop_name", "Shop", format=_core_font_text),
+    Column("unit", "Unit", align="C", format=_core_font_text),
+    Column("price", "Price (N)", align="R", format=_naira),
+)
+# Fixed, so that every page of the catalog lines up (sums to the 180 mm table width).
+CATALOG_WIDTHS = (26, 72, 48, 14, 20)
+# With an ``image`` column in the export, each row starts with the product photo.
+CATALOG_PHOTO_COLUMNS = (Column("image", "Photo", align="C", format=lambda _: ""), *CATALOG_COLUMNS)
+CATALOG_PHOTO_WIDTHS = (14, 24, 62, 46, 14, 20)
+CATALOG_PHOTO_MM = 10
+
+
+class CatalogWriter:
+    """Lay out catalog pages in chunks of ``chunk_pages``, merging each full chunk into ``output``.
+
+    Outline entries are collected as pages are added and written with the
+    merged file's page tree by ``close``. Every chunk carries ``title``.
+    """
+
+    def __init__(self, output: BinaryIO, chunk_pages: int = CATALOG_CHUNK_PAGES, title: str = CATALOG_TITLE) -> None:
+        if chunk_pages < 1:
+            raise ValueError(f"chunk_pages must be at least 1, not {chunk_pages}")
+        self.merger = pdf_merger(output)
+        self.chunk_pages = chunk_pages
+        self.title = title
+        self.pdf: FPDF | None = None
+        self.outline: list[OutlineEntry] = []
+        self.pages = 0
+        self.products = 0
+        self.photos = 0
+        # Photos named in the export that could not be read or decoded.
+        self.missing_photos = 0
+
+    @property
+    def chunks(self) -> int:
+        return self.merger.documents
+
+    def add_page(self) -> FPDF:
+        """Start the next page, in a fresh chunk once the current one is full."""
+        if self.pdf is not None and self.pdf.page >= self.chunk_pages:
+            self.flush()
+        if self.pdf is None:
+            self.pdf = new_document()
+            self.pdf.set_title(self.title)
+            self.pdf.set_auto_page_break(auto=False)
+        self.pdf.add_page()
+        self.pages += 1
+        return self.pdf
+
+    def bookmark(self, title: str, level: int) -> None:
+        """Add an outline entry for the current page."""
+        self.outline.append(OutlineEntry(title, level, self.pages - 1))
+
+    def flush(self) -> None:
+        """Merge the current chunk into the output and drop its pages."""
+        if self.pdf is not None:
+            self.merger.append(pdf_bytes(self.pdf))
+            self.pdf = None
+            # An FPDF is full of reference cycles; free the chunk now rather
+            # than whenever the collector next runs, or memory creeps up.
+            gc.collect()
+
+    def close(self) -> None:
+        """Merge the last chunk and finish the file."""
+        self.flush()
+        self.merger.close(self.outline)
+
+
+def _catalog_page_header(pdf: FPDF, market: str, category: str, continued: bool) -> None:
+    market, category = _core_font_text(market), _core_font_text(category)
+    pdf.set_fill_color(*NAVY)
+    pdf.rect(0, 0, 210, 12, "F")
+    pdf.set_fill_color(*GOLD)
+    pdf.rect(0, 12, 210, 1, "F")
+    pdf.set_text_color(*WHITE)
+    pdf.set_font("Helvetica", "B", 10)
+    pdf.set_xy(15, 3)
+    pdf.cell(130, 6, market.upper())
+    pdf.set_font("Helvetica", "", 8)
+    pdf.set_xy(145, 3)
+    pdf.cell(50, 6, "PRODUCT CATALOG", align="R")
+
+    pdf.set_xy(15, 17)
+    pdf.set_font("Helvetica", "B", 12)
+    pdf.set_text_color(*NAVY)
+    pdf.cell(180, 6, f"{category} (continued)" if continued else category)
+
+
+def _catalog_key(row: tuple[dict[str, str], thumbnails.Thumbnail | None]) -> tuple[str, str]:
+    product = row[0]
+    return product.get("market") or "Other markets", product.get("category") or "Uncategorized"
+
+
+def _photo_path(value: str | None, images: Path | None) -> Path | None:
+    if not value:
+        return None
+    path = Path(value)
+    return path if images is None or path.is_absolute() else images / path
+
+
+def build_catalog(
+    products: Iterable[dict[str, str]], output: BinaryIO, chunk_pages: int = CATALOG_CHUNK_PAGES,
+    images: Path | None = None,
+) -> CatalogWriter:
+    """Render the catalog of ``products`` to ``output``, ``chunk_pages`` pages at a time.
+
+    Products are listed in the order given, which should be grouped by
+    market and then category: each category starts a new page, and every
+    market and category is bookmarked at its first page. When products have
+    an ``image`` (a path, relative to ``images`` if given), every row shows
+    its photo; the thumbnails are made ahead of the page in ``THUMBNAILS``'s
+    thread pool.
+    """
+    products = iter(products)
+    first = next(products, None)
+    if first is None:
+        raise ValueError("the product list is empty")
+    products = chain([first], products)
+    photos = "image" in first
+    if photos:
+        rows = thumbnails.THUMBNAILS.map(
+            products, lambda product: _photo_path(product.get("image"), images), CATALOG_PHOTO_MM, CATALOG_PHOTO_MM,
+        )
+        columns, widths, row_h = CATALOG_PHOTO_COLUMNS, CATALOG_PHOTO_WIDTHS, CATALOG_PHOTO_MM + 2
+    else:
+        rows = ((product, None) for product in products)
+        columns, widths, row_h = CATALOG_COLUMNS, CATALOG_WIDTHS, 4.8
+
+    writer = CatalogWriter(output, chunk_pages)
+    current_market = None
+    for (market, category), group in groupby(rows, key=_catalog_key):
+        page_rows = [next(group)]
+        continued = False
+        while page_rows:
+            pdf = writer.add_page()
+            if not continued:
+                if market != current_market:
+                    writer.bookmark(market, 0)
+                    current_market = market
+                writer.bookmark(category, 1)
+            _catalog_page_header(pdf, market, category, continued)
+            table = StreamingTable(
+                pdf, columns, top=CATALOG_TABLE_TOP, font_size=7.5, row_h=row_h,
+                header_fill=NAVY, text_color=DARK_GRAY, widths=widths,
+                footer=lambda _: f"{CATALOG_TITLE}   |   Page {writer.pages:,}",
+            )
+            page_rows += islice(group, table.rows_per_page - len(page_rows))
+            table.render([product for product, _ in page_rows], first_top=CATALOG_TABLE_TOP)
+            if photos:
+                _place_catalog_photos(writer, table, page_rows)
+            writer.products += len(page_rows)
+            page_rows = list(islice(group, 1))
+            continued = True
+    writer.close()
+    return writer
+
+
+def _place_catalog_photos(
+    writer: CatalogWriter, table: StreamingTable,
+    rows: list[tuple[dict[str, str], thumbnails.Thumbnail | None]],
+) -> None:
+    top = CATALOG_TABLE_TOP + table.header_h + (table.row_h - CATALOG_PHOTO_MM) / 2
+    x = table.x + (table.widths[0] - CATALOG_PHOTO_MM) / 2
+    for i, (product, thumbnail) in enumerate(rows):
+        if thumbnail is not None:
+            thumbnails.place_thumbnail(
+                writer.pdf, thumbnail, x, top + i * table.row_h, CATALOG_PHOTO_MM, CATALOG_PHOTO_MM,
+            )
+            writer.photos += 1
+        elif product.get("image"):
+            writer.missing_photos += 1
+
+
+def generate_catalog(
+    products: Path, output: PdfOutput | None = None, chunk_pages: int = CATALOG_CHUNK_PAGES,
+) -> PdfOutput:
+    """Generate the product catalog of a ``.csv``/``.jsonl`` product export (see ``build_catalog``).
+
+    Relative ``image`` paths are read from the export's directory.
+    """
+    output = output or CATALOG_PATH
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, "wb") as fh:
+            build_catalog(iter_registry(products), fh, chunk_pages, products.parent)
+    else:
+        build_catalog(iter_registry(products), output, chunk_pages, products.parent)
+    return output
+
+
+# ---------------------------------------------------------------------------
+# Trader certificates
+# ---------------------------------------------------------------------------
+
+CERTIFICATE_TITLE = "Made in Aba verified trader certificates"
+# Side of the QR code, quiet zone excluded; 40 mm scans from arm's length off a wall.
+CERTIFICATE_QR_MM = 40
+CERTIFICATE_QR_TOP = 188
+# Shop names shrink from the first size to the second to fit one line, then wrap.
+CERTIFICATE_NAME_PT = (22, 14)
+
+# The certificate's artwork and fixed wording as a rendered content stream,
+# keyed by the fonts the document had registered before it was drawn.
+_CERTIFICATE_TEMPLATE_CACHE: dict[tuple[tuple[str, int], ...], bytes] = {}
+
+
+class CertificateWriter(CatalogWriter):
+    """A ``CatalogWriter`` for certificates, one page per verified trader."""
+
+    def __init__(self, output: BinaryIO, chunk_pages: int = CATALOG_CHUNK_PAGES) -> None:
+        super().__init__(output, chunk_pages, CERTIFICATE_TITLE)
+        # Registry rows passed over because the trader's NIN is not verified.
+        self.unverified = 0
+
+
+def _certificate_template(pdf: FPDF) -> None:
+    """Draw everything on a certificate that is the same for every trader."""
+    page_w = 210
+    pdf.set_draw_color(*NAVY)
+    pdf.set_line_width(1.2)
+    pdf.rect(10, 10, page_w - 20, 277)
+    pdf.set_draw_color(*GOLD)
+    pdf.set_line_width(0.4)
+    pdf.rect(13, 13, page_w - 26, 271)
+
+    pdf.set_xy(15, 28)
+    pdf.set_font("Helvetica", "B", 30)
+    pdf.set_text_color(*NAVY)
+    pdf.cell(page_w - 30, 14, "MADE IN ABA", align="C")
+    pdf.set_xy(15, 43)
+    pdf.set_font("Helvetica", "B", 12)
+    pdf.set_text_color(*GOLD)
+    pdf.cell(page_w - 30, 7, "VERIFIED TRADER CERTIFICATE", align="C")
+    pdf.set_line_width(0.6)
+    pdf.line(70, 55, page_w - 70, 55)
+
+    pdf.set_xy(15, 66)
+    pdf.set_font("Helvetica", "", 11)
+    pdf.set_text_color(*MEDIUM_GRAY)
+    pdf.cell(page_w - 30, 6, "This certifies that", align="C")
+
+    pdf.set_xy(30, 120)
+    pdf.set_font("Helvetica", "", 10.5)
+    pdf.set_text_color(*DARK_GRAY)
+    pdf.multi_cell(
+        page_w - 60, 5.5,
+        "is a registered trader on the Aba Digital Marketplace whose owner's National "
+        "Identification Number (NIN) has been verified. Buyers can confirm this certificate "
+        "at any time on the trader's madeinaba.net seller page.",
+        align="C",
+    )
+
+    # Shop ID, certificate number and issue date, filled in per trader.
+    pdf.set_draw_color(*LIGHT_GRAY)
+    pdf.set_line_width(0.3)
+    pdf.line(25, 152, page_w - 25, 152)
+    pdf.line(25, 172, page_w - 25, 172)
+    pdf.set_font("Helvetica", "", 7.5)
+    pdf.set_text_color(*MEDIUM_GRAY)
+    for i, label in enumerate(("SHOP ID", "CERTIFICATE NO.", "ISSUED")):
+        pdf.set_xy(25 + i * 160 / 3, 155)
+        pdf.cell(160 / 3, 5, label, align="C")
+
+    pdf.set_xy(15, CERTIFICATE_QR_TOP + CERTIFICATE_QR_MM + 4)
+    pdf.set_font("Helvetica", "", 8)
+    pdf.cell(page_w - 30, 4, "Scan to open this trader's seller page", align="C")
+
+    pdf.set_draw_color(*DARK_GRAY)
+    pdf.line(30, 262, 90, 262)
+    pdf.line(page_w - 90, 262, page_w - 30, 262)
+    pdf.set_xy(30, 263)
+    pdf.cell(60, 4, "For Stringz Technologies LLC", align="C")
+    pdf.set_xy(page_w - 90, 263)
+    pdf.cell(60, 4, "Aba Digital Marketplace", align="C")
+
+    pdf.set_fill_color(*NAVY)
+    pdf.rect(13, 274, page_w - 26, 10, "F")
+    pdf.set_xy(13, 276.5)
+    pdf.set_font("Helvetica", "B", 8)
+    pdf.set_text_color(*WHITE)
+    pdf.cell(page_w - 26, 5, "madeinaba.net   |   Made in Aba   |   NIN-verified seller", align="C")
+
+
+def _stamp_certificate_template(pdf: FPDF) -> None:
+    """Append the certificate template to the current page, rendering it on a miss.
+
+    The template is drawn in a local graphics context and positioned
+    absolutely, and every certificate's fields leave the same font and
+    color state behind, so from the second page of a document on its
+    content stream is the same for every trader. It is set in the two fonts
+    the fields also use, so they are always in the page's resources.
+    """
+    contents = pdf.pages[pdf.page].contents
+    fonts = tuple((fontkey, font.i) for fontkey, font in pdf.fonts.items())
+    cached = _CERTIFICATE_TEMPLATE_CACHE.get(fonts)
+    if cached is not None:
+        contents.extend(cached)
+        return
+
+    start = len(contents)
+    with pdf.local_context():
+        _certificate_template(pdf)
+    # A first page registers the fonts as it goes, so its stream is not reusable.
+    if tuple((fontkey, font.i) for fontkey, font in pdf.fonts.items()) == fonts:
+        _CERTIFICATE_TEMPLATE_CACHE[fonts] = bytes(contents[start:])
+
+
+def _certificate_fields(pdf: FPDF, trader: dict[str, str], issued: date) -> None:
+    """Fill in ``trader``'s name, details, certificate number, date and seller page QR code."""
+    page_w = 210
+    name = _core_font_text(trader["shop_name"])
+    size, smallest = CERTIFICATE_NAME_PT
+    pdf.set_font("Helvetica", "B", size)
+    while size > smallest and pdf.get_string_width(name) > page_w - 50:
+        size -= 1
+        pdf.set_font_size(size)
+    pdf.set_text_color(*NAVY)
+    pdf.set_xy(25, 76)
+    pdf.multi_cell(page_w - 50, size * 0.45, name, align="C", new_x="LMARGIN", new_y="NEXT")
+
+    pdf.set_font("Helvetica", "", 11)
+    pdf.set_text_color(*DARK_GRAY)
+    y = pdf.get_y() + 3
+    if trader.get("owner"):
+        pdf.set_xy(15, y)
+        pdf.cell(page_w - 30, 6, f"owned by {_core_font_text(trader['owner'])}", align="C")
+        y += 7
+    details = "   |   ".join(_core_font_text(trader[key]) for key in ("market", "line", "category") if trader.get(key))
+    if details:
+        pdf.set_xy(15, y)
+        pdf.cell(page_w - 30, 6, details, align="C")
+
+    shop_id = _core_font_text(trader["shop_id"])
+    values = (shop_id, f"MIA-{issued:%Y}-{shop_id}", f"{issued.day} {issued:%B %Y}")
+    for i, value in enumerate(values):
+        pdf.set_xy(25 + i * 160 / 3, 161)
+        pdf.cell(160 / 3, 6, value, align="C")
+
+    url = seller_url(trader)
+    code = qr_code.encode(f"https://{url}")
+    qr_code.draw_qr(pdf, code, (page_w - CERTIFICATE_QR_MM) / 2, CERTIFICATE_QR_TOP, CERTIFICATE_QR_MM, NAVY)
+    pdf.set_xy(15, CERTIFICATE_QR_TOP + CERTIFICATE_QR_MM + 8)
+    pdf.set_font("Helvetica", "B", 9)
+    pdf.set_text_color(*NAVY)
+    pdf.cell(page_w - 30, 5, url, align="C")
+
+
+def build_certificates(
+    traders: Iterable[dict[str, str]], output: BinaryIO, chunk_pages: int = CATALOG_CHUNK_PAGES,
+    issued: date | None = None,
+) -> CertificateWriter:
+    """Render a "Made in Aba" certificate for each NIN-verified trader to ``output``.
+
+    ``traders`` are registry rows (see ``REGISTRY_FIELDS``); rows whose
+    ``nin_verified`` is not set are counted in ``unverified`` and skipped.
+    Each page carries a vector QR code of the trader's seller page and is
+    bookmarked by shop name. The fixed parts of the page are drawn once
+    and stamped on every certificate (see ``_stamp_certificate_template``).
+    ``issued`` defaults to today.
+    """
+    issued = issued or date.today()
+    writer = CertificateWriter(output, chunk_pages)
+    for trader in traders:
+        if not (trader.get("shop_id") and trader.get("shop_name")):
+            raise ValueError(f"registry row needs shop_id and shop_name: {trader!r}")
+        if not _verified(trader.get("nin_verified", "")):
+            writer.unverified += 1
+            continue
+        pdf = writer.add_page()
+        writer.bookmark(f"{trader['shop_name']} ({trader['shop_id']})", 0)
+        _stamp_certificate_template(pdf)
+        _certificate_fields(pdf, trader, issued)
+    if not writer.pages:
+        raise ValueError(f"none of the {writer.unverified:,} registry rows has a verified NIN")
+    writer.close()
+    return writer
+
+
+def generate_certificates(
+    registry: Path, output: PdfOutput | None = None, chunk_pages: int = CATALOG_CHUNK_PAGES,
+    issued: date | None = None,
+) -> PdfOutput:
+    """Generate one PDF of certificates for the NIN-verified traders in ``registry`` (see ``build_certificates``)."""
+    output = output or CERTIFICATES_PATH
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, "wb") as fh:
+            build_certificates(iter_registry(registry), fh, chunk_pages, issued)
+    else:
+        build_certificates(iter_registry(registry), output, chunk_pages, issued)
+    return output
+
+
+# ---------------------------------------------------------------------------
+# Market report
+# ---------------------------------------------------------------------------
+
+# Markets and categories listed by name; the rest are summed into one row.
+REPORT_TOP_GROUPS = 5
+# Sparkline cell of the market and category tables.
+REPORT_TREND_W = 30
+
+CHART_STYLE = charts.ChartStyle(
+    colors=(NAVY, GOLD, *charts.DEFAULT_STYLE.colors[2:]), text=MEDIUM_GRAY, axis=RULE_GRAY,
+)
+
+
+def _compact_naira(value: float) -> str:
+    """Format an amount as N1.2bn, N350.4m, N12.5k or N950."""
+    return f"N{charts.compact(value)}"
+
+
+def _report_period(first: str, last: str) -> str:
+    """Format an ISO date range as "1 - 31 January 2026"."""
+    try:
+        start, end = date.fromisoformat(first), date.fromisoformat(last)
+    except ValueError:
+        return f"{first} - {last}"
+    if (start.year, start.month) == (end.year, end.month):
+        return f"{start.day} - {end.day} {end:%B %Y}"
+    return f"{start.day} {start:%B %Y} - {end.day} {end:%B %Y}"
+
+
+def _day_label(day: str) -> str:
+    try:
+        parsed = date.fromisoformat(day)
+    except ValueError:
+        return day
+    return f"{parsed.day} {parsed:%b}"
+
+
+def _top_groups(groups: dict[str, GroupTotals], label: str) -> list[tuple[str, GroupTotals, list[str]]]:
+    """Return the first ``REPORT_TOP_GROUPS`` groups plus one row summing the rest.
+
+    Each row is ``(label, totals, names of the groups it covers)``.
+    """
+    rows = [(name, group, [name]) for name, group in groups.items()]
+    if len(rows) <= REPORT_TOP_GROUPS + 1:
+        return rows
+    other = GroupTotals()
+    for _, group, _ in rows[REPORT_TOP_GROUPS:]:
+        other.count += group.count
+        other.volume += group.volume
+        other.fees += group.fees
+    rest = [name for _, _, (name,) in rows[REPORT_TOP_GROUPS:]]
+    return rows[:REPORT_TOP_GROUPS] + [(f"{len(rest)} other {label}", other, rest)]
+
+
+def _daily_volumes(daily: dict[str, dict[str, GroupTotals]], names: list[str], days: list[str]) -> list[float]:
+    """Sum the daily volume of the groups ``names`` (see ``MarketSummary.cross``)."""
+    volumes = [0.0] * len(days)
+    for name in names:
+        by_day = daily.get(name, {})
+        for index, day in enumerate(days):
+            if day in by_day:
+                volumes[index] += by_day[day].volume
+    return volumes
+
+
+def _report_section_title(pdf: FPDF, title: str) -> None:
+    bookmark(pdf, title.capitalize())
+    pdf.set_x(15)
+    pdf.set_font("Helvetica", "B", 10.5)
+    pdf.set_text_color(*NAVY)
+    pdf.cell(180, 5.5, title, new_x="LMARGIN", new_y="NEXT")
+    y_ul = pdf.get_y() + 0.5
+    pdf.set_draw_color(*NAVY)
+    pdf.set_line_width(0.3)
+    pdf.line(15, y_ul, 105, y_ul)
+    pdf.set_y(y_ul + 2.5)
+
+
+def _chart_caption(pdf: FPDF, x: float, y: float, w: float, text: str) -> None:
+    pdf.set_xy(x, y)
+    pdf.set_font("Helvetica", "B", 7.5)
+    pdf.set_text_color(*DARK_GRAY)
+    pdf.cell(w, 4, text)
+
+
+def _stat_box(pdf: FPDF, x: float, y: float, w: float, value: str, label: str) -> None:
+    """Draw one headline figure: a large navy value over a small gray label."""
+    pdf.set_draw_color(*LIGHT_GRAY)
+    pdf.set_line_width(0.3)
+    pdf.rect(x, y, w, 17)
+    pdf.set_fill_color(*GOLD)
+    pdf.rect(x, y, w, 1, "F")
+    pdf.set_xy(x, y + 3)
+    pdf.set_font("Helvetica", "B", 14)
+    pdf.set_text_color(*NAVY)
+    pdf.cell(w, 7, value, align="C")
+    pdf.set_xy(x, y + 10.5)
+    pdf.set_font("Helvetica", "", 7.5)
+    pdf.set_text_color(*MEDIUM_GRAY)
+    pdf.cell(w, 4, label, align="C")
+
+
+def _report_table(
+    pdf: FPDF, headings: tuple[str, ...], widths: tuple[float, ...], rows: Iterable[tuple[str, ...]],
+    trends: Iterable[list[float]] | None = None,
+) -> None:
+    """Draw a small table: navy heading row, then zebra-striped rows; columns after the first align right.
+
+    With ``trends``, a last column shows each row's series as a sparkline.
+    """
+    aligns = ("L",) + ("R",) * (len(headings) - 1)
+    pdf.set_font("Helvetica", "B", 7.5)
+    pdf.set_fill_color(*NAVY)
+    pdf.set_text_color(*WHITE)
+    pdf.set_x(15)
+    for heading, width, align in zip(headings, widths, aligns):
+        pdf.cell(width, 5.5, f" {heading} ", align=align, fill=True)
+    if trends is not None:
+        pdf.cell(REPORT_TREND_W, 5.5, " Daily volume ", align="C", fill=True)
+    pdf.ln(5.5)
+    trends = iter(trends or ())
+    for index, row in enumerate(rows):
+        pdf.set_font("Helvetica", "", 7.5)
+        pdf.set_text_color(*DARK_GRAY)
+        pdf.set_fill_color(242, 244, 248)
+        pdf.set_x(15)
+        for text, width, align in zip(row, widths, aligns):
+            pdf.cell(width, 4.8, f" {text} ", align=align, fill=index % 2 == 1)
+        trend = next(trends, None)
+        if trend is not None:
+            x, y = pdf.get_x(), pdf.get_y()
+            pdf.cell(REPORT_TREND_W, 4.8, "", fill=index % 2 == 1)
+            charts.sparkline(pdf, x + 3, y + 1, REPORT_TREND_W - 6, 2.8, trend, style=CHART_STYLE)
+        pdf.ln(4.8)
+    pdf.set_y(pdf.get_y() + 5)
+
+
+def _breakdown_rows(
+    groups: list[tuple[str, GroupTotals, list[str]]], total: GroupTotals,
+) -> Iterable[tuple[str, ...]]:
+    for name, group, _ in groups:
+        yield (
+            name,
+            f"{group.count:,}",
+            f"{group.volume:,.0f}",
+            f"{group.volume / total.volume:.1%}" if total.volume else "-",
+            f"{group.average:,.0f}",
+        )
+
+
+def generate_market_report(summary: MarketSummary, output: PdfOutput | None = None) -> PdfOutput:
+    """Generate the one-page market report for an aggregated transaction log."""
+    pdf = new_document()
+    draw_market_report(pdf, summary)
+    return write_pdf(pdf, output or REPORT_PATH)
+
+
+def draw_market_report(pdf: FPDF, summary: MarketSummary) -> None:
+    """Add the market report to ``pdf`` (see ``generate_market_report``)."""
+    pdf.set_auto_page_break(auto=False)
+    pdf.add_page()
+    page_w = 210
+    total = summary.totals()
+    days = list(summary.by("day"))
+    escrow = summary.by("status")
+    statuses = [status for status in ESCROW_STATUSES if status in escrow]
+    others = [status for status in escrow if status not in ESCROW_STATUSES]
+
+    # ===== HEADER SECTION =====
+    pdf.set_xy(15, 10)
+    pdf.set_font("Helvetica", "B", 20)
+    pdf.set_text_color(*NAVY)
+    pdf.cell(180, 10, "ABA DIGITAL MARKETPLACE", align="C", new_x="LMARGIN", new_y="NEXT")
+    pdf.set_x(15)
+    pdf.set_font("Helvetica", "", 11)
+    pdf.set_text_color(*GOLD)
+    pdf.cell(
+        180, 6, f"Market Report: {_report_period(*summary.period)}",
+        align="C", new_x="LMARGIN", new_y="NEXT",
+    )
+    y_line = pdf.get_y() + 2
+    pdf.set_draw_color(*GOLD)
+    pdf.set_line_width(0.6)
+    pdf.line(45, y_line, page_w - 45, y_line)
+
+    # ===== HEADLINE FIGURES =====
+    disputed = escrow.get("disputed", GroupTotals()).count
+    released = escrow.get("released", GroupTotals())
+    median = summary.release_percentile(0.5)
+    figures = (
+        (f"{total.count:,}", "Transactions"),
+        (_compact_naira(total.volume), "Gross volume"),
+        (_compact_naira(total.fees), "Platform fees"),
+        (f"{len(summary.shops):,}", "Active shops"),
+        (_compact_naira(total.average), "Average order"),
+        (f"{released.count / total.count:.1%}" if total.count else "-", "Escrows released"),
+        (f"{median} h" if median is not None else "-", "Median time to release"),
+        (f"{disputed / total.count:.2%}" if total.count else "-", "Dispute rate"),
+    )
+    box_w, gap = (180 - 3 * 4) / 4, 4
+    for index, (value, label) in enumerate(figures):
+        row, column = divmod(index, 4)
+        _stat_box(pdf, 15 + column * (box_w + gap), y_line + 5 + row * 21, box_w, value, label)
+    pdf.set_y(y_line + 5 + 2 * 21 + 3)
+
+    # ===== DAILY ACTIVITY =====
+    _report_section_title(pdf, "DAILY ACTIVITY")
+    top = pdf.get_y()
+    daily = summary.cross("status", "day")
+    stacks = {status.capitalize(): _daily_volumes(daily, [status], days) for status in statuses}
+    if others:
+        stacks["Other"] = _daily_volumes(daily, others, days)
+    every = max(1, round(len(days) / 6))
+    labels = [_day_label(day) if index % every == 0 else "" for index, day in enumerate(days)]
+    _chart_caption(pdf, 15, top, 114, "Daily volume by escrow status (N)")
+    charts.stacked_bar_chart(pdf, 15, top + 5, 114, 36, stacks, labels, style=CHART_STYLE)
+    if median is not None:
+        longest = max(summary.release_percentile(0.99) or 1, 1)
+        step = next(hours for hours in (1, 2, 3, 6, 12, 24, 48, 96, 168) if hours * 6 >= longest)
+        share, released_by = [], 0
+        releases = sum(summary.release_hours.values())
+        for hours in range(longest + 1):
+            released_by += summary.release_hours.get(hours, 0)
+            share.append(100 * released_by / releases)
+        _chart_caption(pdf, 137, top, 58, "Escrows paid out, by hours after payment")
+        charts.line_chart(
+            pdf, 137, top + 5, 58, 36, {"Released": share},
+            [f"{hours}h" if hours % step == 0 else "" for hours in range(longest + 1)],
+            style=CHART_STYLE, value_format=lambda value: f"{value:.0f}%",
+        )
+    pdf.set_y(top + 5 + 36 + 4)
+
+    # ===== BREAKDOWNS =====
+    headings = ("Transactions", "Volume (N)", "Volume share", "Average (N)")
+    widths = (50, 24, 28, 24, 24)
+    breakdowns = (("market", "VOLUME BY MARKET", "markets"), ("category", "VOLUME BY CATEGORY", "categories"))
+    for dimension, title, plural in breakdowns:
+        groups = _top_groups(summary.by(dimension), plural)
+        daily = summary.cross(dimension, "day")
+        _report_section_title(pdf, title)
+        _report_table(
+            pdf, (dimension.capitalize(), *headings), widths, _breakdown_rows(groups, total),
+            trends=[_daily_volumes(daily, names, days) for _, _, names in groups],
+        )
+
+    # ===== ESCROW =====
+    _report_section_title(pdf, "ESCROW")
+    rows = [(status.capitalize(), escrow[status]) for status in statuses]
+    if others:
+        other = GroupTotals()
+        for status in others:
+            other.count += escrow[status].count
+            other.volume += escrow[status].volume
+            other.fees += escrow[status].fees
+        rows.append((f"Other ({', '.join(others)})", other))
+    _report_table(
+        pdf, ("Status", "Transactions", "Volume (N)", "Count share", "Fees (N)"), (62, 28, 36, 26, 28),
+        (
+            (
+                name, f"{group.count:,}", f"{group.volume:,.0f}",
+                f"{group.count / total.count:.1%}", f"{group.fees:,.0f}",
+            )
+            for name, group in rows
+        ),
+    )
+
+    # ===== BOTTOM BAR =====
+    bar_y = 282
+    pdf.set_fill_color(*NAVY)
+    pdf.rect(0, bar_y, page_w, 8, "F")
+    assets.place_svg(pdf, ONE_PAGER_ICON, x=6, y=bar_y + 1.5, h=5)
+    pdf.set_xy(0, bar_y + 1.5)
+    pdf.set_font("Helvetica", "", 7.5)
+    pdf.set_text_color(*WHITE)
+    pdf.cell(
+        page_w, 5,
+        f"Prepared by Stringz Technologies LLC   |   {summary.rows:,} transactions   |   Confidential",
+        align="C",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Bundle
+# ---------------------------------------------------------------------------
+
+class LocalizedBundlePDF(UnicodePDF, BundlePDF):
+    """A bundle set in Unicode fonts."""
+
+
+def generate_bundle(
+    traders: Iterable[dict[str, str]] = (),
+    annex: Path | None = None,
+    output: PdfOutput | None = None,
+    lang: str | None = None,
+) -> PdfOutput:
+    """Render the memo, script and one-pager into a single PDF with a bookmark outline.
+
+    The bundle continues with a personalized one-pager per row of ``traders``
+    and, given a registry, the registry annex. All parts share one set of
+    fonts and resources instead of each file carrying its own. The annex
+    table writes core-font text directly, so it cannot be localized.
+    """
+    if lang is not None and annex is not None:
+        raise ValueError("the registry annex is not available in localized bundles")
+    if lang is not None and lang not in LANGUAGES:
+        raise ValueError(f"unknown language {lang!r}; expected one of {', '.join(LANGUAGES)}")
+    pdf = (LocalizedBundlePDF if lang else BundlePDF)(orientation="P", unit="mm", format="A4")
+    pdf.set_title("Aba Digital Marketplace")
+    pdf.begin_part("Governor memo")
+    draw_governor_memo(pdf)
+    pdf.begin_part("Video walkthrough script")
+    draw_video_script(pdf)
+    pdf.begin_part("Strategic benefits one-pager")
+    draw_benefits_one_pager(pdf, lang=lang)
+
+    traders = iter(traders)
+    trader = next(traders, None)
+    if trader is not None:
+        pdf.begin_part("Trader one-pagers")
+        while trader is not None:
+            check_trader(trader)
+            pdf.begin_part(trader["shop_name"], level=1)
+            draw_benefits_one_pager(pdf, trader, lang)
+            trader = next(traders, None)
+    if annex is not None:
+        pdf.begin_part("Trader registry annex")
+        draw_registry_annex(
+            pdf, annex,
+            footer=lambda page: f"Aba Digital Marketplace   |   Trader registry annex   |   Annex page {page}",
+        )
+    return write_pdf(pdf, output or BUNDLE_PATH)
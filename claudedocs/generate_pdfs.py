@@ -1,826 +1,1596 @@
 #!/usr/bin/env python3
-"""Generate three PDF documents for the Aba Digital Marketplace project.
-
-PDFs generated:
-    1. governor-memo.pdf   - Formal 1-page memorandum
-    2. video-script.pdf    - Presenter-friendly walkthrough script
-    3. benefits-one-pager.pdf - Strategic benefits overview (1 page)
+"""Generate the PDF documents for the Aba Digital Marketplace project.
+
+PDFs generated (targets):
+    memo      governor-memo.pdf       - Formal 1-page memorandum
+    script    video-script.pdf        - Presenter-friendly walkthrough script
+    onepager  benefits-one-pager.pdf  - Strategic benefits overview (1 page)
+    all       all three (the default)
+    batch     the --merge, --memos, --annex, --bundle, --catalog, --certificates or --report run given
+
+Usage:
+    python generate_pdfs.py [memo|script|onepager|all ...] [--jobs N] [--markdown] [--force | --no-cache]
+    python generate_pdfs.py --list                 # targets and their outputs
+    python generate_pdfs.py [TARGET ...] --dry-run # what would be rebuilt, without rendering
+    python generate_pdfs.py [batch] --merge registry.csv [--out DIR] [--jobs N]
+    python generate_pdfs.py [batch] --memos recipients.csv [--out DIR] [--jobs N]
+    python generate_pdfs.py [batch] --annex registry.csv [--out DIR]
+    python generate_pdfs.py [batch] --bundle [--merge registry.csv] [--annex registry.csv] [--out DIR]
+    python generate_pdfs.py [batch] --catalog products.csv [--chunk-pages N] [--out DIR]
+    python generate_pdfs.py [batch] --certificates registry.csv [--chunk-pages N] [--out DIR]
+    python generate_pdfs.py [batch] --report transactions.csv [--out DIR]
+    python generate_pdfs.py --lang igbo [--merge registry.csv | --memos recipients.csv | --bundle]
+    python generate_pdfs.py [TARGET | batch ...] --queue [DB] [--priority N] [--retries N]
+    python generate_pdfs.py batch --queue [DB]     # render whatever is queued
+    python generate_pdfs.py --trace trace.json     # per-helper timings
+    python generate_pdfs.py [TARGET ...] --watch   # rebuild on every source change
 
 Dependencies:
     fpdf2 >= 2.7
 """
 
+import argparse
+import ast
+import csv
+import functools
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import io
+import json
+import linecache
+import os
+import re
+import sys
+import time
+import traceback
+import types
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import nullcontext, redirect_stdout
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterable, Iterator
+
+import pdf_optimize
+from pdf_merge import PdfMerger
+from render_trace import TRACER
+
+if TYPE_CHECKING:
+    from fpdf import FPDF
 
-from fpdf import FPDF
+    from render_queue import QueuedJob, RenderQueue
 
 OUTPUT_DIR = Path(__file__).resolve().parent
 
-# Color constants
-NAVY = (0, 40, 104)       # #002868
-GOLD = (201, 162, 39)     # #C9A227
-BLACK = (0, 0, 0)
-DARK_GRAY = (50, 50, 50)
-MEDIUM_GRAY = (100, 100, 100)
-LIGHT_GRAY = (200, 200, 200)
-WHITE = (255, 255, 255)
-RULE_GRAY = (180, 180, 180)
+# Losslessly shrink every PDF before it is written (see pdf_optimize).
+OPTIMIZE_OUTPUT = True
+
+# Creation date written into every PDF; None stamps the time of rendering.
+# --reproducible fixes it, so identical inputs render identical bytes.
+CREATION_DATE: datetime | None = None
+
+# Creation date of reproducible output when SOURCE_DATE_EPOCH is not set:
+# the date line of the governor memo.
+REPRODUCIBLE_DATE = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+# Memoize multi_cell line breaks (see layout_cache); --no-layout-cache turns it off.
+LAYOUT_CACHING = True
+
+# Output file names of the standard documents, by generator name.
+DEFAULT_FILENAMES = {
+    "memo": "governor-memo.pdf",
+    "script": "video-script.pdf",
+    "onepager": "benefits-one-pager.pdf",
+    "memo-md": "governor-memo.pdf",
+    "script-md": "video-script.pdf",
+}
+
+# Columns read from the Ariaria trader registry (CSV header or JSONL keys).
+# ``shop_id`` and ``shop_name`` are required; the rest are optional. A
+# ``photo`` column (a path relative to the registry, see ``iter_traders``)
+# adds the shop's photo to its one-pager. It is deliberately not listed
+# here, so render_service requests cannot make it read local files.
+REGISTRY_FIELDS = (
+    "shop_id", "shop_name", "owner", "market", "line", "category", "nin_verified", "monthly_volume",
+)
+
+# Languages of the marketplace's AI assistant (AI_LANGUAGES in src/App.jsx).
+# Localized documents embed Unicode fonts so their diacritics render.
+LANGUAGES = {
+    "igbo": {"name": "Igbo", "greeting": "Nnọọ", "thanks": "Daalụ"},
+    "yoruba": {"name": "Yoruba", "greeting": "Ẹ káàbọ̀", "thanks": "Ẹ ṣeun"},
+    "hausa": {"name": "Hausa", "greeting": "Sannu", "thanks": "Na gode"},
+    "pidgin": {"name": "Pidgin", "greeting": "How far", "thanks": "Thank you o"},
+    "english": {"name": "English", "greeting": "Welcome", "thanks": "Thank you"},
+}
+
+
+# Columns of a product export (CSV header or JSONL keys), read by the
+# catalog. Rows come grouped by ``market`` and then ``category``; products
+# without either are listed under "Other markets" or "Uncategorized".
+# ``image`` is optional: the path of the product photo, relative to the export.
+PRODUCT_FIELDS = ("sku", "product", "shop_id", "shop_name", "market", "category", "price", "unit", "image")
+
+
+def _slug(value: str) -> str:
+    """Lower-case ``value`` and collapse anything non-alphanumeric to dashes."""
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+
+
+def seller_url(trader: dict[str, str]) -> str:
+    """Return the madeinaba.net seller page for a registry row."""
+    return f"madeinaba.net/sellers/{_slug(trader['shop_id'])}"
+
+
+# Where a generator writes its PDF: a file path or any writable binary stream
+# (an open file, ``io.BytesIO``, an HTTP response body, a zip member, ...).
+PdfOutput = Path | str | BinaryIO
+
+
+def reproducible_date() -> datetime:
+    """Return the creation date of reproducible output.
+
+    Follows the reproducible-builds convention: ``SOURCE_DATE_EPOCH`` (for
+    example the last commit's timestamp) when set, else ``REPRODUCIBLE_DATE``.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    return datetime.fromtimestamp(int(epoch), timezone.utc) if epoch else REPRODUCIBLE_DATE
+
+
+def pdf_bytes(pdf: "FPDF") -> bytes:
+    """Return fpdf's output for ``pdf``, stamped with ``CREATION_DATE`` if one is set."""
+    if CREATION_DATE is not None:
+        # The file /ID is derived from the content and this date, so it is fixed too.
+        pdf.set_creation_date(CREATION_DATE)
+    return bytes(pdf.output())
+
+
+def write_pdf(pdf: "FPDF", output: PdfOutput) -> PdfOutput:
+    """Serialize ``pdf`` to ``output`` and return ``output``."""
+    data = pdf_bytes(pdf)
+    if OPTIMIZE_OUTPUT:
+        data = pdf_optimize.optimize(data)
+    if isinstance(output, (str, os.PathLike)):
+        Path(output).write_bytes(data)
+    else:
+        output.write(data)
+    return output
+
+
+def pdf_merger(output: BinaryIO) -> PdfMerger:
+    """Return a merger writing to ``output``, optimized like ``write_pdf`` output.
+
+    For documents rendered in chunks of pages (see ``pdf_merge``); each
+    chunk is appended as ``pdf_bytes(chunk)``.
+    """
+    return PdfMerger(output, optimize=OPTIMIZE_OUTPUT)
+
+
+# ---------------------------------------------------------------------------
+# Render modules, loaded on demand
+# ---------------------------------------------------------------------------
+
+# Seconds spent importing documents.py (and with it fpdf2), once it is loaded.
+RENDER_IMPORT_SECONDS: float | None = None
+
+
+@functools.lru_cache(maxsize=None)
+def _documents() -> types.ModuleType:
+    """Import the fpdf2-based drawing code on first use, timing the import.
+
+    --list, --dry-run and fully up-to-date runs never call this, so they
+    start without loading fpdf2 and fontTools.
+    """
+    global RENDER_IMPORT_SECONDS
+    start = time.perf_counter()
+    import documents
+
+    if not LAYOUT_CACHING:
+        import layout_cache
+
+        layout_cache.uninstall()
+    RENDER_IMPORT_SECONDS = time.perf_counter() - start
+    return documents
+
+
+def __getattr__(name: str) -> Any:
+    # Generators, styles and colors moved to documents.py; importers of this
+    # module still reach them here, at the cost of loading fpdf2.
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        return getattr(_documents(), name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def format_startup(seconds: float) -> str:
+    """Summarize startup cost, e.g. ``Startup: 41 ms; render modules loaded in 290 ms``."""
+    if RENDER_IMPORT_SECONDS is None:
+        loaded = "render modules not loaded"
+    else:
+        loaded = f"render modules loaded in {RENDER_IMPORT_SECONDS * 1000:.0f} ms"
+    return f"Startup: {seconds * 1000:.0f} ms; {loaded}"
 
 
 # ---------------------------------------------------------------------------
-# PDF 1: Governor Memo
+# Batch rendering
 # ---------------------------------------------------------------------------
 
-def generate_governor_memo() -> None:
-    """Generate a clean, formal 1-page memorandum PDF."""
-    pdf = FPDF(orientation="P", unit="mm", format="A4")
-    pdf.set_auto_page_break(auto=False)
-    pdf.add_page()
-    pdf.set_margins(25, 20, 25)
-
-    usable_w = 210 - 50  # page width minus left+right margins
-
-    # --- MEMORANDUM header ---
-    pdf.set_font("Helvetica", "B", 20)
-    pdf.set_text_color(*BLACK)
-    pdf.set_xy(25, 18)
-    pdf.cell(usable_w, 10, "MEMORANDUM", align="C", new_x="LMARGIN", new_y="NEXT")
-
-    # Horizontal rule
-    y_rule = pdf.get_y() + 2
-    pdf.set_draw_color(*RULE_GRAY)
-    pdf.set_line_width(0.5)
-    pdf.line(25, y_rule, 185, y_rule)
-    pdf.set_y(y_rule + 4)
-
-    # --- TO / FROM / DATE / RE fields ---
-    def _field(label: str, value: str) -> None:
-        x_start = 25
-        pdf.set_x(x_start)
-        pdf.set_font("Helvetica", "B", 10)
-        pdf.cell(18, 5, label, new_x="END")
-        pdf.set_font("Helvetica", "", 10)
-        pdf.multi_cell(usable_w - 18, 5, value, new_x="LMARGIN", new_y="NEXT")
-
-    _field("TO:", "His Excellency Dr. Alex Chioma Otti, OFR, Executive Governor of Abia State")
-    pdf.set_y(pdf.get_y() + 1)
-    _field("FROM:", "Stringz Technologies LLC")
-    pdf.set_y(pdf.get_y() + 1)
-    _field("DATE:", "February 2026")
-    pdf.set_y(pdf.get_y() + 1)
-    _field("RE:", "Proposal for a 90-Day Pilot -- Aba Digital Marketplace (madeinaba.net)")
-
-    # Second rule
-    y_rule2 = pdf.get_y() + 3
-    pdf.line(25, y_rule2, 185, y_rule2)
-    pdf.set_y(y_rule2 + 5)
-
-    # --- Body helper ---
-    body_size = 9.5
-    line_h = 4.2
-
-    def _body(text: str) -> None:
-        pdf.set_font("Helvetica", "", body_size)
-        pdf.set_text_color(*DARK_GRAY)
-        pdf.set_x(25)
-        pdf.multi_cell(usable_w, line_h, text, new_x="LMARGIN", new_y="NEXT")
-        pdf.set_y(pdf.get_y() + 2)
-
-    def _section_header(text: str) -> None:
-        pdf.set_font("Helvetica", "B", body_size)
-        pdf.set_text_color(*BLACK)
-        pdf.set_x(25)
-        # Print header inline then continue with body
-        pdf.cell(pdf.get_string_width(text) + 1, line_h, text, new_x="END")
-
-    def _section_body_inline(text: str) -> None:
-        """Continue on the same line after a bold header."""
-        pdf.set_font("Helvetica", "", body_size)
-        pdf.set_text_color(*DARK_GRAY)
-        remaining_w = 185 - pdf.get_x()
-        # Use multi_cell for wrapping from current position
-        pdf.multi_cell(remaining_w, line_h, text, new_x="LMARGIN", new_y="NEXT")
-        pdf.set_y(pdf.get_y() + 1.5)
-
-    def _body_full(text: str) -> None:
-        pdf.set_font("Helvetica", "", body_size)
-        pdf.set_text_color(*DARK_GRAY)
-        pdf.set_x(25)
-        pdf.multi_cell(usable_w, line_h, text, new_x="LMARGIN", new_y="NEXT")
-        pdf.set_y(pdf.get_y() + 1.5)
-
-    def _bullet(text: str) -> None:
-        pdf.set_font("Helvetica", "", body_size)
-        pdf.set_text_color(*DARK_GRAY)
-        pdf.set_x(30)
-        pdf.cell(5, line_h, "-", new_x="END")
-        pdf.multi_cell(usable_w - 10, line_h, text, new_x="LMARGIN", new_y="NEXT")
-
-    # Salutation
-    pdf.set_font("Helvetica", "", body_size)
-    pdf.set_text_color(*DARK_GRAY)
-    pdf.set_x(25)
-    pdf.cell(usable_w, line_h, "Your Excellency,", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_y(pdf.get_y() + 2)
-
-    _body_full(
-        "We write to present a ready-to-deploy digital marketplace platform purpose-built "
-        "for Aba's trading economy. A five-minute video walkthrough accompanies this memo. "
-        "We respectfully request your consideration of a structured pilot that would make "
-        "Abia the first Nigerian state to operate a government-backed digital marketplace at scale."
-    )
-
-    # The Opportunity
-    _section_header("The Opportunity.")
-    _section_body_inline(
-        " Aba's markets generate an estimated 144 billion naira in annual trade volume, yet "
-        "virtually none of this commerce is visible online. Across Ariaria International Market "
-        "alone, over 70,000 shops and 160,000 artisans operate without a digital registry, without "
-        "e-commerce infrastructure, and almost entirely on cash. Buyers who would purchase Aba-made "
-        "goods -- across Nigeria and the diaspora -- simply cannot find them. This is a solvable problem."
-    )
-
-    # What We Have Built
-    _section_header("What We Have Built.")
-    _section_body_inline(
-        " At our own cost, Stringz Technologies has designed and developed a working prototype of "
-        "the Aba Digital Marketplace, accessible at madeinaba.net. The platform enables trader "
-        "onboarding, product listing, buyer discovery, and a real-time government analytics dashboard. "
-        "Critically, it is built for Aba's traders as they are today: the system operates via WhatsApp, "
-        "USSD, and web, so traders do not need smartphones or technical literacy to participate. The "
-        "enclosed video walkthrough demonstrates the full platform in under five minutes."
-    )
-
-    # The Ask
-    _section_header("The Ask.")
-    _section_body_inline(
-        " We propose a 90-day pilot scoped to a single market zone -- the A-Line section of Ariaria "
-        "-- with milestone-based funding of 100 million naira, disbursed against verified deliverables:"
-    )
-
-    _bullet("Day 30: 500 verified traders onboarded, 2,000+ products live on the platform")
-    _bullet(
-        "Day 90: 2,000 verified traders, 10,000+ products, and a live government dashboard "
-        "reporting trade activity, trader data, and market analytics"
-    )
-    pdf.set_y(pdf.get_y() + 1)
-
-    _body_full(
-        "Payments would be tied to the achievement of each milestone. If deliverables are not met, "
-        "remaining funds are not disbursed."
-    )
-
-    # Why Now
-    _section_header("Why Now.")
-    _section_body_inline(
-        " Three conditions make this the right moment. First, the Phase II reconstruction of the "
-        "A-Line market creates a natural integration point -- digital infrastructure alongside "
-        "physical rebuilding. Second, the Government of Abia Digital Agency (GADA) already exists "
-        "as the institutional home for this initiative. Third, no other Nigerian state has moved on "
-        "this; Abia has the opportunity to lead. Conservative revenue projections place the platform's "
-        "potential at 107 to 178 million naira annually within the first two years through listing "
-        "fees, promotion tools, and transaction services."
-    )
-
-    # Request
-    _section_header("Request.")
-    _section_body_inline(
-        " We respectfully request an audience with Your Excellency or your designated representative "
-        "to present the platform in detail and discuss pilot terms. We are prepared to begin within "
-        "30 days of approval."
-    )
-
-    _body_full(
-        "We thank Your Excellency for your time and your continued commitment to the economic "
-        "transformation of Abia State."
-    )
-
-    # Closing
-    pdf.set_y(pdf.get_y() + 3)
-    pdf.set_font("Helvetica", "", body_size)
-    pdf.set_text_color(*DARK_GRAY)
-    pdf.set_x(25)
-    pdf.cell(usable_w, line_h, "Respectfully submitted,", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_y(pdf.get_y() + 4)
-    pdf.set_font("Helvetica", "B", body_size)
-    pdf.set_text_color(*BLACK)
-    pdf.set_x(25)
-    pdf.cell(usable_w, line_h, "Stringz Technologies LLC", new_x="LMARGIN", new_y="NEXT")
-
-    output_path = OUTPUT_DIR / "governor-memo.pdf"
-    pdf.output(str(output_path))
-    print(f"  [OK] {output_path.name}")
+# Documents built by a plain run, and with --markdown.
+STANDARD_DOCUMENTS = ("memo", "script", "onepager")
+MARKDOWN_VARIANTS = {"memo": "memo-md", "script": "script-md"}
+
+# A render job is a generator name plus keyword arguments, so per-recipient
+# variants can be queued alongside the three standard documents.
+RenderJob = tuple[str, dict[str, Any]]
+
+
+@dataclass
+class RenderResult:
+    """Outcome of a single render job, as collected by the batch runner."""
+
+    name: str
+    ok: bool
+    seconds: float
+    output: str = ""
+    error: str = ""
+    reason: str = ""
+    skipped: bool = False
+    layout_hits: int = 0
+    layout_misses: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+
+def job_output(job: RenderJob) -> Path:
+    """Return the file a render job writes to."""
+    name, kwargs = job
+    return Path(kwargs.get("output") or OUTPUT_DIR / DEFAULT_FILENAMES[name])
+
+
+def _run_job(job: RenderJob) -> RenderResult:
+    """Run one render job, capturing failures instead of raising."""
+    name, kwargs = job
+    documents = _documents()
+    layout = documents.LAYOUT_CACHE
+    hits, misses = layout.hits, layout.misses
+    bytes_in, bytes_out = pdf_optimize.OPTIMIZER.bytes_in, pdf_optimize.OPTIMIZER.bytes_out
+    start = time.perf_counter()
+    try:
+        with TRACER.trace_document(job_output(job).name) if TRACER.enabled else nullcontext():
+            output = documents.GENERATORS[name](**kwargs)
+    except Exception:  # noqa: BLE001 - reported in the batch summary
+        result = RenderResult(
+            name, False, time.perf_counter() - start,
+            output=str(job_output(job)), error=traceback.format_exc(),
+        )
+    else:
+        result = RenderResult(name, True, time.perf_counter() - start, output=str(output))
+    result.layout_hits = layout.hits - hits
+    result.layout_misses = layout.misses - misses
+    result.bytes_in = pdf_optimize.OPTIMIZER.bytes_in - bytes_in
+    result.bytes_out = pdf_optimize.OPTIMIZER.bytes_out - bytes_out
+    return result
+
+
+def format_layout_stats(hits: int, misses: int) -> str:
+    """Summarize layout cache lookups, e.g. ``Layout cache: 90 hits / 10 misses (90.0%)``."""
+    lookups = hits + misses
+    rate = 100 * hits / lookups if lookups else 0.0
+    return f"Layout cache: {hits:,} hits / {misses:,} misses ({rate:.1f}%)"
+
+
+def format_size_change(bytes_in: int, bytes_out: int) -> str:
+    """Summarize the optimizer's effect, e.g. ``3,342 -> 2,783 bytes (-16.7%)``."""
+    saved = 100 * (bytes_out - bytes_in) / bytes_in if bytes_in else 0.0
+    return f"{bytes_in:,} -> {bytes_out:,} bytes ({saved:+.1f}%)"
+
+
+def iter_render_results(
+    jobs: Iterable[RenderJob], workers: int = 1, cache: "BuildCache | None" = None,
+) -> Iterator[RenderResult]:
+    """Render jobs, yielding results as they complete.
+
+    With ``workers > 1`` jobs run in a process pool. At most ``2 * workers``
+    jobs are in flight at once, so ``jobs`` may be a lazy iterator of any length.
+    With a ``cache``, up-to-date jobs are yielded as skipped without rendering.
+    """
+    planned = cache.plan(jobs) if cache is not None else jobs
+
+    def _finish(result: RenderResult) -> RenderResult:
+        return cache.record(result) if cache is not None else result
+
+    if workers <= 1:
+        for item in planned:
+            yield item if isinstance(item, RenderResult) else _finish(_run_job(item))
+        return
+
+    # Imported here: the process pool machinery is a noticeable share of startup.
+    from concurrent.futures import ProcessPoolExecutor
+
+    pending: set[Future] = set()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for item in planned:
+            if isinstance(item, RenderResult):
+                yield item
+                continue
+            # Workers forked after this inherit the render modules already loaded.
+            _documents()
+            pending.add(pool.submit(_run_job, item))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _finish(future.result())
+        for future in wait(pending).done:
+            yield _finish(future.result())
+
+
+def print_summary(results: list[RenderResult], wall_seconds: float) -> None:
+    """Print per-document status lines followed by failure details."""
+    for result in results:
+        name = Path(result.output).name
+        if result.skipped:
+            print(f"  [SKIP] {name}  ({result.reason})")
+        elif result.ok:
+            reason = f", {result.reason}" if result.reason else ""
+            size = f", {format_size_change(result.bytes_in, result.bytes_out)}" if result.bytes_in else ""
+            print(f"  [OK] {name}  ({result.seconds:.2f}s{reason}{size})")
+        else:
+            print(f"  [FAIL] {name}  ({result.seconds:.2f}s)")
+    failures = [r for r in results if not r.ok]
+    for result in failures:
+        print(f"\n--- {result.name} ---\n{result.error.rstrip()}")
+    skipped = sum(r.skipped for r in results)
+    print(
+        f"\n{len(results) - len(failures) - skipped} rebuilt, {skipped} up to date, "
+        f"{len(failures)} failed in {wall_seconds:.2f}s"
+    )
+    print(format_layout_stats(
+        sum(r.layout_hits for r in results), sum(r.layout_misses for r in results),
+    ))
+    bytes_in = sum(r.bytes_in for r in results)
+    if bytes_in:
+        print(f"Output size: {format_size_change(bytes_in, sum(r.bytes_out for r in results))}")
 
 
 # ---------------------------------------------------------------------------
-# PDF 2: Video Script
+# Incremental build cache
 # ---------------------------------------------------------------------------
 
-def generate_video_script() -> None:
-    """Generate a presenter-friendly video walkthrough script PDF."""
-    pdf = FPDF(orientation="P", unit="mm", format="A4")
-    pdf.set_auto_page_break(auto=True, margin=20)
-    pdf.set_margins(20, 20, 20)
-    usable_w = 210 - 40
-
-    pdf.add_page()
-
-    # --- Title page header ---
-    pdf.set_font("Helvetica", "B", 22)
-    pdf.set_text_color(*NAVY)
-    pdf.cell(usable_w, 12, "VIDEO WALKTHROUGH SCRIPT", align="C", new_x="LMARGIN", new_y="NEXT")
-    pdf.set_y(pdf.get_y() + 2)
-
-    pdf.set_font("Helvetica", "", 12)
-    pdf.set_text_color(*MEDIUM_GRAY)
-    pdf.cell(
-        usable_w, 7,
-        "Aba Digital Marketplace -- Presentation to HE Governor Alex Otti",
-        align="C", new_x="LMARGIN", new_y="NEXT",
-    )
-    pdf.set_y(pdf.get_y() + 1)
-
-    pdf.set_font("Helvetica", "I", 9)
-    pdf.set_text_color(*MEDIUM_GRAY)
-    pdf.cell(
-        usable_w, 5,
-        "Site: madeinaba.net  |  Access Code: StringzAbia2026  |  Target Runtime: 4-5 minutes",
-        align="C", new_x="LMARGIN", new_y="NEXT",
-    )
-
-    # Rule
-    pdf.set_y(pdf.get_y() + 4)
-    pdf.set_draw_color(*NAVY)
-    pdf.set_line_width(0.8)
-    pdf.line(20, pdf.get_y(), 190, pdf.get_y())
-    pdf.set_y(pdf.get_y() + 6)
-
-    # --- Helper functions ---
-    def _section_header(number: int, title: str, timestamp: str) -> None:
-        """Print section header like SECTION 1: OPENING [0:00 - 0:30]"""
-        # Check if we need a new page (need at least 40mm for header + some content)
-        if pdf.get_y() > 250:
-            pdf.add_page()
-        pdf.set_font("Helvetica", "B", 13)
-        pdf.set_text_color(*NAVY)
-        pdf.set_x(20)
-        text = f"SECTION {number}: {title}  [{timestamp}]"
-        pdf.cell(usable_w, 8, text, new_x="LMARGIN", new_y="NEXT")
-        pdf.set_y(pdf.get_y() + 1)
-        # Thin rule under section header
-        pdf.set_draw_color(*GOLD)
-        pdf.set_line_width(0.4)
-        pdf.line(20, pdf.get_y(), 100, pdf.get_y())
-        pdf.set_y(pdf.get_y() + 4)
-
-    def _screen_direction(text: str) -> None:
-        """Print screen direction in italic gray."""
-        pdf.set_font("Helvetica", "I", 9)
-        pdf.set_text_color(*MEDIUM_GRAY)
-        pdf.set_x(25)
-        pdf.multi_cell(usable_w - 10, 4.5, text, new_x="LMARGIN", new_y="NEXT")
-        pdf.set_y(pdf.get_y() + 2)
-
-    def _narration(text: str) -> None:
-        """Print spoken narration in normal black text."""
-        pdf.set_font("Helvetica", "", 10)
-        pdf.set_text_color(*DARK_GRAY)
-        pdf.set_x(20)
-        pdf.multi_cell(usable_w, 5, text, new_x="LMARGIN", new_y="NEXT")
-        pdf.set_y(pdf.get_y() + 2)
-
-    def _narration_bold_phrase(parts: list[tuple[str, bool]]) -> None:
-        """Print narration with mixed bold/normal segments using multi_cell with markdown."""
-        pdf.set_font("Helvetica", "", 10)
-        pdf.set_text_color(*DARK_GRAY)
-        pdf.set_x(20)
-        # Build markdown string for fpdf2
-        md_text = ""
-        for text, bold in parts:
-            if bold:
-                md_text += f"**{text}**"
+MANIFEST_PATH = OUTPUT_DIR / "build" / "manifest.json"
+
+# Files a generator fingerprint can depend on: the generator code and
+# Markdown copy here, and the images under public/images.
+FINGERPRINT_INPUTS = (OUTPUT_DIR, OUTPUT_DIR.parent / "public" / "images")
+
+
+@functools.lru_cache(maxsize=None)
+def source_stamp() -> str:
+    """Summarize the size and mtime of every fingerprint input and of the installed fpdf2.
+
+    Nothing is read or imported, so this is cheap. While the stamp matches
+    the one in the manifest, the generator fingerprints stored next to it
+    are reused instead of loading the render modules to recompute them.
+    """
+    digest = hashlib.sha256()
+    spec = importlib.util.find_spec("fpdf")
+    fpdf_dir = Path(spec.origin).parent if spec and spec.origin else None
+    paths = [path for directory in FINGERPRINT_INPUTS for path in directory.glob("*") if path.suffix != ".pdf"]
+    if fpdf_dir is not None:
+        paths += fpdf_dir.glob("*.py")
+    for path in sorted(paths):
+        if path.is_file():
+            stat = path.stat()
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _referenced_names(code: types.CodeType) -> set[str]:
+    """Collect global names used by ``code`` and any nested functions."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _referenced_names(const)
+    return names
+
+
+@functools.lru_cache(maxsize=8)
+def _top_level_sources(path: str, mtime_ns: int) -> dict[str, str]:
+    """Map each top-level function and class of the module at ``path`` to its source.
+
+    ``inspect.getsource`` re-parses the whole module for every class; this
+    parses it once per modification and yields the same text.
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    lines = text.splitlines(keepends=True)
+    sources = {}
+    for node in ast.parse(text).body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            first = min([node.lineno, *(decorator.lineno for decorator in node.decorator_list)])
+            sources[node.name] = "".join(lines[first - 1:node.end_lineno])
+    return sources
+
+
+def _source_of(obj: Callable[..., Any]) -> str:
+    """Return the source of a module-level function or class."""
+    path = getattr(sys.modules.get(obj.__module__), "__file__", None)
+    if path:
+        source = _top_level_sources(path, os.stat(path).st_mtime_ns).get(obj.__name__)
+        if source is not None:
+            return source
+    return inspect.getsource(obj)
+
+
+def _referenced_names_of(obj: Callable[..., Any]) -> set[str]:
+    """Collect global names used by a function or by every method of a class."""
+    if inspect.isclass(obj):
+        names: set[str] = set()
+        for member in vars(obj).values():
+            if inspect.isfunction(member):
+                names |= _referenced_names(inspect.unwrap(member).__code__)
+        return names
+    return _referenced_names(obj.__code__)
+
+
+@functools.lru_cache(maxsize=None)
+def generator_fingerprint(name: str) -> str:
+    """Hash everything a generator's output depends on besides its arguments.
+
+    That is the fpdf2 version, the generator's source (which holds its text
+    content), the source of module-level helpers and styles it uses, the module-level
+    constants it reads (colors, sizes) and the bytes of its assets.
+    """
+    documents = _documents()
+    digest = hashlib.sha256(f"fpdf2 {documents.FPDF_VERSION}\n".encode())
+    module_globals = vars(documents)
+    seen: set[str] = set()
+    stack = [documents.GENERATORS[name]]
+    while stack:
+        obj = stack.pop()
+        digest.update(_source_of(obj).encode())
+        for ref in sorted(_referenced_names_of(obj) - seen):
+            seen.add(ref)
+            value = module_globals.get(ref)
+            if (inspect.isfunction(value) or inspect.isclass(value)) and value.__module__ == documents.__name__:
+                stack.append(value)
+            elif isinstance(value, (str, int, float, tuple, dict)):
+                digest.update(f"{ref}={value!r}\n".encode())
+    for asset in documents.GENERATOR_ASSETS.get(name, ()):
+        digest.update(asset.read_bytes())
+    return digest.hexdigest()
+
+
+def job_key(job: RenderJob, fingerprint: str | None = None) -> str:
+    """Return the content hash identifying a render job's inputs."""
+    name, kwargs = job
+    arguments = json.dumps(kwargs, sort_keys=True, default=str)
+    if CREATION_DATE is not None:
+        # Reproducible output differs from timestamped output.
+        arguments += f"\ncreated {CREATION_DATE.isoformat()}"
+    if not OPTIMIZE_OUTPUT:
+        arguments += "\nunoptimized"
+    photo = (kwargs.get("trader") or {}).get("photo")
+    if photo:
+        # Read by path, so a replaced photo must change the key too.
+        try:
+            stat = os.stat(photo)
+            arguments += f"\nphoto {stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            pass
+    fingerprint = fingerprint or generator_fingerprint(name)
+    return hashlib.sha256(f"{fingerprint}\n{arguments}".encode()).hexdigest()
+
+
+class BuildCache:
+    """Skip documents whose inputs are unchanged since they were last built.
+
+    The manifest maps each output file to the input hash it was built from,
+    and records which documents the most recent run rebuilt and why. It also
+    keeps the generator fingerprints under the ``source_stamp`` they were
+    computed at, so checking an unchanged tree needs no render modules.
+    """
+
+    def __init__(self, path: Path = MANIFEST_PATH, force: bool = False) -> None:
+        self.path = path
+        self.force = force
+        try:
+            manifest = json.loads(path.read_text())
+            self.documents: dict[str, dict[str, str]] = manifest["documents"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            manifest, self.documents = {}, {}
+        self.fpdf2: str | None = manifest.get("fpdf2")
+        stored = manifest.get("fingerprints", {})
+        self.fingerprints: dict[str, str] = (
+            dict(stored.get("generators", {})) if stored.get("stamp") == source_stamp() else {}
+        )
+        self.rebuilt: dict[str, str] = {}
+        self.skipped = 0
+        self._planned: dict[str, tuple[str, str]] = {}
+
+    def fingerprint(self, name: str) -> str:
+        """Return generator ``name``'s fingerprint, recomputing it only after a source change."""
+        if name not in self.fingerprints:
+            self.fingerprints[name] = generator_fingerprint(name)
+            self.fpdf2 = _documents().FPDF_VERSION
+        return self.fingerprints[name]
+
+    def stale_reason(self, job: RenderJob, key: str) -> str | None:
+        """Return why ``job`` must be rebuilt, or None if its output is current."""
+        entry = self.documents.get(str(job_output(job)))
+        if self.force:
+            return "forced"
+        if entry is None:
+            return "not built before"
+        if entry["key"] != key:
+            return "inputs changed"
+        if not job_output(job).exists():
+            return "output missing"
+        return None
+
+    def plan(self, jobs: Iterable[RenderJob]) -> Iterator[RenderJob | RenderResult]:
+        """Yield jobs that need rendering and skipped results for the rest."""
+        for job in jobs:
+            key = job_key(job, self.fingerprint(job[0]))
+            output = str(job_output(job))
+            reason = self.stale_reason(job, key)
+            if reason is None:
+                self.skipped += 1
+                yield RenderResult(job[0], True, 0.0, output=output, reason="up to date", skipped=True)
             else:
-                md_text += text
-        pdf.multi_cell(usable_w, 5, md_text, new_x="LMARGIN", new_y="NEXT", markdown=True)
-        pdf.set_y(pdf.get_y() + 2)
-
-    def _spacer(h: float = 3) -> None:
-        pdf.set_y(pdf.get_y() + h)
-
-    # ===== SECTION 1: OPENING =====
-    _section_header(1, "OPENING", "0:00 - 0:30")
-    _screen_direction("FACE TO CAMERA -- Clean background. Professional but warm. Look directly at the lens.")
-    _narration("Good day, Your Excellency.")
-    _narration("My name is [PRESENTER NAME], and I lead the team at Stringz Technologies.")
-    _narration_bold_phrase([
-        ("I want to take ", False), ("four minutes", True),
-        (" of your time to show you something we built -- specifically for Abia State.", False),
-    ])
-    _narration_bold_phrase([
-        ("We spent months studying Aba's markets, talking to traders, reading the data. "
-         "And we believe there is an opportunity here that ", False),
-        ("no other state in Nigeria has captured yet", True), (".", False),
-    ])
-    _narration("What I am about to show you is live, right now, at madeinaba.net.")
-    _narration("Let me walk you through it.")
-
-    # ===== SECTION 2: THE PROBLEM AND THE RESEARCH =====
-    _section_header(2, "THE PROBLEM AND THE RESEARCH", "0:30 - 1:30")
-    _screen_direction(
-        "Switch to screen share. Browser is open to madeinaba.net. Enter the access code: "
-        "StringzAbia2026. The Overview screen loads."
-    )
-    _screen_direction(
-        "The Research Foundation screen is now visible. Scroll slowly past the Governor's "
-        "photo and vision statement at the top."
-    )
-    _narration_bold_phrase([
-        ("Your Excellency, this entire proposal is built on evidence. Not assumptions -- ", False),
-        ("research", True), (".", False),
-    ])
-    _screen_direction(
-        "Pause on the KEY RESEARCH FINDINGS stat cards -- 37,000 shops, N144B trade volume, "
-        "110,000+ shoemakers, 50,000+ garment makers."
-    )
-    _narration_bold_phrase([
-        ("Look at these numbers. Ariaria alone has ", False),
-        ("37,000 shops", True),
-        (". Aba's annual trade is estimated at ", False),
-        ("one hundred and forty-four billion naira", True),
-        (". There are over ", False),
-        ("110,000 shoemakers", True),
-        (" and 50,000 garment makers. This is a manufacturing city.", False),
-    ])
-    _narration("But here is the problem.")
-    _screen_direction("Scroll down to THE POWER CRISIS section with the red-bordered stats.")
-    _narration_bold_phrase([
-        ("32,000 of those shops had no power after the failed 2019 solar project. Traders spend ", False),
-        ("one billion naira a year", True),
-        (" just on generators. And despite all of this activity, Abia ranked ", False),
-        ("35th out of 37 states", True), (" in economic growth.", False),
-    ])
-    _narration("The talent is there. The products are there. The infrastructure is not.")
-    _screen_direction("Scroll down to WHAT ABA TRADERS ARE SAYING -- the trader quotes section.")
-    _narration_bold_phrase([
-        ("And these are not our words. These are ", False),
-        ("real traders, real quotes", True),
-        (", gathered from investigative journalism.", False),
-    ])
-    _screen_direction("Pause briefly on Joseph Nmeri's quote about labeling shoes \"Made in China.\"")
-    _narration_bold_phrase([
-        ("This man, Joseph Nmeri -- Chairman of the Power Line Shoe Manufacturers -- said his "
-         "members were ", False),
-        ("forced to label their shoes \"Made in China\"", True),
-        (" because customers would not buy shoes labeled \"Made in Aba.\"", False),
-    ])
-    _narration_bold_phrase([
-        ("That is the problem we are solving. ", False),
-        ("Visibility. Trust. Access.", True),
-    ])
-
-    # ===== SECTION 3: THE SOLUTION =====
-    _section_header(3, "THE SOLUTION", "1:30 - 2:30")
-    _screen_direction("Click the \"Why Aba\" tab in the navigation.")
-    _screen_direction(
-        "Scroll past the hero section to \"THE PROBLEM: INVISIBLE ECONOMY\" -- the two-column comparison."
-    )
-    _narration_bold_phrase([
-        ("Your Excellency, this is what we call the ", False),
-        ("invisible economy", True),
-        (". On the left -- today's reality. No trader registry. Cash only. No audit trail. "
-         "Revenue leakage everywhere. Buyers have to ", False),
-        ("physically travel to Aba", True),
-        (" to buy anything.", False),
-    ])
-    _narration_bold_phrase([
-        ("On the right -- what a digital layer creates. NIN-verified traders. Escrow payments. "
-         "A real-time dashboard. Online catalog. ", False),
-        ("For the first time, the government can actually see what is happening in its own markets.", True),
-    ])
-    _screen_direction("Scroll to the thesis statement card -- the one highlighted in blue.")
-    _narration("This is the core idea. Read it with me:")
-    _narration_bold_phrase([
-        ("\"A digital layer turns informal trade into visible economic infrastructure -- "
-         "measurable, taxable, and investable.\"", True),
-    ])
-    _narration("That is what this platform does.")
-    _screen_direction(
-        "Scroll down to \"WHY NOT JUST USE JUMIA OR INSTAGRAM?\" -- the four-column comparison."
-    )
-    _narration("Now, someone will ask -- why not just use Jumia? Why not Instagram?")
-    _narration_bold_phrase([
-        ("Here is the difference. Jumia takes ", False),
-        ("15 to 25 percent commission", True),
-        (". Instagram has no escrow, no verification, no data. Neither of them gives "
-         "government anything.", False),
-    ])
-    _narration_bold_phrase([
-        ("This platform is ", False),
-        ("state-owned", True),
-        (". Low fees. NIN verification. The government owns the data, owns the trader registry, "
-         "owns the infrastructure. It is not a website. ", False),
-        ("It is an economic asset.", True),
-    ])
-    _screen_direction("Scroll to the \"WHY NOW\" section showing the three timing cards.")
-    _narration_bold_phrase([
-        ("And the timing is right. ", False),
-        ("Phase II of the A-Line rebuild just flagged off.", True),
-        (" New physical infrastructure is going up -- this is the digital layer that sits on top "
-         "of it. GADA already has the mandate. And no other state has done this. ", False),
-        ("The window is open.", True),
-    ])
-
-    # ===== SECTION 4: WHAT IS ACHIEVABLE =====
-    _section_header(4, "WHAT IS ACHIEVABLE", "2:30 - 3:15")
-    _screen_direction("Click the \"Quick Wins\" tab in the navigation.")
-    _screen_direction("Pause on the 30-DAY section.")
-    _narration_bold_phrase([
-        ("Here is what we can deliver in ", False),
-        ("30 days", True),
-        (". 500 NIN-verified sellers. Over 2,000 product listings. All from the A-Line "
-         "pilot zone -- aligned with the rebuild.", False),
-    ])
-    _narration("And here is the headline that is ready for the press on Day 30:")
-    _screen_direction("Point to or highlight the green ANNOUNCEMENT READY box.")
-    _narration_bold_phrase([
-        ("\"Abia launches Nigeria's first verified trader marketplace -- 500 Aba artisans "
-         "now discoverable online.\"", True),
-    ])
-    _narration_bold_phrase([
-        ("That is an announcement ", False),
-        ("no other governor in Nigeria can make today", True),
-        (".", False),
-    ])
-    _screen_direction("Scroll down to the 90-DAY section.")
-    _narration_bold_phrase([
-        ("By Day 90 -- ", False),
-        ("2,000 verified sellers", True),
-        (". Over 10,000 product listings. Three logistics partners onboarded. And a ", False),
-        ("live government dashboard", True),
-        (" showing real-time data on traders, products, orders, and revenue.", False),
-    ])
-    _screen_direction("Scroll to \"WHAT GOVERNMENT RECEIVES AT 90 DAYS\" -- the deliverables list.")
-    _narration_bold_phrase([
-        ("At the end of 90 days, the government receives a permanent NIN-verified trader "
-         "registry, a live analytics dashboard, monthly economic reports, and a catalogued "
-         "product database. These are ", False),
-        ("state assets", True),
-        (". They do not disappear when the project ends.", False),
-    ])
-
-    # ===== SECTION 5: THE ASK =====
-    _section_header(5, "THE ASK", "3:15 - 3:45")
-    _screen_direction("Click the \"Pilot Ask\" tab in the navigation.")
-    _screen_direction("The bold N100M pilot parameters section is visible.")
-    _narration("Your Excellency, the ask is straightforward.")
-    _narration_bold_phrase([
-        ("One hundred million naira. 90 days. One market zone -- Ariaria A-Line.", True),
-    ])
-    _screen_direction("Scroll to the budget breakdown.")
-    _narration(
-        "Every naira is accounted for. Platform development and infrastructure -- 38 million. "
-        "Trader onboarding and field operations -- 22 million. Training, support and operations "
-        "-- 15 million. Marketing and activation -- 15 million. Contingency -- 10 million."
-    )
-    _screen_direction("Scroll to the milestone-based payment note.")
-    _narration_bold_phrase([
-        ("And this is ", False),
-        ("milestone-based", True),
-        (". Government pays in three tranches. 40 percent at kickoff. 30 percent at Day 30 "
-         "-- only after verified deliverables. 30 percent at Day 90. ", False),
-        ("No delivery, no payment.", True),
-    ])
-    _screen_direction(
-        "Scroll quickly past the success criteria -- 500+ traders, 2000+ products, "
-        "500+ transactions, N5M+ volume, live dashboard."
-    )
-    _narration(
-        "These are the success criteria. Clear numbers. Either we hit them, or we did not. "
-        "There is no ambiguity."
-    )
-
-    # ===== SECTION 6: THE LIVE DEMO =====
-    _section_header(6, "THE LIVE DEMO", "3:45 - 4:15")
-    _screen_direction("Click the \"Home\" tab in the navigation.")
-    _narration("Now, let me show you what this actually looks like.")
-    _screen_direction(
-        "The Home screen loads with the hero section, AI search bar, categories, and featured products."
-    )
-    _narration(
-        "This is the marketplace. Government-branded. NIN-verified sellers. Every product "
-        "shows a \"Made in Aba\" badge. Buyers can shop by category -- footwear, bags, fashion, "
-        "leather goods."
-    )
-    _screen_direction("Click the \"Products\" tab to go to the Listings screen.")
-    _narration_bold_phrase([
-        ("Here are live product listings. Real Aba products with prices, ratings, verified "
-         "seller badges. A buyer in Lagos can find and order from an Aba trader ", False),
-        ("without ever visiting Ariaria", True),
-        (".", False),
-    ])
-    _screen_direction("Click back to \"Home\" and scroll to the AI Shopping Assistant search box.")
-    _narration("And here is what makes this different from anything else in Nigeria.")
-    _screen_direction(
-        "Click the \"Igbo\" language button in the AI search. Type or show a sample query "
-        "like \"Achoro m akpukpo ukwu maka agbamakwukwo\" and press search."
-    )
-    _narration_bold_phrase([
-        ("This is an ", False),
-        ("AI shopping assistant that speaks Igbo", True),
-        (". And Yoruba. And Hausa. And Pidgin. A buyer can type \"I wan buy wedding shoe "
-         "size 43\" in Pidgin, and the AI understands, finds matching products, and suggests "
-         "options.", False),
-    ])
-    _screen_direction("Click the \"AI Platform\" tab to briefly show the WhatsApp AI demo.")
-    _narration_bold_phrase([
-        ("It works through WhatsApp too. Traders can send a product photo and the AI creates "
-         "the listing automatically. Buyers can track orders. Government officials can ", False),
-        ("ask the dashboard questions in plain English", True),
-        (" and get answers.", False),
-    ])
-    _narration_bold_phrase([("This already works.", True)])
-
-    # ===== SECTION 7: CLOSING =====
-    _section_header(7, "CLOSING", "4:15 - 4:45")
-    _screen_direction("FACE TO CAMERA -- Same setup as the opening. Calm, direct, respectful.")
-    _narration("Your Excellency, let me close with this.")
-    _narration_bold_phrase([
-        ("Abia State has the traders. It has the products. It has a governor who is already ", False),
-        ("rebuilding the physical markets", True),
-        (" through the A-Line project and the GADA mandate.", False),
-    ])
-    _narration_bold_phrase([
-        ("What is missing is the digital layer. The part that makes Aba's economy ", False),
-        ("visible to the world", True),
-        (".", False),
-    ])
-    _narration_bold_phrase([
-        ("No Nigerian state has built this.", True),
-        (" Not Lagos. Not Kano. Not Ogun. Abia can be the first. And it can be done in 90 days.", False),
-    ])
-    _narration_bold_phrase([
-        ("We are not asking you to take our word for it. We are asking for ", False),
-        ("a meeting", True),
-        (" -- 30 minutes with your team -- to walk through this in detail and answer "
-         "every question.", False),
-    ])
-    _narration_bold_phrase([
-        ("The platform is live at ", False),
-        ("madeinaba.net", True),
-        (". The research is real. The numbers are sourced. And we built this on our own, at our "
-         "own cost, because we believe in what Abia can become.", False),
-    ])
-    _narration("Thank you for your time, sir.")
-    _screen_direction(
-        "PAUSE -- Hold eye contact with the camera for two full seconds before ending the recording."
-    )
-
-    # ===== PRODUCTION NOTES =====
-    # Force new page if less than 60mm remaining
-    if pdf.get_y() > 220:
-        pdf.add_page()
-
-    _spacer(5)
-    pdf.set_draw_color(*NAVY)
-    pdf.set_line_width(0.8)
-    pdf.line(20, pdf.get_y(), 190, pdf.get_y())
-    pdf.set_y(pdf.get_y() + 5)
-
-    pdf.set_font("Helvetica", "B", 14)
-    pdf.set_text_color(*NAVY)
-    pdf.set_x(20)
-    pdf.cell(usable_w, 8, "PRODUCTION NOTES", new_x="LMARGIN", new_y="NEXT")
-    _spacer(3)
-
-    pdf.set_font("Helvetica", "B", 10)
-    pdf.set_text_color(*BLACK)
-    pdf.set_x(20)
-    pdf.cell(usable_w, 6, "Total runtime target: 4 minutes 15 seconds to 4 minutes 45 seconds",
-             new_x="LMARGIN", new_y="NEXT")
-    _spacer(3)
-
-    def _production_heading(text: str) -> None:
-        pdf.set_font("Helvetica", "B", 10)
-        pdf.set_text_color(*BLACK)
-        pdf.set_x(20)
-        pdf.cell(usable_w, 6, text, new_x="LMARGIN", new_y="NEXT")
-        pdf.set_y(pdf.get_y() + 1)
-
-    def _production_bullet(text: str) -> None:
-        pdf.set_font("Helvetica", "", 9)
-        pdf.set_text_color(*DARK_GRAY)
-        pdf.set_x(25)
-        pdf.cell(5, 4.5, "-", new_x="END")
-        pdf.multi_cell(usable_w - 10, 4.5, text, new_x="LMARGIN", new_y="NEXT")
-
-    _production_heading("Pacing guidance:")
-    _production_bullet(
-        "Do not rush sections 2 and 3. The research and the problem statement are what "
-        "build credibility. Let the numbers breathe."
-    )
-    _production_bullet(
-        "Sections 5 and 6 should be brisk. The governor already understands the value by "
-        "this point -- move with confidence."
-    )
-    _production_bullet("The closing must be slow. Every word deliberate.")
-    _spacer(2)
-
-    _production_heading("Screen recording tips:")
-    _production_bullet("Use a clean browser with no bookmarks bar, no other tabs visible.")
-    _production_bullet("Set browser zoom to 110% so text is clearly readable in the recording.")
-    _production_bullet("Scroll smoothly -- do not jump. Let the viewer read along with you.")
-    _production_bullet("When pausing on a stat or quote, give it a full 2-3 seconds of silence.")
-    _spacer(2)
-
-    _production_heading("Key phrases to emphasize (bold in script):")
-    key_phrases = [
-        "\"No other state in Nigeria has captured yet\"",
-        "\"37,000 shops\"",
-        "\"One hundred and forty-four billion naira\"",
-        "\"Forced to label their shoes Made in China\"",
-        "\"Measurable, taxable, and investable\"",
-        "\"It is an economic asset\"",
-        "\"No delivery, no payment\"",
-        "\"This already works\"",
-        "\"No Nigerian state has built this\"",
-    ]
-    for phrase in key_phrases:
-        _production_bullet(phrase)
-    _spacer(2)
+                self._planned[output] = (key, reason)
+                yield job
+
+    def planned_reason(self, job: RenderJob) -> str:
+        """Return why a job yielded by ``plan`` needs rendering."""
+        return self._planned[str(job_output(job))][1]
+
+    def record(self, result: RenderResult) -> RenderResult:
+        """Store the input hash of a rendered job and annotate its reason."""
+        key, reason = self._planned.pop(result.output, ("", ""))
+        result.reason = reason
+        if result.ok:
+            self.documents[result.output] = {"key": key, "generator": result.name}
+            self.rebuilt[result.output] = reason
+        return result
+
+    def save(self) -> None:
+        """Atomically write the manifest."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "fpdf2": self.fpdf2,
+            "documents": self.documents,
+            "fingerprints": {"stamp": source_stamp(), "generators": self.fingerprints},
+            "last_run": {
+                "finished": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "rebuilt": self.rebuilt,
+                "skipped": self.skipped,
+            },
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+        tmp.replace(self.path)
+
+
+# ---------------------------------------------------------------------------
+# Mail merge: per-trader one-pagers
+# ---------------------------------------------------------------------------
+
+MERGE_DIR = OUTPUT_DIR / "build" / "one-pagers"
+MEMO_MERGE_DIR = OUTPUT_DIR / "build" / "memos"
+LOCALIZED_DIR = OUTPUT_DIR / "build" / "localized"
+MERGE_PROGRESS_EVERY = 1000
+MERGE_MAX_REPORTED_FAILURES = 20
+
+
+def iter_registry(path: Path) -> Iterator[dict[str, str]]:
+    """Stream trader rows from a ``.csv`` or ``.jsonl`` registry, one at a time."""
+    with path.open(newline="", encoding="utf-8") as fh:
+        if path.suffix.lower() == ".jsonl":
+            for line in fh:
+                if line.strip():
+                    # A JSON null reads like a blank CSV cell.
+                    yield {key: "" if value is None else str(value) for key, value in json.loads(line).items()}
+        else:
+            yield from csv.DictReader(fh)
+
+
+def iter_traders(registry: Path) -> Iterator[dict[str, str]]:
+    """Stream registry rows, with any ``photo`` path resolved against the registry's directory."""
+    for row in iter_registry(registry):
+        if row.get("photo"):
+            row["photo"] = str(registry.parent / row["photo"])
+        yield row
+
+
+def merge_output_path(output_dir: Path, trader: dict[str, str]) -> Path:
+    """Return the one-pager file name for a registry row."""
+    return output_dir / f"benefits-{_slug(trader.get('shop_id', ''))}.pdf"
+
+
+def run_batch(jobs: Iterable[RenderJob], workers: int, cache: BuildCache | None = None) -> int:
+    """Render a lazily generated batch of jobs, reporting throughput; return the failure count."""
+    return report_batch(iter_render_results(jobs, workers, cache), cache)
+
+
+def report_batch(results: Iterable[RenderResult], cache: BuildCache | None = None) -> int:
+    """Consume a batch's results, reporting progress and throughput.
+
+    Results are counted rather than kept, so memory use does not grow with
+    the size of the batch. Returns the failure count.
+    """
+    done = failed = skipped = layout_hits = layout_misses = bytes_in = bytes_out = 0
+    failures: list[RenderResult] = []
+    start = time.perf_counter()
+    for result in results:
+        done += 1
+        skipped += result.skipped
+        layout_hits += result.layout_hits
+        layout_misses += result.layout_misses
+        bytes_in += result.bytes_in
+        bytes_out += result.bytes_out
+        if not result.ok:
+            failed += 1
+            if len(failures) < MERGE_MAX_REPORTED_FAILURES:
+                failures.append(result)
+        if done % MERGE_PROGRESS_EVERY == 0:
+            rate = done / (time.perf_counter() - start)
+            print(f"  {done:,} documents  ({rate:,.1f} docs/s)")
+            if cache is not None:
+                cache.save()
+    if cache is not None:
+        cache.save()
+
+    elapsed = time.perf_counter() - start
+    for result in failures:
+        print(f"\n--- {result.name} ---\n{result.error.rstrip()}")
+    if failed > len(failures):
+        print(f"\n... {failed - len(failures)} more failures not shown")
+    rate = done / elapsed if elapsed else 0.0
+    print(
+        f"\n{done - failed - skipped:,} rebuilt, {skipped:,} up to date, {failed:,} failed "
+        f"in {elapsed:.2f}s ({rate:,.1f} docs/s)"
+    )
+    print(format_layout_stats(layout_hits, layout_misses))
+    if bytes_in:
+        print(f"Output size: {format_size_change(bytes_in, bytes_out)}")
+    return failed
 
-    _production_heading("What NOT to do:")
-    _production_bullet("Do not apologize for the prototype being a demo. Present it as a working platform.")
-    _production_bullet(
-        "Do not use tech jargon (API, frontend, backend, React). The governor is a banker "
-        "-- speak in outcomes and assets."
+
+def _lang_kwargs(lang: str | None) -> dict[str, str]:
+    # English jobs keep their original arguments, and so their cache keys.
+    return {"lang": lang} if lang else {}
+
+
+def mail_merge_jobs(registry: Path, output_dir: Path, lang: str | None = None) -> Iterator[RenderJob]:
+    """Lazily yield a personalized one-pager job per registry row (in ``lang``, if given)."""
+    for row in iter_traders(registry):
+        yield "onepager", {"trader": row, "output": merge_output_path(output_dir, row), **_lang_kwargs(lang)}
+
+
+def memo_merge_jobs(recipients: Path, output_dir: Path, lang: str | None = None) -> Iterator[RenderJob]:
+    """Lazily yield a stamped governor memo job per recipient row.
+
+    Rows need an ``id`` column plus any of ``to``, ``from``, ``date`` and
+    ``re``; missing fields keep the standard memo's values. A row without
+    an id still yields its job, which fails on its own.
+    """
+    for row in iter_registry(recipients):
+        row = {**row, "id": row.get("id") or ""}
+        yield "memo", {
+            "recipient": row,
+            "output": output_dir / f"memo-{_slug(row['id'])}.pdf",
+            "stamp": True,
+            **_lang_kwargs(lang),
+        }
+
+
+def run_mail_merge(
+    registry: Path, output_dir: Path, workers: int, cache: BuildCache | None = None, lang: str | None = None,
+) -> int:
+    """Render one personalized one-pager per registry row (in ``lang``, if given)."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return run_batch(mail_merge_jobs(registry, output_dir, lang), workers, cache)
+
+
+def run_memo_merge(
+    recipients: Path, output_dir: Path, workers: int, cache: BuildCache | None = None, lang: str | None = None,
+) -> int:
+    """Render one stamped governor memo per recipient row (see ``memo_merge_jobs``)."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return run_batch(memo_merge_jobs(recipients, output_dir, lang), workers, cache)
+
+
+# ---------------------------------------------------------------------------
+# Registry annex: every registered shop in one table
+# ---------------------------------------------------------------------------
+
+ANNEX_PATH = OUTPUT_DIR / "build" / "registry-annex.pdf"
+
+
+def run_registry_annex(registry: Path, output: Path) -> int:
+    """Render the registry annex to ``output``, reporting row throughput."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    documents = _documents()
+    stats = pdf_optimize.OPTIMIZER
+    bytes_in, bytes_out = stats.bytes_in, stats.bytes_out
+    start = time.perf_counter()
+    try:
+        pdf, table = documents.build_registry_annex(registry)
+        layout = time.perf_counter() - start
+        write_pdf(pdf, output)
+    except (OSError, ValueError) as exc:
+        print(f"  [FAIL] {output.name}  ({exc})")
+        return 1
+    elapsed = time.perf_counter() - start
+    size = (
+        f", {format_size_change(stats.bytes_in - bytes_in, stats.bytes_out - bytes_out)}"
+        if stats.bytes_in > bytes_in else ""
     )
-    _production_bullet("Do not read the screen word for word. Talk over it like you know it by heart.")
-    _production_bullet(
-        "Do not oversell the revenue projections. Let the numbers on screen do that work."
+    print(f"  [OK] {output.name}  ({table.rows:,} rows, {table.pages:,} pages{size})")
+    print(
+        f"\nLaid out in {layout:.2f}s, written in {elapsed - layout:.2f}s "
+        f"({table.rows / elapsed if elapsed else 0.0:,.0f} rows/s)"
     )
-    _production_bullet("Do not exceed 5 minutes. Respect the governor's time and he will respect yours.")
+    return 0
 
-    output_path = OUTPUT_DIR / "video-script.pdf"
-    pdf.output(str(output_path))
-    print(f"  [OK] {output_path.name}")
+
+# ---------------------------------------------------------------------------
+# Bundle
+# ---------------------------------------------------------------------------
+
+BUNDLE_PATH = OUTPUT_DIR / "build" / "aba-marketplace-bundle.pdf"
+
+
+def run_bundle(
+    output: Path, merge: Path | None = None, annex: Path | None = None, lang: str | None = None,
+) -> int:
+    """Render the bundle to ``output`` and report its size and pages."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    documents = _documents()
+    stats = pdf_optimize.OPTIMIZER
+    bytes_in, bytes_out = stats.bytes_in, stats.bytes_out
+    start = time.perf_counter()
+    try:
+        documents.generate_bundle(iter_traders(merge) if merge else (), annex, output, lang)
+    except (OSError, ValueError, documents.FPDFException) as exc:
+        print(f"  [FAIL] {output.name}  ({exc})")
+        return 1
+    elapsed = time.perf_counter() - start
+    size = (
+        format_size_change(stats.bytes_in - bytes_in, stats.bytes_out - bytes_out)
+        if stats.bytes_in > bytes_in else f"{output.stat().st_size:,} bytes"
+    )
+    print(f"  [OK] {output.name}  ({size}, {elapsed:.2f}s)")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Product catalog: rendered and merged in chunks of pages
+# ---------------------------------------------------------------------------
+
+CATALOG_PATH = OUTPUT_DIR / "build" / "product-catalog.pdf"
+
+
+def run_catalog(products: Path, output: Path, chunk_pages: int | None = None) -> int:
+    """Render the product catalog to ``output``, reporting pages and throughput.
+
+    Pages are rendered ``chunk_pages`` at a time and each chunk is merged
+    into the file as it fills, so memory use stays flat however many pages
+    the catalog runs to. Product photos are resized by thumbnails.py.
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+    documents = _documents()
+    chunk_pages = chunk_pages or documents.CATALOG_CHUNK_PAGES
+    start = time.perf_counter()
+    try:
+        with output.open("wb") as fh:
+            catalog = documents.build_catalog(iter_registry(products), fh, chunk_pages, products.parent)
+    except (OSError, ValueError) as exc:
+        # Chunks are written as they fill, so a failed run leaves a partial file.
+        output.unlink(missing_ok=True)
+        print(f"  [FAIL] {output.name}  ({exc})")
+        return 1
+    elapsed = time.perf_counter() - start
+    print(
+        f"  [OK] {output.name}  ({catalog.products:,} products, {catalog.pages:,} pages, "
+        f"{output.stat().st_size:,} bytes)"
+    )
+    rate = catalog.pages / elapsed if elapsed else 0.0
+    print(f"\nRendered in {elapsed:.2f}s ({rate:,.1f} pages/s, {catalog.chunks:,} chunks of {chunk_pages:,} pages)")
+    if catalog.photos or catalog.missing_photos:
+        stage = documents.thumbnails.THUMBNAILS
+        cache = stage.cache.stats()
+        print(
+            f"Photos: {catalog.photos:,} placed, {stage.decoded:,} decoded in a {stage.workers}-thread pool, "
+            f"{cache['hit_rate']:.0%} cache hits"
+            + (f", {catalog.missing_photos:,} unreadable" if catalog.missing_photos else "")
+        )
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Trader certificates: one page per NIN-verified trader
+# ---------------------------------------------------------------------------
+
+CERTIFICATES_PATH = OUTPUT_DIR / "build" / "trader-certificates.pdf"
+
+
+def run_certificates(registry: Path, output: Path, chunk_pages: int | None = None) -> int:
+    """Render the certificates of ``registry``'s verified traders to ``output``, reporting throughput.
+
+    Merged in chunks like the catalog; each page carries a QR code of the
+    trader's seller page, drawn as vector shapes by qr_code.py.
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+    documents = _documents()
+    chunk_pages = chunk_pages or documents.CATALOG_CHUNK_PAGES
+    # Reproducible runs date the certificates with the fixed creation date too.
+    issued = CREATION_DATE.date() if CREATION_DATE is not None else None
+    start = time.perf_counter()
+    try:
+        with output.open("wb") as fh:
+            certificates = documents.build_certificates(iter_registry(registry), fh, chunk_pages, issued)
+    except (OSError, ValueError) as exc:
+        output.unlink(missing_ok=True)
+        print(f"  [FAIL] {output.name}  ({exc})")
+        return 1
+    elapsed = time.perf_counter() - start
+    print(
+        f"  [OK] {output.name}  ({certificates.pages:,} certificates, {output.stat().st_size:,} bytes; "
+        f"{certificates.unverified:,} traders without a verified NIN skipped)"
+    )
+    rate = certificates.pages / elapsed * 60 if elapsed else 0.0
+    print(
+        f"\nRendered in {elapsed:.2f}s ({rate:,.0f} certificates/min, "
+        f"{certificates.chunks:,} chunks of {chunk_pages:,} pages)"
+    )
+    return 0
 
 
 # ---------------------------------------------------------------------------
-# PDF 3: Benefits One-Pager
+# Market report: transaction log analytics
 # ---------------------------------------------------------------------------
 
-def generate_benefits_one_pager() -> None:
-    """Generate a 1-page strategic benefits overview PDF."""
-    pdf = FPDF(orientation="P", unit="mm", format="A4")
-    pdf.set_auto_page_break(auto=False)
-    pdf.add_page()
-
-    page_w = 210
-    margin_l = 15
-    margin_r = 15
-    usable_w = page_w - margin_l - margin_r
-
-    # ===== HEADER SECTION =====
-    pdf.set_xy(margin_l, 10)
-    pdf.set_font("Helvetica", "B", 20)
-    pdf.set_text_color(*NAVY)
-    pdf.cell(usable_w, 10, "ABA DIGITAL MARKETPLACE", align="C", new_x="LMARGIN", new_y="NEXT")
-
-    pdf.set_x(margin_l)
-    pdf.set_font("Helvetica", "", 11)
-    pdf.set_text_color(*GOLD)
-    pdf.cell(
-        usable_w, 6,
-        "Strategic Benefits for His Excellency & Abia State",
-        align="C", new_x="LMARGIN", new_y="NEXT",
-    )
-
-    # Gold accent line
-    y_line = pdf.get_y() + 2
-    pdf.set_draw_color(*GOLD)
-    pdf.set_line_width(0.6)
-    pdf.line(margin_l + 30, y_line, page_w - margin_r - 30, y_line)
-    pdf.set_y(y_line + 4)
-
-    # ===== SECTION RENDERING HELPERS =====
-    section_title_size = 10.5
-    body_size = 8
-    bullet_line_h = 3.6
-    section_gap = 3.5
-
-    def _section_title(icon: str, title: str) -> None:
-        pdf.set_font("Helvetica", "B", section_title_size)
-        pdf.set_text_color(*NAVY)
-        pdf.set_x(margin_l)
-        pdf.cell(usable_w, 5.5, f"{icon}  {title}", new_x="LMARGIN", new_y="NEXT")
-        # Thin navy underline
-        y_ul = pdf.get_y() + 0.5
-        pdf.set_draw_color(*NAVY)
-        pdf.set_line_width(0.3)
-        pdf.line(margin_l, y_ul, margin_l + 90, y_ul)
-        pdf.set_y(y_ul + 2)
-
-    def _bullet(text: str) -> None:
-        pdf.set_font("Helvetica", "", body_size)
-        pdf.set_text_color(*DARK_GRAY)
-        pdf.set_x(margin_l + 3)
-        pdf.cell(4, bullet_line_h, "-", new_x="END")
-        pdf.multi_cell(usable_w - 7, bullet_line_h, text, new_x="LMARGIN", new_y="NEXT")
-
-    def _bullet_bold_value(text: str) -> None:
-        """Bullet with markdown bold support."""
-        pdf.set_font("Helvetica", "", body_size)
-        pdf.set_text_color(*DARK_GRAY)
-        pdf.set_x(margin_l + 3)
-        pdf.cell(4, bullet_line_h, "-", new_x="END")
-        pdf.multi_cell(
-            usable_w - 7, bullet_line_h, text,
-            new_x="LMARGIN", new_y="NEXT", markdown=True,
+REPORT_PATH = OUTPUT_DIR / "build" / "market-report.pdf"
+
+
+def run_market_report(log: Path, output: Path) -> int:
+    """Aggregate the transaction ``log`` and render its report to ``output``."""
+    import market_analytics
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    documents = _documents()
+    try:
+        summary = market_analytics.summarize(log)
+        start = time.perf_counter()
+        documents.generate_market_report(summary, output)
+    except (OSError, ValueError) as exc:
+        print(f"  [FAIL] {output.name}  ({exc})")
+        return 1
+    elapsed = time.perf_counter() - start
+    print(
+        f"  [OK] {output.name}  ({summary.rows:,} transactions, "
+        f"{len(summary.by('market')):,} markets, {len(summary.by('category')):,} categories)"
+    )
+    rate = summary.rows / summary.seconds if summary.seconds else 0.0
+    print(
+        f"\nAggregated in {summary.seconds:.2f}s ({rate:,.0f} rows/s, {summary.chunks:,} chunks), "
+        f"rendered in {elapsed:.2f}s"
+    )
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Persistent job queue: resumable batch runs
+# ---------------------------------------------------------------------------
+
+QUEUE_PATH = OUTPUT_DIR / "build" / "render-queue.sqlite3"
+
+# Batch runs that write one file, queued as a single job each. Their
+# arguments are stored as JSON; _QUEUE_PATH_ARGS names those that are paths.
+QUEUE_RUNS: dict[str, Callable[..., int]] = {
+    "annex": run_registry_annex,
+    "bundle": run_bundle,
+    "catalog": run_catalog,
+    "certificates": run_certificates,
+    "report": run_market_report,
+}
+_QUEUE_PATH_ARGS = frozenset({"registry", "products", "log", "output", "merge", "annex"})
+
+
+def queued_render_jobs(
+    jobs: Iterable[RenderJob], priority: int, attempts: int, cache: BuildCache | None = None,
+) -> Iterator["QueuedJob"]:
+    """Lazily turn render jobs into queue entries, keyed by their ``job_key``."""
+    from render_queue import QueuedJob
+
+    for job in jobs:
+        name, kwargs = job
+        fingerprint = cache.fingerprint(name) if cache is not None else None
+        yield QueuedJob(str(job_output(job)), job_key(job, fingerprint), name, kwargs, priority, max_attempts=attempts)
+
+
+def queued_run(kind: str, args: dict[str, Any], priority: int, attempts: int) -> "QueuedJob":
+    """Return the queue entry of a single-file batch run (see ``QUEUE_RUNS``).
+
+    Its key covers the arguments, the size and mtime of the input files and
+    the ``source_stamp``, so a changed input or generator queues it again.
+    """
+    from render_queue import QueuedJob
+
+    inputs = {}
+    for name, value in args.items():
+        if name in _QUEUE_PATH_ARGS and name != "output" and value is not None:
+            try:
+                stat = os.stat(value)
+                inputs[name] = f"{stat.st_size}:{stat.st_mtime_ns}"
+            except OSError:
+                inputs[name] = "missing"
+    created = CREATION_DATE.isoformat() if CREATION_DATE is not None else None
+    key = hashlib.sha256(
+        json.dumps([kind, args, inputs, created, source_stamp()], sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return QueuedJob(str(args["output"]), key, kind, args, priority, max_attempts=attempts)
+
+
+def _run_queued(job: "QueuedJob") -> RenderResult:
+    """Run a queued single-file batch run in this process, capturing what it prints."""
+    args = {
+        name: Path(value) if name in _QUEUE_PATH_ARGS and value is not None else value
+        for name, value in job.args.items()
+    }
+    printed = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(printed):
+            status = QUEUE_RUNS[job.kind](**args)
+    except Exception:  # noqa: BLE001 - retried, then reported in the batch summary
+        status = 1
+        printed.write(traceback.format_exc())
+    seconds = time.perf_counter() - start
+    if status:
+        return RenderResult(job.kind, False, seconds, output=job.output, error=printed.getvalue())
+    print(printed.getvalue().rstrip())
+    return RenderResult(job.kind, True, seconds, output=job.output)
+
+
+def iter_queue_results(
+    queue: "RenderQueue", workers: int = 1, cache: BuildCache | None = None,
+) -> Iterator[RenderResult]:
+    """Drain ``queue``, yielding the final result of each job as it completes.
+
+    Jobs are claimed one at a time, as ``iter_render_results`` takes them,
+    so a job enqueued meanwhile at a higher priority goes next. Render jobs
+    run in ``workers`` processes; single-file batch runs run in this process
+    when claimed. A failed job goes back to the queue to be retried after a
+    backoff, and is only yielded once it succeeds or runs out of attempts.
+    Returns once no job is pending, sleeping through backoffs until then.
+    """
+    claimed: dict[str, QueuedJob] = {}
+
+    def _claims() -> Iterator[RenderJob | RenderResult]:
+        while (job := queue.claim()) is not None:
+            claimed[job.output] = job
+            if job.kind in QUEUE_RUNS:
+                yield _run_queued(job)
+                continue
+            render_job = (job.kind, job.args)
+            # The output directory may be gone since the job was queued.
+            job_output(render_job).parent.mkdir(parents=True, exist_ok=True)
+            yield from cache.plan([render_job]) if cache is not None else [render_job]
+
+    while True:
+        for result in iter_render_results(_claims(), workers):
+            job = claimed.pop(result.output)
+            if cache is not None and job.kind not in QUEUE_RUNS and not result.skipped:
+                cache.record(result)
+            if result.ok:
+                queue.complete(job)
+            else:
+                delay = queue.fail(job, result.error)
+                if delay is not None:
+                    print(
+                        f"  [RETRY] {Path(job.output).name}  (attempt {job.attempts + 1} of "
+                        f"{job.max_attempts} failed, retrying in {delay:.0f}s)"
+                    )
+                    continue
+            yield result
+        delay = queue.next_retry()
+        if delay is None:
+            return
+        time.sleep(delay)
+
+
+def run_queue(
+    path: Path, jobs: Iterable["QueuedJob"], workers: int, cache: BuildCache | None = None, requeue: bool = False,
+) -> int:
+    """Add ``jobs`` to the queue at ``path``, then render every job pending in it.
+
+    Jobs already done are skipped, so after a crash or Ctrl-C the same
+    command picks up where the run stopped. With ``requeue`` they are
+    rendered again. Returns 1 if a job failed for good, 130 if interrupted.
+    """
+    from render_queue import RenderQueue, format_counts
+
+    with RenderQueue(path) as queue:
+        recovered = queue.recover()
+        if recovered:
+            print(f"Returned {recovered:,} jobs left running by an earlier run to the queue")
+        start = time.perf_counter()
+        queued, recorded = queue.enqueue(jobs, requeue)
+        print(
+            f"Queued {queued:,} jobs, {recorded:,} already recorded, in {time.perf_counter() - start:.2f}s "
+            f"({format_counts(queue.counts())})"
         )
+        print(f"Workers: {workers}\n")
+        try:
+            failed = report_batch(iter_queue_results(queue, workers, cache), cache)
+        except KeyboardInterrupt:
+            released = queue.release()
+            if cache is not None:
+                cache.save()
+            print(f"\nInterrupted: {released:,} jobs in progress returned to the queue; run again to resume")
+            return 130
+        print(f"Queue: {format_counts(queue.counts())}")
+    return 1 if failed else 0
+
+
+def print_queue(path: Path) -> None:
+    """Print the job counts of the queue at ``path`` and the jobs that failed for good (``--dry-run``)."""
+    from render_queue import RenderQueue, format_counts
+
+    if not path.exists():
+        print("  (no queue yet)")
+        return
+    with RenderQueue(path) as queue:
+        print(f"  {format_counts(queue.counts())}")
+        for job in queue.failures(MERGE_MAX_REPORTED_FAILURES):
+            last_line = job.error.strip().splitlines()[-1] if job.error.strip() else "no error recorded"
+            print(f"  [FAIL] {Path(job.output).name}  ({job.attempts} attempts: {last_line})")
 
-    def _section_spacer() -> None:
-        pdf.set_y(pdf.get_y() + section_gap)
-
-    # ===== SECTION 1: DIRECT REVENUE STREAMS =====
-    _section_title("$", "DIRECT REVENUE STREAMS")
-    _bullet("Transaction levies (1-1.5% on every digital transaction -- automated, no leakage)")
-    _bullet_bold_value("Annual trader registration fees (N5-10K per trader x thousands of traders)")
-    _bullet_bold_value("Premium listing fees (N5-15K/month for featured placement)")
-    _bullet_bold_value("**Conservative Year 1-2 projection: N107-178M annually**")
-    _bullet_bold_value("**Full potential Year 3-5: N632M - N1B annually**")
-    _section_spacer()
-
-    # ===== SECTION 2: NEW BUSINESSES =====
-    _section_title("+", "NEW BUSINESSES THE STATE CAN SPIN UP")
-    _bullet("State-backed logistics network (delivery fleet serving buyers & sellers -- per-delivery fees)")
-    _bullet("Warehousing & fulfillment centers (storage hubs in Aba -- rental income)")
-    _bullet("Quality certification body (\"Made in Aba\" verification -- certification fees)")
-    _bullet("Trade finance / micro-lending (data-backed loans to verified traders -- interest revenue)")
-    _bullet("Packaging & branding services (professional packaging for e-commerce -- service fees)")
-    _section_spacer()
-
-    # ===== SECTION 3: DATA & INTELLIGENCE =====
-    _section_title("~", "DATA & INTELLIGENCE (THE HIDDEN GOLD)")
-    _bullet("First-ever digital trader registry (NIN-verified -- who trades, what, where, how much)")
-    _bullet("Real-time economic activity data (transaction volumes, growth trends, seasonal patterns)")
-    _bullet("Tax & levy optimization (data-driven collection replaces manual guesswork)")
-    _bullet("Policy planning intelligence (which sectors grow, which need support, where to invest)")
-    _bullet("Investor pitch material (hard data to attract FDI and federal funding)")
-    _bullet("Citizen database asset (traders' information, business profiles, economic contributions)")
-    _section_spacer()
-
-    # ===== SECTION 4: LEGACY & POLITICAL CAPITAL =====
-    _section_title("*", "LEGACY & POLITICAL CAPITAL")
-    _bullet("\"First Nigerian state to build a digital marketplace\" -- national press headline")
-    _bullet("Visible modernization aligned with A-Line market rebuild")
-    _bullet("Demonstrable economic data for federal engagement")
-    _bullet("Blueprint other states will want to license (additional revenue)")
-    _bullet("International recognition (\"China of Africa goes digital\")")
-    _bullet("Permanent infrastructure that outlasts any administration")
-    _section_spacer()
-
-    # ===== SECTION 5: SOCIAL IMPACT =====
-    _section_title("#", "SOCIAL IMPACT")
-    _bullet("Traders reach buyers nationwide without leaving Aba")
-    _bullet("Women and youth traders gain equal digital visibility")
-    _bullet("\"Made in Aba\" brand rehabilitation (no more labeling goods \"Made in China\")")
-    _bullet("Financial inclusion through escrow and digital payments")
-    _bullet("USSD and WhatsApp access means no trader is excluded")
-
-    # ===== BOTTOM BAR =====
-    bar_y = 282
-    bar_h = 8
-    pdf.set_fill_color(*NAVY)
-    pdf.rect(0, bar_y, page_w, bar_h, "F")
-    pdf.set_xy(0, bar_y + 1.5)
-    pdf.set_font("Helvetica", "", 7.5)
-    pdf.set_text_color(*WHITE)
-    pdf.cell(
-        page_w, 5,
-        "Prepared by Stringz Technologies LLC   |   madeinaba.net   |   Confidential",
-        align="C",
-    )
-
-    output_path = OUTPUT_DIR / "benefits-one-pager.pdf"
-    pdf.output(str(output_path))
-    print(f"  [OK] {output_path.name}")
+
+# ---------------------------------------------------------------------------
+# Watch mode
+# ---------------------------------------------------------------------------
+
+# Seconds between checks of the watched files.
+WATCH_INTERVAL = 0.05
+
+FileState = tuple[int, int] | None
+
+
+def watched_files(names: Iterable[str]) -> list[Path]:
+    """Return documents.py and every asset (sources, images, helper modules) of generators ``names``."""
+    documents = _documents()
+    files = {Path(documents.__file__).resolve(): None}
+    for name in names:
+        files.update(dict.fromkeys(asset.resolve() for asset in documents.GENERATOR_ASSETS.get(name, ())))
+    return list(files)
+
+
+def _file_states(paths: Iterable[Path]) -> dict[Path, FileState]:
+    states: dict[Path, FileState] = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            states[path] = None
+        else:
+            states[path] = (stat.st_mtime_ns, stat.st_size)
+    return states
+
+
+def reload_render_modules(changed: Iterable[Path]) -> None:
+    """Re-import the changed modules among the render modules, then documents.py itself."""
+    documents = _documents()
+    for path in changed:
+        # Render modules are top-level modules named after their file.
+        module = sys.modules.get(path.stem)
+        module_file = getattr(module, "__file__", None)
+        if path.suffix == ".py" and module_file and module is not documents and Path(module_file).resolve() == path:
+            importlib.reload(module)
+    importlib.reload(documents)
+
+
+def _warm_up(jobs: Iterable[RenderJob]) -> None:
+    """Render ``jobs`` in memory, so fonts, layouts and assets are cached before the first change."""
+    documents = _documents()
+    for name, kwargs in jobs:
+        documents.GENERATORS[name](**{**kwargs, "output": io.BytesIO()})
+
+
+def run_watch(jobs: list[RenderJob], cache: BuildCache, interval: float = WATCH_INTERVAL) -> int:
+    """Re-render ``jobs`` whenever a file they depend on changes, until interrupted.
+
+    Renders run in this process, which keeps fpdf2, the fonts, the layout
+    cache and prepared assets warm between changes. A change to a generator
+    module reloads it. Only jobs whose fingerprint (generator code, copy and
+    assets) changed are rendered again.
+    """
+    names = {name for name, _ in jobs}
+    start = time.perf_counter()
+    _warm_up(jobs)
+    paths = watched_files(names)
+    states = _file_states(paths)
+    cache.force = False
+    print(f"\nWarmed up in {(time.perf_counter() - start) * 1000:.0f} ms")
+    print(f"Watching {len(paths)} files (Ctrl-C to stop)...")
+    try:
+        while True:
+            time.sleep(interval)
+            current = _file_states(paths)
+            changed = {path for path in paths if current[path] != states[path]}
+            if not changed:
+                continue
+            states = current
+            detected = time.perf_counter()
+            saved_ns = max((current[path][0] for path in changed if current[path]), default=time.time_ns())
+            print(f"\nChanged: {', '.join(sorted(path.name for path in changed))}")
+
+            if any(path.suffix == ".py" for path in changed):
+                try:
+                    reload_render_modules(changed)
+                except Exception:  # noqa: BLE001 - keep watching until the edit is fixed
+                    print(f"  [FAIL] reload\n{traceback.format_exc().rstrip()}")
+                    continue
+                cache.fingerprints.clear()
+                paths = watched_files(names)
+                states = _file_states(paths)
+            else:
+                documents = _documents()
+                for name in names:
+                    if changed.intersection(asset.resolve() for asset in documents.GENERATOR_ASSETS.get(name, ())):
+                        cache.fingerprints.pop(name, None)
+            generator_fingerprint.cache_clear()
+            source_stamp.cache_clear()
+            linecache.checkcache()
+
+            results = list(iter_render_results(jobs, 1, cache))
+            cache.save()
+            for result in results:
+                if result.skipped:
+                    continue
+                status = "OK" if result.ok else "FAIL"
+                print(f"  [{status}] {Path(result.output).name}  ({result.seconds * 1000:.0f} ms)")
+                if not result.ok:
+                    print(result.error.rstrip())
+            rebuilt = sum(not r.skipped for r in results)
+            elapsed = time.perf_counter() - detected
+            since_save = (time.time_ns() - saved_ns) / 1e6
+            print(
+                f"{rebuilt} rebuilt, {len(results) - rebuilt} unaffected in {elapsed * 1000:.0f} ms "
+                f"({since_save:.0f} ms after the save)"
+            )
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Targets
+# ---------------------------------------------------------------------------
+
+# Command-line targets and the generators each one runs. ``batch`` runs the
+# --merge, --memos, --annex, --bundle, --catalog, --certificates or --report job given instead.
+TARGETS: dict[str, tuple[str, ...]] = {
+    "memo": ("memo",),
+    "script": ("script",),
+    "onepager": ("onepager",),
+    "all": STANDARD_DOCUMENTS,
+    "batch": (),
+}
+TARGET_DESCRIPTIONS = {
+    "memo": "Formal 1-page memorandum",
+    "script": "Presenter-friendly walkthrough script",
+    "onepager": "Strategic benefits overview (1 page)",
+    "all": "memo, script and onepager (the default)",
+    "batch": "one of the batch runs below (the default when one is given)",
+}
+
+
+def target_generators(targets: Iterable[str], markdown: bool = False) -> tuple[str, ...]:
+    """Return the generators ``targets`` run, in order and without repeats.
+
+    With ``markdown`` the memo and script are rendered from governor-memo.md
+    and video-script.md instead of the copy hardcoded in documents.py.
+    """
+    names: dict[str, None] = {}
+    for target in targets:
+        for name in TARGETS[target]:
+            names[MARKDOWN_VARIANTS.get(name, name) if markdown else name] = None
+    return tuple(names)
+
+
+def _display_path(path: Path) -> str:
+    return str(path.relative_to(OUTPUT_DIR)) if path.is_relative_to(OUTPUT_DIR) else str(path)
+
+
+def print_targets(markdown: bool = False) -> None:
+    """Print every target with the files it writes (``--list``)."""
+    print("Targets:")
+    for target, description in TARGET_DESCRIPTIONS.items():
+        print(f"  {target:<10}{description}")
+        if target in ("memo", "script", "onepager"):
+            for name in target_generators([target], markdown):
+                print(f"  {'':<10}-> {DEFAULT_FILENAMES[name]}  (generator {name})")
+    batches = (
+        ("--merge REGISTRY", _display_path(MERGE_DIR / "benefits-<shop_id>.pdf")),
+        ("--memos RECIPIENTS", _display_path(MEMO_MERGE_DIR / "memo-<id>.pdf")),
+        ("--annex REGISTRY", _display_path(ANNEX_PATH)),
+        ("--bundle", _display_path(BUNDLE_PATH)),
+        ("--catalog PRODUCTS", _display_path(CATALOG_PATH)),
+        ("--certificates REGISTRY", _display_path(CERTIFICATES_PATH)),
+        ("--report TRANSACTIONS", _display_path(REPORT_PATH)),
+    )
+    print("\nBatch runs:")
+    for option, output in batches:
+        print(f"  {option:<24}-> {output}")
+    print(f"\nWith --lang LANG, output goes to {_display_path(LOCALIZED_DIR)}/LANG instead.")
+    print(f"With --queue, jobs run through the resumable queue in {_display_path(QUEUE_PATH)}.")
+
+
+def print_plan(jobs: Iterable[RenderJob], cache: BuildCache | None, verbose: bool = True) -> int:
+    """Print what building ``jobs`` would do, without rendering; return how many would be rebuilt."""
+    rebuild = current = 0
+    for item in cache.plan(jobs) if cache is not None else jobs:
+        if isinstance(item, RenderResult):
+            current += 1
+            line = f"  [SKIP] {Path(item.output).name}  (up to date)"
+        else:
+            rebuild += 1
+            reason = cache.planned_reason(item) if cache is not None else "no cache"
+            line = f"  [BUILD] {job_output(item).name}  ({reason})"
+        if verbose:
+            print(line)
+    print(f"\n{rebuild:,} would be rebuilt, {current:,} up to date")
+    return rebuild
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
-def main() -> None:
-    """Generate all three PDF documents."""
-    print("Generating PDFs...")
-    print(f"Output directory: {OUTPUT_DIR}\n")
+def main(argv: list[str] | None = None) -> int:
+    """Generate the PDF documents selected on the command line."""
+    parser = argparse.ArgumentParser(description="Generate the Aba Digital Marketplace PDFs.")
+    parser.add_argument(
+        "targets", nargs="*", metavar="TARGET",
+        help=f"what to build: {', '.join(TARGETS)} (default: all, or batch with a batch option)",
+    )
+    parser.add_argument(
+        "--list", action="store_true",
+        help="list the targets and the files they write, then exit",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="show which documents would be rebuilt and why, without rendering",
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="after building, keep rebuilding the documents affected by each change to their sources",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=0, metavar="N",
+        help="number of worker processes (default: 0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--merge", type=Path, metavar="REGISTRY",
+        help="render a personalized one-pager per row of a .csv/.jsonl trader registry",
+    )
+    parser.add_argument(
+        "--memos", type=Path, metavar="RECIPIENTS",
+        help="render a stamped governor memo per row of a .csv/.jsonl recipient list",
+    )
+    parser.add_argument(
+        "--annex", type=Path, metavar="REGISTRY",
+        help="render a table of every shop in a .csv/.jsonl trader registry",
+    )
+    parser.add_argument(
+        "--bundle", action="store_true",
+        help="render memo, script and one-pager into one PDF with bookmarks; "
+        "--merge and --annex add per-trader one-pagers and the registry annex to it",
+    )
+    parser.add_argument(
+        "--catalog", type=Path, metavar="PRODUCTS",
+        help="render every product of a .csv/.jsonl product export, grouped by market and category, "
+        "into one catalog PDF",
+    )
+    parser.add_argument(
+        "--certificates", type=Path, metavar="REGISTRY",
+        help="render a verification certificate with a seller page QR code for every NIN-verified "
+        "trader of a .csv/.jsonl registry, into one PDF",
+    )
+    parser.add_argument(
+        "--chunk-pages", type=int, metavar="N",
+        help="pages the catalog or certificates render before merging them into the file (default: 200)",
+    )
+    parser.add_argument(
+        "--report", type=Path, metavar="TRANSACTIONS",
+        help="aggregate a .csv/.jsonl transaction log into a one-page market report",
+    )
+    parser.add_argument(
+        "--queue", type=Path, nargs="?", const=QUEUE_PATH, metavar="DB",
+        help="run the documents or batch through a persistent job queue that resumes after a crash "
+        f"(default: {QUEUE_PATH}); with the batch target alone, render what is already queued",
+    )
+    parser.add_argument(
+        "--priority", type=int, metavar="N",
+        help="priority of the jobs this run queues; higher runs first (default: 0)",
+    )
+    parser.add_argument(
+        "--retries", type=int, metavar="N",
+        help="times a queued job that fails is retried, with exponential backoff (default: 2)",
+    )
+    parser.add_argument(
+        "--lang", choices=LANGUAGES,
+        help="localize the documents, one-pagers and memos, set in embedded Unicode fonts "
+        f"(written to {LOCALIZED_DIR}/LANG unless --out is given)",
+    )
+    parser.add_argument(
+        "--out", type=Path, metavar="DIR",
+        help=f"output directory for --merge/--memos/--annex/--bundle/--catalog/--certificates/--report and --lang (default: {MERGE_DIR} or {MEMO_MERGE_DIR})",
+    )
+    parser.add_argument(
+        "--markdown", action="store_true",
+        help="build the memo and video script from their .md sources",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="rebuild every document even if its inputs are unchanged",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"neither consult nor update the build manifest ({MANIFEST_PATH})",
+    )
+    parser.add_argument(
+        "--no-layout-cache", action="store_true",
+        help="re-measure every paragraph instead of reusing memoized line breaks",
+    )
+    parser.add_argument(
+        "--reproducible", action="store_true",
+        help="stamp a fixed creation date (SOURCE_DATE_EPOCH, else "
+        f"{REPRODUCIBLE_DATE:%Y-%m-%d}) so identical inputs give byte-identical PDFs",
+    )
+    parser.add_argument(
+        "--no-optimize", action="store_true",
+        help="write fpdf's output as is, without the lossless size optimization",
+    )
+    parser.add_argument(
+        "--trace", type=Path, metavar="PATH",
+        help="record per-helper timings and write a Chrome trace (renders in one process)",
+    )
+    args = parser.parse_args(argv)
+    unknown = [target for target in args.targets if target not in TARGETS]
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(unknown)} (choose from {', '.join(TARGETS)})")
+    batch = bool(
+        args.merge or args.memos or args.annex or args.bundle or args.catalog or args.certificates or args.report
+    )
+    args.targets = args.targets or ["batch" if batch else "all"]
+    if "batch" in args.targets:
+        if len(set(args.targets)) > 1:
+            parser.error("batch cannot be combined with document targets")
+        if not batch and not args.queue:
+            parser.error(
+                "batch needs --merge, --memos, --annex, --bundle, --catalog, --certificates, --report or --queue"
+            )
+    elif batch:
+        parser.error(
+            "--merge, --memos, --annex, --bundle, --catalog, --certificates and --report run as the batch target only"
+        )
+    if args.lang and args.annex:
+        parser.error("--lang does not apply to the registry annex")
+    if args.memos and (args.merge or args.annex or args.bundle):
+        parser.error("--memos runs on its own, without other batch options")
+    if args.merge and args.annex and not args.bundle:
+        parser.error("--merge and --annex run together only inside --bundle")
+    if args.markdown and batch:
+        parser.error("--markdown applies to document targets only")
+    if args.report and (
+        args.merge or args.memos or args.annex or args.bundle or args.catalog or args.certificates or args.lang
+    ):
+        parser.error("--report runs on its own, without other batch options or --lang")
+    if args.catalog and (args.merge or args.memos or args.annex or args.bundle or args.certificates or args.lang):
+        parser.error("--catalog runs on its own, without other batch options or --lang")
+    if args.certificates and (args.merge or args.memos or args.annex or args.bundle or args.lang):
+        parser.error("--certificates runs on its own, without other batch options or --lang")
+    if args.chunk_pages is not None and not (args.catalog or args.certificates):
+        parser.error("--chunk-pages applies to --catalog and --certificates only")
+    if args.chunk_pages is not None and args.chunk_pages < 1:
+        parser.error("--chunk-pages must be at least 1")
+    if (args.priority is not None or args.retries is not None) and not args.queue:
+        parser.error("--priority and --retries apply to --queue only")
+    if args.retries is not None and args.retries < 0:
+        parser.error("--retries must not be negative")
+    if args.watch and (batch or args.list or args.dry_run or args.trace or args.no_cache or args.queue):
+        parser.error("--watch works on document targets and needs the build cache")
+    # CPU time of interpreter start, imports and argument parsing.
+    startup = time.process_time()
+
+    if args.list:
+        print_targets(args.markdown)
+        print(f"\n{format_startup(startup)}")
+        return 0
+    if args.no_layout_cache:
+        global LAYOUT_CACHING
+        LAYOUT_CACHING = False
+    if args.no_optimize:
+        global OPTIMIZE_OUTPUT
+        OPTIMIZE_OUTPUT = False
+    if args.reproducible:
+        global CREATION_DATE
+        try:
+            CREATION_DATE = reproducible_date()
+        except ValueError:
+            parser.error(f"SOURCE_DATE_EPOCH must be a Unix timestamp, not {os.environ['SOURCE_DATE_EPOCH']!r}")
+    workers = args.jobs or os.cpu_count() or 1
+    if args.watch:
+        # Render in this process so fpdf2 and its caches stay warm.
+        workers = 1
+    if args.trace:
+        # Events are collected in-process, so tracing renders without a pool.
+        workers = 1
+        documents = _documents()
+        TRACER.instrument(documents.MemoStyle, documents.ScriptStyle, documents.OnePagerStyle)
+    try:
+        return _run(args, workers)
+    finally:
+        if args.trace:
+            TRACER.restore()
+            TRACER.write_chrome_trace(args.trace)
+            print(f"\nTrace written to {args.trace}")
+            TRACER.print_summary()
+        print(f"\n{format_startup(startup)}")
+
+
+def _batch_output(args: argparse.Namespace, default: Path) -> Path:
+    return (args.out or default.parent) / default.name
+
+
+def _merge_dir(args: argparse.Namespace, default: Path) -> Path:
+    return args.out or (LOCALIZED_DIR / args.lang / default.name if args.lang else default)
+
+
+def _target_jobs(args: argparse.Namespace) -> tuple[Path, list[RenderJob]]:
+    """Return the output directory and render jobs of the document targets given."""
+    output_dir = args.out or (LOCALIZED_DIR / args.lang if args.lang else OUTPUT_DIR)
+    names = target_generators(args.targets, args.markdown)
+    if output_dir == OUTPUT_DIR:
+        return output_dir, [(name, _lang_kwargs(args.lang)) for name in names]
+    return output_dir, [
+        (name, {"output": output_dir / DEFAULT_FILENAMES[name], **_lang_kwargs(args.lang)})
+        for name in names
+    ]
 
-    generate_governor_memo()
-    generate_video_script()
-    generate_benefits_one_pager()
 
+def _queued_jobs(args: argparse.Namespace, cache: BuildCache | None) -> Iterator["QueuedJob"]:
+    """Lazily yield the queue entries of the documents or batch given, as ``_run`` would run them."""
+    priority = args.priority or 0
+    attempts = (2 if args.retries is None else args.retries) + 1
+    if args.bundle:
+        run_args = {
+            "output": _batch_output(args, BUNDLE_PATH), "merge": args.merge, "annex": args.annex, "lang": args.lang,
+        }
+        yield queued_run("bundle", run_args, priority, attempts)
+    elif args.catalog:
+        run_args = {
+            "products": args.catalog, "output": _batch_output(args, CATALOG_PATH), "chunk_pages": args.chunk_pages,
+        }
+        yield queued_run("catalog", run_args, priority, attempts)
+    elif args.certificates:
+        run_args = {
+            "registry": args.certificates, "output": _batch_output(args, CERTIFICATES_PATH),
+            "chunk_pages": args.chunk_pages,
+        }
+        yield queued_run("certificates", run_args, priority, attempts)
+    elif args.report:
+        run_args = {"log": args.report, "output": _batch_output(args, REPORT_PATH)}
+        yield queued_run("report", run_args, priority, attempts)
+    elif args.merge:
+        jobs = mail_merge_jobs(args.merge, _merge_dir(args, MERGE_DIR), args.lang)
+        yield from queued_render_jobs(jobs, priority, attempts, cache)
+    elif args.annex:
+        run_args = {"registry": args.annex, "output": _batch_output(args, ANNEX_PATH)}
+        yield queued_run("annex", run_args, priority, attempts)
+    elif args.memos:
+        jobs = memo_merge_jobs(args.memos, _merge_dir(args, MEMO_MERGE_DIR), args.lang)
+        yield from queued_render_jobs(jobs, priority, attempts, cache)
+    elif "batch" not in args.targets:
+        yield from queued_render_jobs(_target_jobs(args)[1], priority, attempts, cache)
+
+
+def _run(args: argparse.Namespace, workers: int) -> int:
+    """Run the documents or batch selected on the command line."""
+    cache = None if args.no_cache else BuildCache(force=args.force)
+
+    if args.queue:
+        print(f"Render queue: {args.queue}")
+        if args.dry_run:
+            print_queue(args.queue)
+            return 0
+        return run_queue(args.queue, _queued_jobs(args, cache), workers, cache, requeue=args.force)
+    if args.bundle:
+        output = _batch_output(args, BUNDLE_PATH)
+        print(f"Bundle: {output}\n")
+        if args.dry_run:
+            print(f"  [BUILD] {output.name}  (bundles are always rebuilt)")
+            return 0
+        return run_bundle(output, args.merge, args.annex, args.lang)
+    if args.catalog:
+        output = _batch_output(args, CATALOG_PATH)
+        print(f"Product catalog: {args.catalog} -> {output}\n")
+        if args.dry_run:
+            print(f"  [BUILD] {output.name}  (the catalog is always rebuilt)")
+            return 0
+        return run_catalog(args.catalog, output, args.chunk_pages)
+    if args.certificates:
+        output = _batch_output(args, CERTIFICATES_PATH)
+        print(f"Trader certificates: {args.certificates} -> {output}\n")
+        if args.dry_run:
+            print(f"  [BUILD] {output.name}  (certificates are always rebuilt)")
+            return 0
+        return run_certificates(args.certificates, output, args.chunk_pages)
+    if args.report:
+        output = _batch_output(args, REPORT_PATH)
+        print(f"Market report: {args.report} -> {output}\n")
+        if args.dry_run:
+            print(f"  [BUILD] {output.name}  (the report is always rebuilt)")
+            return 0
+        return run_market_report(args.report, output)
+    if args.merge:
+        output_dir = _merge_dir(args, MERGE_DIR)
+        print(f"Mail merge: {args.merge} -> {output_dir}")
+        if args.dry_run:
+            print_plan(mail_merge_jobs(args.merge, output_dir, args.lang), cache, verbose=False)
+            return 0
+        print(f"Workers: {workers}\n")
+        return 1 if run_mail_merge(args.merge, output_dir, workers, cache, args.lang) else 0
+    if args.annex:
+        output = _batch_output(args, ANNEX_PATH)
+        print(f"Registry annex: {args.annex} -> {output}\n")
+        if args.dry_run:
+            print(f"  [BUILD] {output.name}  (the annex is always rebuilt)")
+            return 0
+        return run_registry_annex(args.annex, output)
+    if args.memos:
+        output_dir = _merge_dir(args, MEMO_MERGE_DIR)
+        print(f"Memo merge: {args.memos} -> {output_dir}")
+        if args.dry_run:
+            print_plan(memo_merge_jobs(args.memos, output_dir, args.lang), cache, verbose=False)
+            return 0
+        print(f"Workers: {workers}\n")
+        return 1 if run_memo_merge(args.memos, output_dir, workers, cache, args.lang) else 0
+
+    output_dir, jobs = _target_jobs(args)
+    if args.dry_run:
+        print(f"Dry run: {', '.join(args.targets)} -> {output_dir}\n")
+        print_plan(jobs, cache)
+        return 0
+
+    print("Generating PDFs...")
+    print(f"Output directory: {output_dir}")
+    print(f"Workers: {workers}\n")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    results = list(iter_render_results(jobs, min(workers, len(jobs)), cache))
+    if cache is not None:
+        cache.save()
+    print_summary(results, time.perf_counter() - start)
+
+    if args.watch:
+        return run_watch(jobs, cache)
+    if any(not r.ok for r in results):
+        return 1
     print("\nAll PDFs generated successfully.")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    # Run as a script, this module is ``__main__``; register it under its own
+    # name so documents.py shares its settings (e.g. --no-optimize) rather
+    # than importing a second copy.
+    sys.modules.setdefault("generate_pdfs", sys.modules[__name__])
+    raise SystemExit(main())
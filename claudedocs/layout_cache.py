@@ -0,0 +1,179 @@
+"""Process-wide LRU memoization of fpdf2 line breaking.
+
+``multi_cell`` re-measures every character of its text on each call, which
+dominates render time when the same paragraphs are laid out again and again
+across a batch. ``install()`` swaps fpdf's ``MultiLineBreak`` for a drop-in
+that remembers the computed lines (their breaks, widths and heights) per
+(text, font family, style, size, color, ..., width) and replays them.
+
+Replayed lines are rebound to the calling document's own graphics states, so
+font objects, TTF subsets and resource tracking stay per-document and the
+output is byte-identical to an uncached render.
+"""
+
+from collections import OrderedDict
+from dataclasses import fields
+from typing import Any, Callable, Sequence
+
+import fpdf.fpdf
+from fpdf.graphics_state import GraphicsState
+from fpdf.line_break import Fragment, MultiLineBreak, TextLine
+
+DEFAULT_MAXSIZE = 4096
+
+# GraphicsState fields that hold per-document objects rather than values.
+_UNKEYED_FIELDS = {"current_font", "current_font_is_set_on_page", "dash_pattern", "text_shaping"}
+_KEYED_FIELDS = tuple(f.name for f in fields(GraphicsState) if f.name not in _UNKEYED_FIELDS)
+
+
+def _state_key(state: GraphicsState) -> tuple:
+    font = state.current_font
+    return (
+        font.fontkey if font is not None else None,
+        tuple(getattr(state, name) for name in _KEYED_FIELDS),
+        tuple(sorted(state.dash_pattern.items())),
+        repr(state.text_shaping) if state.text_shaping else None,
+    )
+
+
+class LayoutCache:
+    """LRU cache of laid-out text lines with hit/miss statistics."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, list[tuple[TextLine, list[tuple[int, type]]]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.bypassed = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters, current size and hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bypassed": self.bypassed,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def break_lines(
+        self, fragments: Sequence[Fragment], max_width: float, margins: Sequence[float], **kwargs: Any,
+    ) -> list[TextLine]:
+        """Return the lines for ``fragments``, computing them only on a miss."""
+        key = (
+            tuple(("".join(f.characters), _state_key(f.graphics_state), f.k, f.link) for f in fragments),
+            max_width,
+            tuple(margins),
+            tuple(sorted(kwargs.items())),
+        )
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return [_rebind(line, refs, fragments) for line, refs in entry]
+
+        self.misses += 1
+        lines = _compute_lines(fragments, max_width, margins, **kwargs)
+        entry = _detach(lines, fragments)
+        if entry is None:
+            self.bypassed += 1
+        else:
+            self._entries[key] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return lines
+
+
+def _compute_lines(
+    fragments: Sequence[Fragment], max_width: Any, margins: Sequence[float], **kwargs: Any,
+) -> list[TextLine]:
+    line_break = _ORIGINAL(fragments, max_width, margins, **kwargs)
+    lines = []
+    line = line_break.get_line()
+    while line is not None:
+        lines.append(line)
+        line = line_break.get_line()
+    return lines
+
+
+def _detach(
+    lines: list[TextLine], fragments: Sequence[Fragment],
+) -> list[tuple[TextLine, list[tuple[int, type]]]] | None:
+    """Record which input fragment each line fragment's state came from.
+
+    Returns None when a line fragment carries a state not shared with any
+    input fragment, in which case the lines cannot be replayed safely.
+    """
+    index_of = {id(f.graphics_state): i for i, f in enumerate(fragments)}
+    entry = []
+    for line in lines:
+        refs = []
+        for frag in line.fragments:
+            index = index_of.get(id(frag.graphics_state))
+            if index is None:
+                return None
+            refs.append((index, type(frag)))
+        entry.append((line, refs))
+    return entry
+
+
+def _rebind(line: TextLine, refs: list[tuple[int, type]], fragments: Sequence[Fragment]) -> TextLine:
+    """Copy a cached line onto the graphics states of the calling document."""
+    rebound = [
+        cls(frag.characters, fragments[index].graphics_state, frag.k, frag.link)
+        for frag, (index, cls) in zip(line.fragments, refs)
+    ]
+    return line._replace(fragments=rebound)
+
+
+class _CachedMultiLineBreak:
+    """Stand-in for ``MultiLineBreak`` that serves lines from ``LAYOUT_CACHE``."""
+
+    def __init__(
+        self,
+        fragments: Sequence[Fragment],
+        max_width: float | Callable[[float], float],
+        margins: Sequence[float],
+        **kwargs: Any,
+    ) -> None:
+        # Widths that vary per line (write(), text regions) are not cacheable.
+        self._delegate = None
+        if callable(max_width):
+            LAYOUT_CACHE.bypassed += 1
+            self._delegate = _ORIGINAL(fragments, max_width, margins, **kwargs)
+        else:
+            self._lines = iter(LAYOUT_CACHE.break_lines(fragments, max_width, margins, **kwargs))
+
+    def get_line(self) -> TextLine | None:
+        if self._delegate is not None:
+            return self._delegate.get_line()
+        return next(self._lines, None)
+
+
+_ORIGINAL = MultiLineBreak
+LAYOUT_CACHE = LayoutCache()
+
+
+def install(maxsize: int = DEFAULT_MAXSIZE) -> LayoutCache:
+    """Route fpdf's ``multi_cell`` line breaking through the shared cache."""
+    LAYOUT_CACHE.maxsize = maxsize
+    fpdf.fpdf.MultiLineBreak = _CachedMultiLineBreak
+    return LAYOUT_CACHE
+
+
+def uninstall() -> None:
+    """Restore fpdf's own ``MultiLineBreak``."""
+    fpdf.fpdf.MultiLineBreak = _ORIGINAL
@@ -0,0 +1,141 @@
+"""Parse the claudedocs Markdown sources into a cached document IR.
+
+The IR is a flat list of ``Block`` records that ``generate_pdfs`` renders
+through the same helper styles as the hardcoded generators. Parsed IR is
+cached on disk, keyed by the source file's mtime and SHA-256, so repeated
+renders of an unchanged file skip parsing entirely.
+
+Recognized Markdown:
+    # Title                               -> title
+    ## SECTION 3: THE SOLUTION [1:30 - 2:30] -> section (number, text, timestamp)
+    ## Other heading                      -> heading
+    ---                                   -> rule
+    [SCREEN DIRECTION: ...] / [...]       -> direction
+    **Label:** value                      -> field (label, text)
+    **Lead.** rest of paragraph           -> lead (label, text)
+    - item                                -> bullet
+    anything else                         -> paragraph (``**bold**`` kept inline)
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).resolve().parent / "build" / "ir"
+
+# Bump when the parser's output changes so stale cache entries are ignored.
+PARSER_VERSION = 1
+
+_SECTION_RE = re.compile(r"^##\s+SECTION\s+(\d+):\s*(.+?)\s*\[(.+)\]\s*$")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*$")
+_RULE_RE = re.compile(r"^-{3,}\s*$")
+_DIRECTION_RE = re.compile(r"^\[(.+)\]\s*$")
+_BULLET_RE = re.compile(r"^[-*]\s+(.+)$")
+_FIELD_RE = re.compile(r"^\*\*([^*]+:)\*\*\s*(.*)$")
+_LEAD_RE = re.compile(r"^\*\*([^*]+\.)\*\*\s+(.+)$")
+
+
+@dataclass
+class Block:
+    """One block-level element of a parsed document."""
+
+    kind: str
+    text: str = ""
+    label: str = ""
+    number: int = 0
+    timestamp: str = ""
+
+
+def parse_markdown(source: str) -> list[Block]:
+    """Parse Markdown ``source`` into a list of blocks."""
+    blocks: list[Block] = []
+    paragraph: list[str] = []
+
+    def _flush() -> None:
+        if paragraph:
+            text = " ".join(paragraph)
+            lead = _LEAD_RE.match(text)
+            if lead:
+                blocks.append(Block("lead", lead.group(2), label=lead.group(1)))
+            else:
+                blocks.append(Block("paragraph", text))
+            paragraph.clear()
+
+    for raw in source.splitlines():
+        line = raw.strip()
+        if not line:
+            _flush()
+            continue
+
+        section = _SECTION_RE.match(line)
+        heading = _HEADING_RE.match(line)
+        direction = _DIRECTION_RE.match(line)
+        bullet = _BULLET_RE.match(line)
+        field = _FIELD_RE.match(line)
+        if section:
+            _flush()
+            blocks.append(Block(
+                "section", section.group(2),
+                number=int(section.group(1)), timestamp=section.group(3),
+            ))
+        elif heading:
+            _flush()
+            kind = "title" if len(heading.group(1)) == 1 else "heading"
+            blocks.append(Block(kind, heading.group(2)))
+        elif _RULE_RE.match(line):
+            _flush()
+            blocks.append(Block("rule"))
+        elif direction:
+            _flush()
+            text = direction.group(1).removeprefix("SCREEN DIRECTION:").strip()
+            blocks.append(Block("direction", text))
+        elif bullet:
+            _flush()
+            blocks.append(Block("bullet", bullet.group(1)))
+        elif field:
+            _flush()
+            blocks.append(Block("field", field.group(2), label=field.group(1)))
+        else:
+            paragraph.append(line)
+    _flush()
+    return blocks
+
+
+def load_document(path: Path, cache_dir: Path = CACHE_DIR) -> list[Block]:
+    """Return the parsed blocks of ``path``, using the on-disk IR cache.
+
+    A matching mtime is trusted without reading the source. Otherwise the
+    content hash decides: an edit that leaves the bytes unchanged (e.g. a
+    ``touch``) only refreshes the cached mtime.
+    """
+    cache_path = cache_dir / f"{path.name}.json"
+    mtime_ns = path.stat().st_mtime_ns
+    try:
+        cached = json.loads(cache_path.read_text())
+        if cached["parser_version"] != PARSER_VERSION:
+            cached = None
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        cached = None
+
+    if cached is not None and cached["mtime_ns"] == mtime_ns:
+        return [Block(**block) for block in cached["blocks"]]
+
+    source = path.read_bytes()
+    digest = hashlib.sha256(source).hexdigest()
+    if cached is not None and cached["sha256"] == digest:
+        blocks = [Block(**block) for block in cached["blocks"]]
+    else:
+        blocks = parse_markdown(source.decode("utf-8"))
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({
+        "parser_version": PARSER_VERSION,
+        "mtime_ns": mtime_ns,
+        "sha256": digest,
+        "blocks": [asdict(block) for block in blocks],
+    }))
+    tmp.replace(cache_path)
+    return blocks
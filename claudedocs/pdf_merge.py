@@ -0,0 +1,228 @@
+"""Merge fpdf2 documents into one PDF, written as they arrive.
+
+``PdfMerger`` appends whole documents to an output file one at a time, so
+a document of any length can be rendered in fixed-size chunks of pages and
+merged without ever holding more than one chunk in memory. Per page it
+keeps only an object number; per shared object, a digest.
+
+Each appended document is parsed with ``pdf_optimize.parse``. Its objects
+are renumbered into the merged file. Its catalog, page tree, info
+dictionary and any outline are dropped, and its pages are reparented under
+one page tree. Objects that are byte-identical once renumbered are written
+once and shared by every chunk: font dictionaries, embedded font files,
+images and resource dictionaries. ``close`` writes the page tree, an
+outline built from ``OutlineEntry`` records, the catalog and a classic
+cross-reference table.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import BinaryIO, Iterable
+
+import pdf_optimize
+
+_REF_RE = re.compile(rb"(\d+) 0 R\b")
+_TRAILER_REF_RE = re.compile(rb"/(Root|Info) (\d+) 0 R")
+_ID_RE = re.compile(rb"/ID\s*\[\s*<([0-9A-Fa-f]*)>")
+_KIDS_RE = re.compile(rb"/Kids\s*\[([^\]]*)\]")
+_MEDIABOX_RE = re.compile(rb"/MediaBox\s*\[([^\]]*)\]")
+# Objects that belong to one place in the document and are never shared.
+_UNIQUE_RE = re.compile(rb"/Type\s*/(Page|Pages|Catalog|Annot|Outlines)\b|/(Parent|Kids|First|Next|Prev|P)\b")
+_STRING_ESCAPES = str.maketrans({"\\": "\\\\", "(": "\\(", ")": "\\)", "\r": "\\r", "\n": "\\n"})
+
+
+@dataclass(frozen=True)
+class OutlineEntry:
+    """One bookmark: ``level`` 0 is top level, each deeper level nests under the last entry above it."""
+
+    title: str
+    level: int
+    # Page index in the merged document, from 0.
+    page: int
+    # Distance of the target from the top of the page, in points.
+    top: float = 0.0
+
+
+def _pdf_string(text: str) -> bytes:
+    """Encode ``text`` as a PDF text string (Latin-1 literal, else UTF-16 hex)."""
+    try:
+        return b"(" + text.translate(_STRING_ESCAPES).encode("latin-1") + b")"
+    except UnicodeEncodeError:
+        return b"<FEFF" + text.encode("utf-16-be").hex().upper().encode() + b">"
+
+
+class PdfMerger:
+    """Concatenate the pages of fpdf2 documents into one PDF written to ``output``."""
+
+    def __init__(self, output: BinaryIO, optimize: bool = True) -> None:
+        self.output = output
+        # Recompress each chunk's streams with pdf_optimize before writing them.
+        self.optimize = optimize
+        self.position = 0
+        # File offset of every object by number; 0 is the head of the free list.
+        self.offsets: list[int | None] = [None]
+        self.pages: list[int] = []
+        self.page_heights: list[float] = []
+        self.documents = 0
+        self._shared: dict[bytes, int] = {}
+        self._info: bytes | None = None
+        self._id = hashlib.md5()
+        self._pages_num = self._reserve()
+        self._write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+
+    def _write(self, data: bytes) -> None:
+        self.output.write(data)
+        self.position += len(data)
+
+    def _reserve(self) -> int:
+        self.offsets.append(None)
+        return len(self.offsets) - 1
+
+    def _write_object(self, num: int, head: bytes, stream: bytes | None = None) -> None:
+        self.offsets[num] = self.position
+        self._write(b"%d 0 obj\n%s\n" % (num, head))
+        if stream is not None:
+            self._write(b"stream\n%s\nendstream\n" % stream)
+        self._write(b"endobj\n")
+
+    def append(self, data: bytes) -> int:
+        """Append every page of the fpdf2 document ``data``; return the number of pages added."""
+        objects, trailer = pdf_optimize.parse(data)
+        if self.optimize:
+            pdf_optimize.compress_streams(objects)
+        refs = {key: int(num) for key, num in _TRAILER_REF_RE.findall(trailer)}
+        catalog = objects[refs[b"Root"]]
+        pages_num = int(re.search(rb"/Pages (\d+) 0 R", catalog.head).group(1))
+        pages_root = objects[pages_num]
+        kids = [int(num) for num in _REF_RE.findall(_KIDS_RE.search(pages_root.head).group(1))]
+        mediabox = _MEDIABOX_RE.search(pages_root.head)
+        height = float(mediabox.group(1).split()[3]) if mediabox else 841.89
+
+        identifier = _ID_RE.search(trailer)
+        self._id.update(identifier.group(1) if identifier else hashlib.md5(data).digest())
+        if self._info is None and b"Info" in refs:
+            self._info = objects[refs[b"Info"]].head
+        contents = {
+            int(num) for kid in kids for num in re.findall(rb"/Contents (\d+) 0 R", objects[kid].head)
+        }
+
+        # Only objects reachable from the pages are copied; the chunk's
+        # catalog, info and outline are rebuilt for the whole file by close().
+        mapping = {pages_num: self._pages_num}
+        for kid in kids:
+            mapping[kid] = self._reserve()
+        in_progress: set[int] = set()
+
+        def resolve(num: int) -> int:
+            if num in mapping:
+                return mapping[num]
+            if num in in_progress:
+                # A reference cycle: number the object now, it is written when its turn comes.
+                mapping[num] = self._reserve()
+                return mapping[num]
+            obj = objects[num]
+            in_progress.add(num)
+            head = _REF_RE.sub(lambda match: b"%d 0 R" % resolve(int(match.group(1))), obj.head)
+            in_progress.discard(num)
+            if num in mapping:
+                self._write_object(mapping[num], head, obj.stream)
+            elif num in contents or _UNIQUE_RE.search(obj.head):
+                # Page content is never repeated; hashing it would only grow the digest table.
+                mapping[num] = self._reserve()
+                self._write_object(mapping[num], head, obj.stream)
+            else:
+                key = hashlib.sha256(head + b"\0" + (obj.stream or b"")).digest()
+                if key not in self._shared:
+                    self._shared[key] = self._reserve()
+                    self._write_object(self._shared[key], head, obj.stream)
+                mapping[num] = self._shared[key]
+            return mapping[num]
+
+        for kid in kids:
+            page = objects[kid]
+            head = page.head
+            if mediabox and b"/MediaBox" not in head:
+                # Inherited from the dropped page tree, so stated on the page instead.
+                head = head[:-2].rstrip() + b"\n" + mediabox.group(0) + b"\n>>"
+            head = _REF_RE.sub(lambda match: b"%d 0 R" % resolve(int(match.group(1))), head)
+            self._write_object(mapping[kid], head, page.stream)
+            self.pages.append(mapping[kid])
+            self.page_heights.append(height)
+        self.documents += 1
+        return len(kids)
+
+    def _write_outline(self, entries: Iterable[OutlineEntry]) -> int | None:
+        """Write the outline tree and return the number of its root, if there is one."""
+        root: dict = {"num": None, "children": [], "level": -1}
+        nodes: list[dict] = []
+        stack = [root]
+        for entry in entries:
+            while stack[-1]["level"] >= entry.level:
+                stack.pop()
+            node = {"num": self._reserve(), "children": [], "level": entry.level, "entry": entry}
+            stack[-1]["children"].append(node)
+            stack.append(node)
+            nodes.append(node)
+        if not nodes:
+            return None
+        root["num"] = self._reserve()
+        for parent in [root, *nodes]:
+            siblings = parent["children"]
+            for index, node in enumerate(siblings):
+                entry: OutlineEntry = node["entry"]
+                parts = [
+                    b"/Title " + _pdf_string(entry.title),
+                    b"/Parent %d 0 R" % parent["num"],
+                    b"/Dest [%d 0 R /XYZ 0 %.2f null]"
+                    % (self.pages[entry.page], self.page_heights[entry.page] - entry.top),
+                ]
+                if index > 0:
+                    parts.append(b"/Prev %d 0 R" % siblings[index - 1]["num"])
+                if index + 1 < len(siblings):
+                    parts.append(b"/Next %d 0 R" % siblings[index + 1]["num"])
+                if node["children"]:
+                    # Top-level entries open, deeper ones collapsed.
+                    count = len(node["children"]) if parent is root else -len(node["children"])
+                    parts.append(
+                        b"/First %d 0 R /Last %d 0 R /Count %d"
+                        % (node["children"][0]["num"], node["children"][-1]["num"], count)
+                    )
+                self._write_object(node["num"], b"<<" + b"\n".join(parts) + b">>")
+        children = root["children"]
+        count = sum(1 + len(node["children"]) for node in children)
+        self._write_object(
+            root["num"],
+            b"<</Type /Outlines /First %d 0 R /Last %d 0 R /Count %d>>"
+            % (children[0]["num"], children[-1]["num"], count),
+        )
+        return root["num"]
+
+    def close(self, outline: Iterable[OutlineEntry] = ()) -> None:
+        """Write the page tree, ``outline``, catalog, info and cross-reference table."""
+        kids = b" ".join(b"%d 0 R" % num for num in self.pages)
+        self._write_object(self._pages_num, b"<</Type /Pages /Kids [%s] /Count %d>>" % (kids, len(self.pages)))
+        outline_num = self._write_outline(outline)
+        catalog_num = self._reserve()
+        catalog = b"<</Type /Catalog /Pages %d 0 R" % self._pages_num
+        if outline_num is not None:
+            catalog += b" /Outlines %d 0 R /PageMode /UseOutlines" % outline_num
+        self._write_object(catalog_num, catalog + b">>")
+        info_num = None
+        if self._info is not None:
+            info_num = self._reserve()
+            self._write_object(info_num, self._info)
+
+        xref_offset = self.position
+        rows = [b"xref\n0 %d\n0000000000 65535 f \n" % len(self.offsets)]
+        rows.extend(
+            b"%010d 00000 n \n" % offset if offset is not None else b"0000000000 65535 f \n"
+            for offset in self.offsets[1:]
+        )
+        self._write(b"".join(rows))
+        identifier = self._id.hexdigest().upper().encode()
+        info = b" /Info %d 0 R" % info_num if info_num is not None else b""
+        self._write(
+            b"trailer\n<</Size %d /Root %d 0 R%s /ID [<%s><%s>]>>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(self.offsets), catalog_num, info, identifier, identifier, xref_offset)
+        )
@@ -0,0 +1,343 @@
+"""Shrink fpdf2 output for delivery over WhatsApp and slow mobile links.
+
+``optimize()`` rewrites a finished PDF losslessly:
+
+* page content streams are minified (redundant zeros dropped from numbers
+  outside of text strings) and every Flate stream is recompressed at
+  level 9, keeping whichever encoding is smaller;
+* identical objects (fonts, resource dictionaries, images, graphics
+  states, streams) are merged and references to them rewritten;
+* the file is written as PDF 1.5 (or the input's version, if later)
+  with all non-stream objects packed into a compressed object stream and
+  a compressed cross-reference stream, which removes most of the fixed
+  per-object overhead.
+
+fpdf2 already subsets embedded TrueType fonts to the glyphs used and
+stores each image once per document, and the core fonts used here are not
+embedded at all, so those need no further work.
+
+Encrypted or signed documents are returned unchanged, since their bytes
+are tied to object numbers and offsets.
+"""
+
+import hashlib
+import re
+import zlib
+from dataclasses import dataclass
+
+COMPRESSION_LEVEL = 9
+# Objects packed into a single object stream.
+OBJECTS_PER_STREAM = 500
+
+_OBJ_RE = re.compile(rb"\s*(\d+) 0 obj\s*")
+_VERSION_RE = re.compile(rb"%PDF-(\d+)\.(\d+)")
+_REF_RE = re.compile(rb"(\d+) 0 R\b")
+_LENGTH_RE = re.compile(rb"/Length (\d+)")
+_CONTENTS_RE = re.compile(rb"/Contents (\d+) 0 R")
+_STRING_RE = re.compile(rb"(\((?:\\.|[^\\)])*\)|<[0-9A-Fa-f\s]*>)", re.S)
+_NUMBER_RE = re.compile(rb"(?<![\w.])(-?\d*\.\d+)(?![\w.])")
+# Objects whose identity matters (page tree, annotations, outline, structure).
+_UNIQUE_RE = re.compile(rb"/Type\s*/(Page|Pages|Catalog|Annot|Outlines)\b|/(Parent|Kids|First|Next|Prev|P)\b")
+
+
+@dataclass
+class PdfObject:
+    """One indirect object: its dictionary (or other value) and its stream bytes, if any."""
+
+    head: bytes
+    stream: bytes | None = None
+
+
+class OptimizerStats:
+    """Byte counts of documents passed through ``optimize()``."""
+
+    def __init__(self) -> None:
+        self.documents = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def saved(self) -> float:
+        """Fraction of input bytes removed so far."""
+        return 1 - self.bytes_out / self.bytes_in if self.bytes_in else 0.0
+
+
+OPTIMIZER = OptimizerStats()
+
+
+def optimize(data: bytes) -> bytes:
+    """Return a smaller, visually identical version of the PDF ``data``."""
+    OPTIMIZER.documents += 1
+    OPTIMIZER.bytes_in += len(data)
+    try:
+        objects, trailer = parse(data)
+    except (ValueError, zlib.error):
+        objects = None
+    if objects is None or b"/Encrypt" in trailer or any(b"/ByteRange" in o.head for o in objects.values()):
+        OPTIMIZER.bytes_out += len(data)
+        return data
+
+    compress_streams(objects)
+    renumber = _dedupe(objects)
+    trailer = _REF_RE.sub(lambda m: b"%d 0 R" % renumber.get(int(m.group(1)), int(m.group(1))), trailer)
+    version = _VERSION_RE.match(data)
+    result = _serialize(objects, trailer, (int(version[1]), int(version[2])) if version else (1, 3))
+    if len(result) >= len(data):
+        result = data
+    OPTIMIZER.bytes_out += len(result)
+    return result
+
+
+# --- parsing ---------------------------------------------------------------
+
+def _value_end(data: bytes, pos: int) -> int:
+    """Return the index just past the dictionary or array starting at ``pos``."""
+    depth = 0
+    n = len(data)
+    while pos < n:
+        ch = data[pos]
+        if ch == 0x28:  # "(" literal string, may nest and contain escapes
+            level = 1
+            pos += 1
+            while level:
+                c = data[pos]
+                if c == 0x5C:
+                    pos += 1
+                elif c == 0x28:
+                    level += 1
+                elif c == 0x29:
+                    level -= 1
+                pos += 1
+            continue
+        if data.startswith(b"<<", pos) or ch == 0x5B:
+            depth += 1
+            pos += 2 if ch == 0x3C else 1
+        elif data.startswith(b">>", pos) or ch == 0x5D:
+            depth -= 1
+            pos += 2 if ch == 0x3E else 1
+            if depth == 0:
+                return pos
+        elif ch == 0x3C:  # "<" hex string
+            pos = data.index(b">", pos) + 1
+        else:
+            pos += 1
+    raise ValueError("unterminated object")
+
+
+def parse(data: bytes) -> tuple[dict[int, PdfObject], bytes]:
+    """Split fpdf2 output into its objects and trailer dictionary."""
+    objects, pos = _parse_objects(data)
+    trailer_at = data.index(b"trailer", pos)
+    start = data.index(b"<<", trailer_at)
+    return objects, data[start:_value_end(data, start)]
+
+
+def _parse_objects(data: bytes) -> tuple[dict[int, PdfObject], int]:
+    """Split the objects at the top level of ``data``; return them and the offset past the last."""
+    objects: dict[int, PdfObject] = {}
+    pos = 0
+    while data.startswith(b"%", pos):  # header and binary-marker comments
+        pos = data.index(b"\n", pos) + 1
+    while True:
+        match = _OBJ_RE.match(data, pos)
+        if match is None:
+            break
+        start = match.end()
+        if data[start:start + 1] in (b"<", b"["):
+            end = _value_end(data, start)
+        else:
+            end = data.index(b"endobj", start)
+        obj = PdfObject(data[start:end].strip())
+        pos = end
+        stream = re.compile(rb"\s*stream\r?\n").match(data, pos)
+        if stream is not None:
+            length = int(_LENGTH_RE.search(obj.head).group(1))
+            obj.stream = data[stream.end():stream.end() + length]
+            pos = data.index(b"endstream", stream.end() + length) + len(b"endstream")
+        pos = data.index(b"endobj", pos) + len(b"endobj")
+        objects[int(match.group(1))] = obj
+    return objects, pos
+
+
+def page_count(data: bytes) -> int:
+    """Return the page count of a PDF written by fpdf2, ``optimize`` or ``pdf_merge``.
+
+    It is the ``/Count`` of the page tree root. In optimized files that
+    and every other dictionary sit in compressed object streams, so they
+    are unpacked first, and the cross-reference stream stands in for the
+    trailer.
+    """
+    objects, pos = _parse_objects(data)
+    trailer_at = data.find(b"trailer", pos)
+    if trailer_at >= 0:
+        start = data.index(b"<<", trailer_at)
+        trailer = data[start:_value_end(data, start)]
+    else:
+        trailer = next(obj.head for obj in objects.values() if b"/Type /XRef" in obj.head)
+    for obj in list(objects.values()):
+        if b"/Type /ObjStm" in obj.head:
+            packed = zlib.decompress(obj.stream)
+            first = int(re.search(rb"/First (\d+)", obj.head).group(1))
+            index = packed[:first].split()
+            offsets = [first + int(offset) for offset in index[1::2]] + [len(packed)]
+            for i, num in enumerate(index[::2]):
+                objects[int(num)] = PdfObject(packed[offsets[i]:offsets[i + 1]].strip())
+    root = int(re.search(rb"/Root (\d+) 0 R", trailer).group(1))
+    pages = int(re.search(rb"/Pages (\d+) 0 R", objects[root].head).group(1))
+    return int(re.search(rb"/Count (\d+)", objects[pages].head).group(1))
+
+
+# --- stream compression ------------------------------------------------------
+
+def _trim_number(match: re.Match) -> bytes:
+    text = match.group(1).rstrip(b"0").rstrip(b".")
+    if text.startswith(b"0."):
+        text = text[1:]
+    elif text.startswith(b"-0."):
+        text = b"-" + text[2:]
+    return text if text not in (b"", b"-") else b"0"
+
+
+def minify_content(content: bytes) -> bytes:
+    """Drop redundant zeros from numbers in a content stream, leaving strings alone."""
+    parts = _STRING_RE.split(content)
+    for i in range(0, len(parts), 2):
+        parts[i] = _NUMBER_RE.sub(_trim_number, parts[i])
+    return b"".join(parts)
+
+
+def compress_streams(objects: dict[int, PdfObject]) -> None:
+    """Minify page content streams and recompress every Flate stream at ``COMPRESSION_LEVEL``."""
+    contents = {int(n) for obj in objects.values() for n in _CONTENTS_RE.findall(obj.head)}
+    for num, obj in objects.items():
+        if obj.stream is None:
+            continue
+        filters = re.search(rb"/Filter\s*(/\w+|\[[^\]]*\])", obj.head)
+        if filters is None:
+            if num not in contents:
+                continue
+            raw = obj.stream
+            head = obj.head[:-2].rstrip() + b"\n/Filter /FlateDecode\n>>"
+        elif filters.group(1) == b"/FlateDecode":
+            raw = zlib.decompress(obj.stream)
+            head = obj.head
+        else:
+            continue
+        if num in contents:
+            raw = minify_content(raw)
+        packed = zlib.compress(raw, COMPRESSION_LEVEL)
+        if len(packed) < len(obj.stream) or head is not obj.head:
+            obj.head = _LENGTH_RE.sub(b"/Length %d" % len(packed), head)
+            obj.stream = packed
+
+
+# --- dedupe ------------------------------------------------------------------
+
+def _dedupe(objects: dict[int, PdfObject]) -> dict[int, int]:
+    """Merge identical objects and renumber the rest densely from 1.
+
+    Returns the old-to-new object number mapping.
+    """
+    while True:
+        seen: dict[bytes, int] = {}
+        duplicates: dict[int, int] = {}
+        for num, obj in objects.items():
+            if _UNIQUE_RE.search(obj.head):
+                continue
+            key = hashlib.sha256(obj.head + b"\0" + (obj.stream or b"")).digest()
+            if key in seen:
+                duplicates[num] = seen[key]
+            else:
+                seen[key] = num
+        if not duplicates:
+            break
+        for num in duplicates:
+            del objects[num]
+        _rewrite_refs(objects, duplicates)
+
+    renumber = {old: new for new, old in enumerate(sorted(objects), start=1)}
+    _rewrite_refs(objects, renumber)
+    objects_by_new = {renumber[old]: obj for old, obj in objects.items()}
+    objects.clear()
+    objects.update(objects_by_new)
+    return renumber
+
+
+def _rewrite_refs(objects: dict[int, PdfObject], mapping: dict[int, int]) -> None:
+    def _sub(match: re.Match) -> bytes:
+        return b"%d 0 R" % mapping.get(int(match.group(1)), int(match.group(1)))
+
+    for obj in objects.values():
+        obj.head = _REF_RE.sub(_sub, obj.head)
+
+
+# --- serialization -----------------------------------------------------------
+
+def _serialize(objects: dict[int, PdfObject], trailer: bytes, version: tuple[int, int] = (1, 3)) -> bytes:
+    """Write ``objects`` with object and cross-reference streams, as PDF ``version`` or 1.5 if older."""
+    out = bytearray(b"%%PDF-%d.%d\n%%\xe2\xe3\xcf\xd3\n" % max(version, (1, 5)))
+    next_num = max(objects, default=0) + 1
+    xref: dict[int, tuple[int, int, int]] = {}
+
+    def _write(num: int, head: bytes, stream: bytes | None = None) -> None:
+        xref[num] = (1, len(out), 0)
+        out.extend(b"%d 0 obj\n%s\n" % (num, head))
+        if stream is not None:
+            out.extend(b"stream\n%s\nendstream\n" % stream)
+        out.extend(b"endobj\n")
+
+    packable = [num for num, obj in sorted(objects.items()) if obj.stream is None]
+    for num, obj in sorted(objects.items()):
+        if obj.stream is not None:
+            _write(num, obj.head, obj.stream)
+
+    for chunk_start in range(0, len(packable), OBJECTS_PER_STREAM):
+        chunk = packable[chunk_start:chunk_start + OBJECTS_PER_STREAM]
+        stream_num = next_num
+        next_num += 1
+        offsets, bodies, offset = [], [], 0
+        for index, num in enumerate(chunk):
+            body = _compact(objects[num].head) + b"\n"
+            offsets.append(b"%d %d" % (num, offset))
+            bodies.append(body)
+            offset += len(body)
+            xref[num] = (2, stream_num, index)
+        index_table = b" ".join(offsets) + b"\n"
+        packed = zlib.compress(index_table + b"".join(bodies), COMPRESSION_LEVEL)
+        _write(
+            stream_num,
+            b"<</Type /ObjStm /N %d /First %d /Filter /FlateDecode /Length %d>>"
+            % (len(chunk), len(index_table), len(packed)),
+            packed,
+        )
+
+    xref_num = next_num
+    xref[xref_num] = (1, len(out), 0)
+    width = max(1, (len(out).bit_length() + 7) // 8)
+    rows = bytearray(b"\x00" + b"\x00" * width + b"\xff\xff")
+    for num in range(1, xref_num + 1):
+        kind, field2, field3 = xref.get(num, (0, 0, 0))
+        rows.append(kind)
+        rows.extend(field2.to_bytes(width, "big"))
+        rows.extend(field3.to_bytes(2, "big"))
+    packed = zlib.compress(bytes(rows), COMPRESSION_LEVEL)
+    keys = b" ".join(
+        re.search(rb"/%s\s*(\d+ 0 R|\[[^\]]*\])" % key, trailer).group(0)
+        for key in (b"Root", b"Info", b"ID")
+        if re.search(rb"/%s\b" % key, trailer)
+    )
+    xref_offset = len(out)
+    out.extend(
+        b"%d 0 obj\n<</Type /XRef /Size %d /W [1 %d 2] %s /Filter /FlateDecode /Length %d>>\nstream\n"
+        % (xref_num, xref_num + 1, width, keys, len(packed))
+    )
+    out.extend(packed)
+    out.extend(b"\nendstream\nendobj\nstartxref\n%d\n%%%%EOF\n" % xref_offset)
+    return bytes(out)
+
+
+def _compact(head: bytes) -> bytes:
+    """Collapse the line breaks fpdf2 puts between dictionary entries."""
+    parts = _STRING_RE.split(head)
+    for i in range(0, len(parts), 2):
+        parts[i] = re.sub(rb"\s*\n\s*", b" ", parts[i])
+    return b"".join(parts)
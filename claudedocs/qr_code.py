@@ -0,0 +1,349 @@
+"""QR codes drawn as vector rectangles, without a QR or imaging library.
+
+``encode`` builds a byte-mode QR code (ISO/IEC 18004, versions 1 to 10)
+for a short payload such as a seller page URL. It picks the smallest
+version that fits and the mask with the lowest penalty score, as a
+scanner-friendly encoder must. ``draw_qr`` writes the dark modules to a
+page as filled rectangles, in one block of content-stream operators the
+way ``charts`` draws its shapes. Runs of dark modules in a row become one
+rectangle, and identical runs in consecutive rows are merged into a
+taller one. The code stays sharp at any print size, and a certificate
+page holds a few hundred path operators rather than an image.
+
+Positions and sizes are in the document's unit (mm).
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable
+
+from fpdf import FPDF
+
+RGB = tuple[int, int, int]
+
+# Light modules the standard requires around the symbol; callers leave the space.
+QUIET_ZONE = 4
+
+# Error correction levels: (format bits, {version: (EC codewords per block, block groups)}),
+# where each group is (blocks, data codewords per block). Table 9 of the standard.
+_LEVELS = {
+    "L": (1, {
+        1: (7, ((1, 19),)), 2: (10, ((1, 34),)), 3: (15, ((1, 55),)), 4: (20, ((1, 80),)),
+        5: (26, ((1, 108),)), 6: (18, ((2, 68),)), 7: (20, ((2, 78),)), 8: (24, ((2, 97),)),
+        9: (30, ((2, 116),)), 10: (18, ((2, 68), (2, 69))),
+    }),
+    "M": (0, {
+        1: (10, ((1, 16),)), 2: (16, ((1, 28),)), 3: (26, ((1, 44),)), 4: (18, ((2, 32),)),
+        5: (24, ((2, 43),)), 6: (16, ((4, 27),)), 7: (18, ((4, 31),)), 8: (22, ((2, 38), (2, 39))),
+        9: (22, ((3, 36), (2, 37))), 10: (26, ((4, 43), (1, 44))),
+    }),
+    "Q": (3, {
+        1: (13, ((1, 13),)), 2: (22, ((1, 22),)), 3: (18, ((2, 17),)), 4: (26, ((2, 24),)),
+        5: (18, ((2, 15), (2, 16))), 6: (24, ((4, 19),)), 7: (18, ((2, 14), (4, 15))),
+        8: (22, ((4, 18), (2, 19))), 9: (20, ((4, 16), (4, 17))), 10: (24, ((6, 19), (2, 20))),
+    }),
+    "H": (2, {
+        1: (17, ((1, 9),)), 2: (28, ((1, 16),)), 3: (22, ((2, 13),)), 4: (16, ((4, 9),)),
+        5: (22, ((2, 11), (2, 12))), 6: (28, ((4, 15),)), 7: (26, ((4, 13), (1, 14))),
+        8: (26, ((4, 14), (2, 15))), 9: (24, ((4, 12), (4, 13))), 10: (28, ((6, 15), (2, 16))),
+    }),
+}
+MAX_VERSION = 10
+
+# Row/column centers of the alignment patterns, by version.
+_ALIGNMENT = {
+    1: (), 2: (6, 18), 3: (6, 22), 4: (6, 26), 5: (6, 30),
+    6: (6, 34), 7: (6, 22, 38), 8: (6, 24, 42), 9: (6, 26, 46), 10: (6, 28, 50),
+}
+
+_MASKS = (
+    lambda r, c: (r + c) % 2 == 0,
+    lambda r, c: r % 2 == 0,
+    lambda r, c: c % 3 == 0,
+    lambda r, c: (r + c) % 3 == 0,
+    lambda r, c: (r // 2 + c // 3) % 2 == 0,
+    lambda r, c: r * c % 2 + r * c % 3 == 0,
+    lambda r, c: (r * c % 2 + r * c % 3) % 2 == 0,
+    lambda r, c: ((r + c) % 2 + r * c % 3) % 2 == 0,
+)
+
+_RUN_RE = re.compile(r"0{5,}|1{5,}")
+_DARK_RUN_RE = re.compile("1+")
+# A finder-like 1:1:3:1:1 pattern with four light modules on one side.
+_FINDER_LIKE = ("00001011101", "10111010000")
+
+# GF(256) with the QR polynomial x^8 + x^4 + x^3 + x^2 + 1.
+_EXP = [0] * 512
+_LOG = [0] * 256
+_value = 1
+for _i in range(255):
+    _EXP[_i] = _value
+    _LOG[_value] = _i
+    _value <<= 1
+    if _value & 0x100:
+        _value ^= 0x11D
+for _i in range(255, 512):
+    _EXP[_i] = _EXP[_i - 255]
+
+
+@dataclass(frozen=True)
+class QrCode:
+    """A QR symbol: ``modules[row][column]`` is True for a dark module."""
+
+    version: int
+    level: str
+    mask: int
+    modules: tuple[tuple[bool, ...], ...]
+
+    @property
+    def size(self) -> int:
+        return len(self.modules)
+
+
+@lru_cache(maxsize=None)
+def _generator(degree: int) -> tuple[int, ...]:
+    """Reed-Solomon generator polynomial of ``degree``, highest power first (leading 1 omitted)."""
+    poly = [1]
+    for i in range(degree):
+        poly = [
+            (poly[j] if j < len(poly) else 0) ^ (_EXP[_LOG[poly[j - 1]] + i] if 0 < j and poly[j - 1] else 0)
+            for j in range(len(poly) + 1)
+        ]
+    return tuple(poly[1:])
+
+
+def _ec_codewords(data: list[int], degree: int) -> list[int]:
+    generator = [_LOG[g] for g in _generator(degree)]
+    remainder = [0] * degree
+    for byte in data:
+        factor = byte ^ remainder.pop(0)
+        remainder.append(0)
+        if factor:
+            log_factor = _LOG[factor]
+            for i, log_g in enumerate(generator):
+                remainder[i] ^= _EXP[log_g + log_factor]
+    return remainder
+
+
+def _codewords(payload: bytes, version: int, level: str) -> list[int]:
+    """Encode ``payload`` in byte mode, pad it and interleave the blocks with their EC codewords."""
+    ec_len, groups = _LEVELS[level][1][version]
+    capacity = sum(blocks * size for blocks, size in groups)
+    count_bits = 8 if version < 10 else 16
+    bits = "0100" + format(len(payload), f"0{count_bits}b") + "".join(format(b, "08b") for b in payload)
+    bits += "0" * min(4, capacity * 8 - len(bits))
+    bits += "0" * (-len(bits) % 8)
+    data = [int(bits[i:i + 8], 2) for i in range(0, len(bits), 8)]
+    data += [0xEC, 0x11] * ((capacity - len(data)) // 2) + [0xEC] * ((capacity - len(data)) % 2)
+
+    blocks, start = [], 0
+    for count, size in groups:
+        for _ in range(count):
+            blocks.append(data[start:start + size])
+            start += size
+    ecs = [_ec_codewords(block, ec_len) for block in blocks]
+    longest = max(len(block) for block in blocks)
+    out = [block[i] for i in range(longest) for block in blocks if i < len(block)]
+    out += [ec[i] for i in range(ec_len) for ec in ecs]
+    return out
+
+
+def _bch(value: int, poly: int, bits: int) -> int:
+    """Append the ``bits``-bit BCH remainder of ``value`` for generator ``poly``."""
+    remainder = value << bits
+    degree = poly.bit_length() - 1
+    for shift in range(remainder.bit_length() - 1, degree - 1, -1):
+        if remainder >> shift & 1:
+            remainder ^= poly << (shift - degree)
+    return value << bits | remainder
+
+
+class _Matrix:
+    """The function patterns of one version, with the data and format areas still open."""
+
+    def __init__(self, version: int) -> None:
+        self.version = version
+        self.size = size = 17 + 4 * version
+        self.dark = [[False] * size for _ in range(size)]
+        self.reserved = [[False] * size for _ in range(size)]
+        for row, col in ((0, 0), (0, size - 7), (size - 7, 0)):
+            self._finder(row, col)
+        for i in range(8, size - 8):
+            self._set(6, i, i % 2 == 0)
+            self._set(i, 6, i % 2 == 0)
+        centers = _ALIGNMENT[version]
+        corners = {(centers[0], centers[0]), (centers[0], centers[-1]), (centers[-1], centers[0])} if centers else ()
+        for row in centers:
+            for col in centers:
+                # Every pair of centers, except the three under the finders.
+                if (row, col) not in corners:
+                    for dr in range(-2, 3):
+                        for dc in range(-2, 3):
+                            self._set(row + dr, col + dc, max(abs(dr), abs(dc)) != 1)
+        # Format information areas, filled in per mask by ``symbol``.
+        for i in range(9):
+            self.reserved[8][i] = self.reserved[i][8] = True
+        for i in range(8):
+            self.reserved[8][size - 1 - i] = self.reserved[size - 1 - i][8] = True
+        self._set(size - 8, 8, True)
+        if version >= 7:
+            info = _bch(version, 0x1F25, 12)
+            for i in range(18):
+                bit = bool(info >> i & 1)
+                self._set(i // 3, size - 11 + i % 3, bit)
+                self._set(size - 11 + i % 3, i // 3, bit)
+        # Data cells in placement order: two-column strips from the right, snaking up and down.
+        self.cells: list[tuple[int, int]] = []
+        upward = True
+        col = size - 1
+        while col > 0:
+            if col == 6:
+                col -= 1
+            rows = range(size - 1, -1, -1) if upward else range(size)
+            for row in rows:
+                for c in (col, col - 1):
+                    if not self.reserved[row][c]:
+                        self.cells.append((row, c))
+            upward = not upward
+            col -= 2
+        # Function modules, and the data cells each mask inverts, as rows of bits.
+        self.function = self._rows(
+            (row, col) for row in range(size) for col in range(size) if self.dark[row][col]
+        )
+        self.masks = [self._rows(cell for cell in self.cells if test(*cell)) for test in _MASKS]
+        # (bit of the format information, row, column), for both copies.
+        self.format_cells = [
+            *((i, i, 8) for i in range(6)), (6, 7, 8), (7, 8, 8), (8, 8, 7),
+            *((i, 8, 14 - i) for i in range(9, 15)),
+            *((i, 8, size - 1 - i) for i in range(8)),
+            *((i, size - 15 + i, 8) for i in range(8, 15)),
+        ]
+
+    def _set(self, row: int, col: int, dark: bool) -> None:
+        self.dark[row][col] = dark
+        self.reserved[row][col] = True
+
+    def _finder(self, top: int, left: int) -> None:
+        # The 7x7 pattern and its light separator, clipped at the symbol's edge.
+        for dr in range(-1, 8):
+            for dc in range(-1, 8):
+                row, col = top + dr, left + dc
+                if 0 <= row < self.size and 0 <= col < self.size:
+                    ring = max(abs(dr - 3), abs(dc - 3))
+                    self._set(row, col, ring != 2 and ring != 4)
+
+    def _rows(self, cells: Iterable[tuple[int, int]]) -> list[int]:
+        """Return ``cells`` as one int per row, column 0 in the most significant bit."""
+        rows = [0] * self.size
+        for row, col in cells:
+            rows[row] |= 1 << (self.size - 1 - col)
+        return rows
+
+    def place(self, codewords: list[int]) -> list[int]:
+        """Lay ``codewords`` out in the data cells, unmasked; any cells left over are remainder bits (zero)."""
+        bits = "".join(format(cw, "08b") for cw in codewords)
+        return self._rows(cell for cell, bit in zip(self.cells, bits) if bit == "1")
+
+    def symbol(self, data: list[int], level: str, mask: int) -> list[int]:
+        """Return the rows of the finished symbol for placed ``data``, masked with ``mask``."""
+        rows = [function | (cells ^ flips) for function, cells, flips in zip(self.function, data, self.masks[mask])]
+        info = _bch(_LEVELS[level][0] << 3 | mask, 0x537, 10) ^ 0x5412
+        for bit, row, col in self.format_cells:
+            if info >> bit & 1:
+                rows[row] |= 1 << (self.size - 1 - col)
+        return rows
+
+
+@lru_cache(maxsize=MAX_VERSION)
+def _matrix(version: int) -> _Matrix:
+    return _Matrix(version)
+
+
+def _penalty(rows: list[int], size: int) -> int:
+    """Score a masked symbol by the four penalty rules of the standard (lower is better)."""
+    lines = [format(row, f"0{size}b") for row in rows]
+    lines += ["".join(col) for col in zip(*lines)]
+    # Every row and column at once: runs and patterns cannot span the separators.
+    runs = _RUN_RE.findall("|".join(lines))
+    score = sum(map(len, runs)) - 2 * len(runs)
+    padded = "0000" + "0000|0000".join(lines) + "0000"
+    score += 40 * (padded.count(_FINDER_LIKE[0]) + padded.count(_FINDER_LIKE[1]))
+    # 2x2 blocks of one color: equal to the module below and both equal to their right neighbours.
+    full = (1 << (size - 1)) - 1
+    for upper, lower in zip(rows, rows[1:]):
+        same = ~(upper ^ lower)
+        score += 3 * (same & (same >> 1) & ~(upper ^ (upper >> 1)) & full).bit_count()
+    dark = sum(row.bit_count() for row in rows)
+    score += 10 * (abs(dark * 20 - size * size * 10) // (size * size))
+    return score
+
+
+def encode(data: str | bytes, level: str = "M", mask: int | None = None) -> QrCode:
+    """Return the smallest QR code holding ``data`` (UTF-8 if text) at error correction ``level``.
+
+    ``mask`` forces one of the eight masks; by default the best scoring
+    one is used. Raises ``ValueError`` if ``data`` needs more than version
+    ``MAX_VERSION``.
+    """
+    payload = data.encode("utf-8") if isinstance(data, str) else data
+    if level not in _LEVELS:
+        raise ValueError(f"unknown error correction level {level!r}; use one of {', '.join(_LEVELS)}")
+    for version in range(1, MAX_VERSION + 1):
+        _, groups = _LEVELS[level][1][version]
+        capacity = sum(blocks * size for blocks, size in groups)
+        if 4 + (8 if version < 10 else 16) + 8 * len(payload) <= capacity * 8:
+            break
+    else:
+        raise ValueError(
+            f"{len(payload)} bytes do not fit a version {MAX_VERSION} QR code at level {level}"
+        )
+    matrix = _matrix(version)
+    data = matrix.place(_codewords(payload, version, level))
+    if mask is None:
+        candidates = [(matrix.symbol(data, level, m), m) for m in range(len(_MASKS))]
+        rows, mask = min(candidates, key=lambda candidate: _penalty(candidate[0], matrix.size))
+    else:
+        rows = matrix.symbol(data, level, mask)
+    modules = tuple(tuple(bit == "1" for bit in format(row, f"0{matrix.size}b")) for row in rows)
+    return QrCode(version, level, mask, modules)
+
+
+def module_rects(code: QrCode) -> list[tuple[int, int, int, int]]:
+    """Cover the dark modules with ``(column, row, width, height)`` rectangles, in modules.
+
+    Each row's dark runs are found, and a run continues the rectangle of
+    the same run in the row above if there is one.
+    """
+    rects: list[list[int]] = []
+    # Index in ``rects`` of each (start, width) run of the previous row.
+    above: dict[tuple[int, int], int] = {}
+    for row, modules in enumerate(code.modules):
+        line = "".join("1" if dark else "0" for dark in modules)
+        current: dict[tuple[int, int], int] = {}
+        for match in _DARK_RUN_RE.finditer(line):
+            run = (match.start(), match.end() - match.start())
+            index = above.get(run)
+            if index is None:
+                index = len(rects)
+                rects.append([run[0], row, run[1], 0])
+            rects[index][3] += 1
+            current[run] = index
+        above = current
+    return [(col, row, width, height) for col, row, width, height in rects]
+
+
+def draw_qr(pdf: FPDF, code: QrCode, x: float, y: float, size: float, color: RGB = (0, 0, 0)) -> None:
+    """Fill the dark modules of ``code`` in a ``size`` square at ``(x, y)``, quiet zone not included."""
+    k = pdf.k
+    scale = size / code.size * k
+    # One module per unit, rows counting down from the top-left corner: every
+    # rectangle is in whole modules, so neighbours meet exactly.
+    ops = [
+        "q",
+        "{:.3f} {:.3f} {:.3f} rg".format(*(c / 255 for c in color)),
+        f"{scale:.4f} 0 0 {-scale:.4f} {x * k:.2f} {(pdf.h - y) * k:.2f} cm",
+        " ".join(f"{col} {row} {width} {height} re" for col, row, width, height in module_rects(code)) + " f",
+        "Q\n",
+    ]
+    pdf.pages[pdf.page].contents.extend("\n".join(ops).encode("latin-1"))
@@ -0,0 +1,262 @@
+"""Persistent render job queue, kept in a local SQLite database.
+
+Registry-wide one-pager runs take hours, so a run that crashes or is
+interrupted partway through should not start over. ``RenderQueue`` records
+every job of a run in one table before any of it renders. It then hands
+jobs out one at a time and records each outcome as soon as it is known.
+A restarted run re-enqueues the same jobs and renders only those not yet
+done.
+
+* A job is identified by the file it writes and keyed by a hash of its
+  inputs. Enqueueing a job whose key is already recorded does nothing,
+  whatever its state. A changed key (edited row, edited generator) puts
+  the job back in the queue.
+* Pending jobs are claimed highest ``priority`` first, then in the order
+  they were first enqueued.
+* A failed job is retried after an exponential backoff
+  (``RETRY_BACKOFF * 2 ** (attempts - 1)`` seconds, at most
+  ``RETRY_BACKOFF_MAX``) until it has failed ``max_attempts`` times.
+  Then it stays ``failed`` until it is enqueued again.
+* A claimed job records the process that claimed it. Jobs left
+  ``running`` by a process that no longer exists are returned to the
+  queue by ``recover``, and an interrupted attempt does not count as a
+  failure.
+
+Several processes may drain one queue at once: a claim selects and marks
+its job in one ``BEGIN IMMEDIATE`` transaction, which SQLite serializes. The database is in WAL mode, and
+every state change is committed on its own, so a crash loses no
+recorded progress.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable
+
+# Seconds before the first retry of a failed job; each further retry waits twice as long.
+RETRY_BACKOFF = 2.0
+RETRY_BACKOFF_MAX = 300.0
+DEFAULT_ATTEMPTS = 3
+# Seconds a statement waits for another process's write lock.
+BUSY_TIMEOUT = 30.0
+# Jobs inserted per transaction by ``enqueue``.
+ENQUEUE_BATCH = 1000
+
+STATES = ("pending", "running", "done", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    output TEXT PRIMARY KEY,
+    key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    args TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    not_before REAL NOT NULL DEFAULT 0,
+    worker INTEGER,
+    error TEXT,
+    enqueued REAL NOT NULL,
+    started REAL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_state ON jobs (state, priority DESC);
+"""
+
+# A re-enqueued job is reset only if its inputs changed, it failed for good
+# or, with ``requeue``, it is not being rendered right now.
+_ENQUEUE = """
+INSERT INTO jobs (output, key, kind, args, priority, max_attempts, enqueued)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (output) DO UPDATE SET
+    key = excluded.key, kind = excluded.kind, args = excluded.args, priority = excluded.priority,
+    max_attempts = excluded.max_attempts, state = 'pending', attempts = 0, not_before = 0,
+    worker = NULL, error = NULL, enqueued = excluded.enqueued, started = NULL, finished = NULL
+WHERE jobs.key != excluded.key OR jobs.state = 'failed' OR (? AND jobs.state != 'running')
+"""
+
+# Selected and marked running in one write transaction (no UPDATE ... RETURNING,
+# which needs SQLite 3.35).
+_CLAIM = """
+SELECT rowid, output, key, kind, args, priority, attempts, max_attempts FROM jobs
+WHERE state = 'pending' AND not_before <= ?
+ORDER BY priority DESC, rowid LIMIT 1
+"""
+
+
+@dataclass(frozen=True)
+class QueuedJob:
+    """A job as stored in the queue: what to run (``kind`` and ``args``) and where it writes."""
+
+    output: str
+    key: str
+    kind: str
+    args: dict[str, Any] = field(hash=False)
+    priority: int = 0
+    attempts: int = 0
+    max_attempts: int = DEFAULT_ATTEMPTS
+    error: str = ""
+
+
+def retry_delay(attempts: int) -> float:
+    """Return the seconds to wait before retrying a job that has failed ``attempts`` times."""
+    return min(RETRY_BACKOFF * 2 ** (attempts - 1), RETRY_BACKOFF_MAX)
+
+
+def _process_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        # Only a previous process with a recycled pid could have claimed it.
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class RenderQueue:
+    """A persistent queue of render jobs in the SQLite database at ``path``."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit: every statement outside an explicit transaction is committed at once.
+        self._db = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "RenderQueue":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def enqueue(self, jobs: Iterable[QueuedJob], requeue: bool = False) -> tuple[int, int]:
+        """Add ``jobs``, returning how many were queued and how many were already recorded.
+
+        With ``requeue``, jobs already done are queued again too.
+        """
+        queued = total = 0
+        jobs = iter(jobs)
+        while batch := list(islice(jobs, ENQUEUE_BATCH)):
+            now = time.time()
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._db.executemany(_ENQUEUE, (
+                    (
+                        job.output, job.key, job.kind, json.dumps(job.args, sort_keys=True, default=str),
+                        job.priority, job.max_attempts, now, requeue,
+                    )
+                    for job in batch
+                ))
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+            queued += cursor.rowcount
+            total += len(batch)
+        return queued, total - queued
+
+    def recover(self) -> int:
+        """Return jobs left running by processes that have exited to the queue; return how many."""
+        workers = [pid for (pid,) in self._db.execute(
+            "SELECT DISTINCT worker FROM jobs WHERE state = 'running'"
+        ) if pid is None or not _process_alive(pid)]
+        recovered = 0
+        for pid in workers:
+            recovered += self._db.execute(
+                "UPDATE jobs SET state = 'pending', worker = NULL, started = NULL "
+                "WHERE state = 'running' AND worker IS ?", (pid,),
+            ).rowcount
+        return recovered
+
+    def release(self) -> int:
+        """Return the jobs this process has claimed but not finished to the queue; return how many."""
+        return self._db.execute(
+            "UPDATE jobs SET state = 'pending', worker = NULL, started = NULL "
+            "WHERE state = 'running' AND worker = ?", (os.getpid(),),
+        ).rowcount
+
+    def claim(self) -> QueuedJob | None:
+        """Mark the next ready job as running in this process and return it, or None if none is ready."""
+        now = time.time()
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._db.execute(_CLAIM, (now,)).fetchone()
+            if row is not None:
+                self._db.execute(
+                    "UPDATE jobs SET state = 'running', worker = ?, started = ? WHERE rowid = ?",
+                    (os.getpid(), now, row[0]),
+                )
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+        if row is None:
+            return None
+        _, output, key, kind, args, priority, attempts, max_attempts = row
+        return QueuedJob(output, key, kind, json.loads(args), priority, attempts, max_attempts)
+
+    def complete(self, job: QueuedJob) -> None:
+        """Record a claimed job as done."""
+        self._db.execute(
+            "UPDATE jobs SET state = 'done', worker = NULL, error = NULL, finished = ? "
+            "WHERE output = ? AND key = ? AND state = 'running'",
+            (time.time(), job.output, job.key),
+        )
+
+    def fail(self, job: QueuedJob, error: str) -> float | None:
+        """Record a failed attempt of a claimed job.
+
+        Returns the seconds until it is retried, or None if it has used up
+        its attempts and is now ``failed``.
+        """
+        attempts = job.attempts + 1
+        now = time.time()
+        delay = retry_delay(attempts) if attempts < job.max_attempts else None
+        self._db.execute(
+            "UPDATE jobs SET state = ?, attempts = ?, not_before = ?, worker = NULL, error = ?, finished = ? "
+            "WHERE output = ? AND key = ? AND state = 'running'",
+            (
+                "failed" if delay is None else "pending", attempts, now + (delay or 0.0), error, now,
+                job.output, job.key,
+            ),
+        )
+        return delay
+
+    def next_retry(self) -> float | None:
+        """Return the seconds until the next pending job is ready (0 if one is), or None if none is pending."""
+        (not_before,) = self._db.execute("SELECT min(not_before) FROM jobs WHERE state = 'pending'").fetchone()
+        return None if not_before is None else max(not_before - time.time(), 0.0)
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of jobs in each state."""
+        counts = dict.fromkeys(STATES, 0)
+        counts.update(self._db.execute("SELECT state, count(*) FROM jobs GROUP BY state"))
+        return counts
+
+    def failures(self, limit: int) -> list[QueuedJob]:
+        """Return up to ``limit`` jobs that failed for good, with their last error."""
+        return [
+            QueuedJob(output, key, kind, json.loads(args), priority, attempts, max_attempts, error or "")
+            for output, key, kind, args, priority, attempts, max_attempts, error in self._db.execute(
+                "SELECT output, key, kind, args, priority, attempts, max_attempts, error FROM jobs "
+                "WHERE state = 'failed' ORDER BY finished LIMIT ?", (limit,),
+            )
+        ]
+
+
+def format_counts(counts: dict[str, int]) -> str:
+    """Summarize a queue's job states, e.g. ``36,990 done, 10 failed, 0 pending, 0 running``."""
+    return ", ".join(f"{counts[state]:,} {state}" for state in ("done", "failed", "pending", "running"))
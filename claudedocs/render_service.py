@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""Local HTTP service that renders the Aba Digital Marketplace PDFs on demand.
+
+Lets the React demo offer "download the memo / one-pager" without running
+generate_pdfs.py offline. Built on asyncio streams only, bound to localhost.
+
+    GET /pdf/memo[?to=&from=&date=&re=]               governor memo
+    GET /pdf/onepager[?shop_id=&shop_name=&owner=...] benefits one-pager
+    GET /pdf/script                                   video script
+    GET /healthz                                      liveness
+    GET /stats                                        cache and latency stats
+
+Rendering runs in a bounded process pool. Rendered bytes are kept in an LRU
+cache (bounded by total size) keyed by document and query parameters, and
+identical requests that arrive while a render is in flight share it.
+Responses carry a content-hash ETag, and ``If-None-Match`` gets a 304.
+Documents are rendered reproducibly (see ``generate_pdfs --reproducible``),
+so the ETag of unchanged content survives restarts.
+
+Usage:
+    python render_service.py [--port 8765] [--workers N] [--cache-mb 64]
+"""
+
+import argparse
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import parse_qsl, urlsplit
+
+from fpdf.errors import FPDFException
+
+import generate_pdfs
+from documents import MEMO_FIELDS, render_bytes
+from generate_pdfs import DEFAULT_FILENAMES, REGISTRY_FIELDS, merge_output_path
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_MB = 64
+MAX_HEADER_BYTES = 16 * 1024
+LATENCY_WINDOW = 2048
+
+# Cache key: document name plus its sorted query parameters.
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass(frozen=True)
+class Route:
+    """A downloadable document and how its query parameters map to a render job."""
+
+    generator: str
+    params: tuple[str, ...]
+    job: Callable[[dict[str, str]], dict[str, Any]]
+    filename: Callable[[dict[str, str]], str]
+
+
+ROUTES: dict[str, Route] = {
+    "/pdf/memo": Route(
+        "memo", tuple(MEMO_FIELDS),
+        lambda params: {"recipient": params, "stamp": True} if params else {},
+        lambda params: DEFAULT_FILENAMES["memo"],
+    ),
+    "/pdf/onepager": Route(
+        "onepager", REGISTRY_FIELDS,
+        lambda params: {"trader": params} if params else {},
+        lambda params: merge_output_path(Path(), params).name if params else DEFAULT_FILENAMES["onepager"],
+    ),
+    "/pdf/script": Route(
+        "script", (),
+        lambda params: {},
+        lambda params: DEFAULT_FILENAMES["script"],
+    ),
+}
+
+_REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+
+class BadRequest(Exception):
+    """A client error, reported as ``400`` with the message as the body."""
+
+
+def _render_in_worker(generator: str, kwargs: dict[str, Any]) -> bytes:
+    """Render a document in a pool worker, re-raising failures as exceptions that unpickle.
+
+    Some fpdf2 exceptions (``FPDFUnicodeEncodingException``) cannot be
+    unpickled, and one that reaches the pool breaks it for every later
+    request. Errors the query caused become ``ValueError`` (a 400), the
+    rest ``RuntimeError`` (a 500).
+    """
+    try:
+        return render_bytes(generator, **kwargs)
+    except (ValueError, FPDFException) as exc:
+        raise ValueError(f"cannot render {generator}: {exc}") from None
+    except Exception as exc:
+        raise RuntimeError(f"{type(exc).__name__}: {exc}") from None
+
+
+class RenderCache:
+    """LRU cache of rendered PDFs, bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[CacheKey, tuple[str, bytes]] = OrderedDict()
+
+    def get(self, key: CacheKey) -> tuple[str, bytes] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: CacheKey, data: bytes) -> tuple[str, bytes]:
+        """Store ``data`` under ``key`` and return its ``(etag, data)`` entry."""
+        entry = (f'"{hashlib.sha256(data).hexdigest()[:32]}"', data)
+        if len(data) > self.max_bytes:
+            return entry
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous[1])
+        self._entries[key] = entry
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+        return entry
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class RenderService:
+    """Serve rendered PDFs from the cache, rendering misses in a process pool."""
+
+    def __init__(self, workers: int, cache_bytes: int) -> None:
+        self.workers = workers
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.pool_restarts = 0
+        self.cache = RenderCache(cache_bytes)
+        self.renders = 0
+        self.coalesced = 0
+        self._inflight: dict[CacheKey, asyncio.Future] = {}
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    async def document(self, route: Route, params: dict[str, str]) -> tuple[str, bytes]:
+        """Return ``(etag, pdf bytes)`` for a route, rendering it at most once."""
+        key = (route.generator, tuple(sorted(params.items())))
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        pool = self.pool
+        try:
+            data = await asyncio.get_running_loop().run_in_executor(
+                pool, functools.partial(_render_in_worker, route.generator, route.job(params)),
+            )
+            self.renders += 1
+            entry = self.cache.put(key, data)
+            future.set_result(entry)
+            return entry
+        except BaseException as exc:
+            if isinstance(exc, BrokenProcessPool):
+                self._restart_pool(pool)
+            future.set_exception(exc)
+            # Mark the exception retrieved when no concurrent request was waiting.
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def _restart_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Replace a broken pool (a worker died), unless a concurrent request already has."""
+        if self.pool is not broken:
+            return
+        print("render pool broken; starting new workers")
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.pool_restarts += 1
+
+    async def warm(self) -> None:
+        """Start the worker processes and cache the default documents."""
+        await asyncio.gather(*(self.document(route, {}) for route in ROUTES.values()))
+
+    def stats(self) -> dict[str, Any]:
+        latencies = sorted(self._latencies)
+
+        def _percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(1000 * latencies[min(len(latencies) - 1, int(p * len(latencies)))], 3)
+
+        return {
+            "workers": self.workers,
+            "pool_restarts": self.pool_restarts,
+            "renders": self.renders,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+            "cache": self.cache.stats(),
+            "latency_ms": {
+                "window": len(latencies),
+                "p50": _percentile(0.50),
+                "p90": _percentile(0.90),
+                "p99": _percentile(0.99),
+                "max": round(1000 * latencies[-1], 3) if latencies else 0.0,
+            },
+        }
+
+    async def respond(self, method: str, target: str, headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        """Return ``(status, headers, body)`` for one request."""
+        if method not in ("GET", "HEAD"):
+            return 405, {"Allow": "GET, HEAD"}, b"method not allowed\n"
+        url = urlsplit(target)
+        if url.path == "/healthz":
+            return 200, {"Content-Type": "text/plain"}, b"ok\n"
+        if url.path == "/stats":
+            return 200, {"Content-Type": "application/json"}, json.dumps(self.stats(), indent=1).encode()
+        route = ROUTES.get(url.path)
+        if route is None:
+            return 404, {"Content-Type": "text/plain"}, b"not found\n"
+
+        params = dict(parse_qsl(url.query))
+        unknown = set(params) - set(route.params)
+        if unknown:
+            raise BadRequest(f"unknown parameter(s) for {url.path}: {', '.join(sorted(unknown))}")
+        try:
+            etag, data = await self.document(route, params)
+        except ValueError as exc:
+            raise BadRequest(str(exc)) from exc
+
+        response_headers = {
+            "ETag": etag,
+            "Cache-Control": "no-cache",
+        }
+        if etag in (tag.strip() for tag in headers.get("if-none-match", "").split(",")):
+            return 304, response_headers, b""
+        response_headers["Content-Type"] = "application/pdf"
+        response_headers["Content-Disposition"] = f'attachment; filename="{route.filename(params)}"'
+        return 200, response_headers, data
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve HTTP/1.1 requests on one connection until it closes."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._send(writer, "HEAD", 431, {}, b"", keep_alive=False)
+                    return
+                start = time.perf_counter()
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ", 2)
+                except ValueError:
+                    await self._send(writer, "GET", 400, {}, b"malformed request line\n", keep_alive=False)
+                    return
+                headers = {}
+                for line in header_lines:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                keep_alive = (
+                    headers.get("connection", "").lower() != "close"
+                    if version == "HTTP/1.1"
+                    else headers.get("connection", "").lower() == "keep-alive"
+                )
+                try:
+                    status, response_headers, body = await self.respond(method, target, headers)
+                except BadRequest as exc:
+                    status, response_headers, body = 400, {"Content-Type": "text/plain"}, f"{exc}\n".encode()
+                except Exception as exc:  # noqa: BLE001 - a failed render must not kill the server
+                    print(f"render failed for {target}: {exc!r}")
+                    status, response_headers, body = 500, {"Content-Type": "text/plain"}, b"render failed\n"
+                await self._send(writer, method, status, response_headers, body, keep_alive)
+                if status in (200, 304) and target.startswith("/pdf/"):
+                    self._latencies.append(time.perf_counter() - start)
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _send(
+        writer: asyncio.StreamWriter, method: str, status: int,
+        headers: dict[str, str], body: bytes, keep_alive: bool,
+    ) -> None:
+        lines = [
+            f"HTTP/1.1 {status} {_REASONS[status]}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+            "Access-Control-Allow-Origin: *",
+            "Access-Control-Expose-Headers: ETag, Content-Disposition",
+            *(f"{name}: {value}" for name, value in headers.items()),
+        ]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if method != "HEAD" and body:
+            writer.write(body)
+        await writer.drain()
+
+
+async def serve(host: str, port: int, workers: int, cache_bytes: int, warm: bool = True) -> None:
+    # Reproducible renders keep a document's ETag across workers and restarts.
+    # Set before the pool starts, so the workers inherit it.
+    generate_pdfs.CREATION_DATE = generate_pdfs.reproducible_date()
+    service = RenderService(workers, cache_bytes)
+    if warm:
+        start = time.perf_counter()
+        await service.warm()
+        print(f"Warmed {len(ROUTES)} documents in {time.perf_counter() - start:.2f}s")
+    server = await asyncio.start_server(service.handle, host, port, limit=MAX_HEADER_BYTES)
+    print(f"Serving PDFs on http://{host}:{port}/pdf/{{{','.join(r.generator for r in ROUTES.values())}}}")
+    print(f"Workers: {workers}, cache: {cache_bytes // (1024 * 1024)} MB")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.pool.shutdown(cancel_futures=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the Aba Digital Marketplace PDFs over local HTTP.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port (default: {DEFAULT_PORT})")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=0, metavar="N",
+        help="render processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--cache-mb", type=int, default=DEFAULT_CACHE_MB, metavar="MB",
+        help=f"size limit of the rendered-PDF cache (default: {DEFAULT_CACHE_MB})",
+    )
+    parser.add_argument("--no-warm", action="store_true", help="do not pre-render the default documents")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(
+            args.host, args.port, args.workers or os.cpu_count() or 1,
+            args.cache_mb * 1024 * 1024, warm=not args.no_warm,
+        ))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
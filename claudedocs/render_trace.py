@@ -0,0 +1,137 @@
+"""Opt-in per-helper render tracing for the PDF generators.
+
+``RenderTracer.instrument()`` wraps every public method of the given style
+classes (``MemoStyle.section_header``, ``ScriptStyle.narration_bold_phrase``,
+``OnePagerStyle.bullet_bold_value``, ...) so each call records its duration
+and the page and y position it started at. Nothing is wrapped until
+``instrument()`` is called, so an idle tracer costs nothing.
+
+Traces export as Chrome trace JSON (open in chrome://tracing or
+https://ui.perfetto.dev); per-document, per-helper call counts and
+cumulative times are included under ``otherData.summary``.
+"""
+
+import functools
+import inspect
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+# (helper, document, start_ns, duration_ns, page, y)
+TraceEvent = tuple[str, str, int, int, int, float]
+
+
+class RenderTracer:
+    """Collect timing events for style helpers and whole documents."""
+
+    def __init__(self) -> None:
+        self.events: list[TraceEvent] = []
+        self.document = ""
+        self._originals: list[tuple[type, str, Callable[..., Any]]] = []
+        self._epoch = time.perf_counter_ns()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+    def instrument(self, *classes: type) -> None:
+        """Wrap the public methods of ``classes`` to record trace events."""
+        for cls in classes:
+            for name, member in list(vars(cls).items()):
+                if inspect.isfunction(member) and not name.startswith("_"):
+                    self._originals.append((cls, name, member))
+                    setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", member))
+
+    def restore(self) -> None:
+        """Undo ``instrument()``."""
+        for cls, name, member in reversed(self._originals):
+            setattr(cls, name, member)
+        self._originals.clear()
+
+    def _wrap(self, label: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        events = self.events
+
+        @functools.wraps(method)
+        def _traced(style: Any, *args: Any, **kwargs: Any) -> Any:
+            pdf = style.pdf
+            page, y = pdf.page, pdf.y
+            start = time.perf_counter_ns()
+            try:
+                return method(style, *args, **kwargs)
+            finally:
+                events.append((label, self.document, start, time.perf_counter_ns() - start, page, y))
+
+        return _traced
+
+    @contextmanager
+    def trace_document(self, name: str) -> Iterator[None]:
+        """Attribute events inside the block to document ``name``."""
+        previous, self.document = self.document, name
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.events.append((f"document:{name}", name, start, time.perf_counter_ns() - start, 0, 0.0))
+            self.document = previous
+
+    def summary(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return ``{document: {helper: {calls, total_ms, pages}}}``, slowest first."""
+        totals: dict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
+        for label, document, _, duration, page, _ in self.events:
+            entry = totals[document].setdefault(label, {"calls": 0, "total_ms": 0.0, "pages": set()})
+            entry["calls"] += 1
+            entry["total_ms"] += duration / 1e6
+            if page:
+                entry["pages"].add(page)
+        return {
+            document: {
+                label: {
+                    "calls": entry["calls"],
+                    "total_ms": round(entry["total_ms"], 3),
+                    "pages": sorted(entry["pages"]),
+                }
+                for label, entry in sorted(helpers.items(), key=lambda item: -item[1]["total_ms"])
+            }
+            for document, helpers in totals.items()
+        }
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write events in Chrome trace-event format, one row per document."""
+        pid = os.getpid()
+        tids = {document: tid for tid, document in enumerate(dict.fromkeys(e[1] for e in self.events))}
+        trace_events = [
+            {
+                "name": label,
+                "cat": "document" if label.startswith("document:") else "helper",
+                "ph": "X",
+                "ts": (start - self._epoch) / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": tids[document],
+                "args": {"document": document, "page": page, "y": round(y, 2)},
+            }
+            for label, document, start, duration, page, y in self.events
+        ]
+        trace_events += [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": document}}
+            for document, tid in tids.items()
+        ]
+        path.write_text(json.dumps({
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {"summary": self.summary()},
+        }))
+
+    def print_summary(self, top: int = 5) -> None:
+        """Print the ``top`` most expensive helpers of each document."""
+        for document, helpers in self.summary().items():
+            print(f"  {document}")
+            for label, entry in list(helpers.items())[: top + 1]:
+                print(f"    {label:<40}{entry['calls']:>6} calls {entry['total_ms']:>10.2f} ms")
+
+
+TRACER = RenderTracer()
@@ -0,0 +1,253 @@
+"""Streaming multi-page tables for the registry annex.
+
+Laying out tens of thousands of rows with ``cell``/``multi_cell`` per field
+is dominated by fpdf's per-call bookkeeping. ``StreamingTable`` does that
+work once per page instead:
+
+* column widths are computed once, from a sample of the first rows (or
+  given, so separately rendered tables line up);
+* every page is sized up front (same row height, same rows per page);
+* the header row and page footer are drawn with ordinary ``cell`` calls,
+  which also register the fonts on the page's resources;
+* body rows are written as raw text and fill operators straight into the
+  page content stream, truncated to their column with the font's glyph
+  widths. Body text must be Latin-1, which the core fonts cover: a column
+  that may hold anything else needs a ``format`` that folds it, or
+  rendering raises ``ValueError``.
+
+Rows are consumed from any iterable, one page at a time, so memory use is
+bounded by a page and render time is linear in the number of rows.
+"""
+
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Callable, Iterable, Iterator
+
+from fpdf import FPDF
+
+_ESCAPES = str.maketrans({"\\": "\\\\", "(": "\\(", ")": "\\)", "\r": " ", "\n": " "})
+
+
+def _hundredths(value: int) -> str:
+    """Format an integer count of hundredths without trailing zeros."""
+    return f"{value / 100:.2f}".rstrip("0").rstrip(".")
+
+
+@dataclass(frozen=True)
+class Column:
+    """One table column: the row key it shows, its heading and alignment."""
+
+    key: str
+    title: str
+    align: str = "L"
+    format: Callable[[str], str] | None = None
+    # Upper bound on the column's share of the table width.
+    max_share: float = 0.4
+
+
+class StreamingTable:
+    """Render rows of dicts as a table spanning as many pages as needed."""
+
+    def __init__(
+        self,
+        pdf: FPDF,
+        columns: Iterable[Column],
+        *,
+        x: float = 15,
+        width: float = 180,
+        top: float = 20,
+        bottom: float = 282,
+        font_size: float = 7,
+        row_h: float = 4.2,
+        header_h: float = 6,
+        padding: float = 1.2,
+        sample_size: int = 500,
+        header_fill: tuple[int, int, int] = (0, 40, 104),
+        header_color: tuple[int, int, int] = (255, 255, 255),
+        text_color: tuple[int, int, int] = (50, 50, 50),
+        stripe_fill: tuple[int, int, int] | None = (242, 242, 242),
+        footer: Callable[[int], str] = "Page {}".format,
+        widths: Iterable[float] | None = None,
+    ) -> None:
+        self.pdf = pdf
+        self.columns = tuple(columns)
+        self.x = x
+        self.width = width
+        self.top = top
+        self.bottom = bottom
+        self.font_size = font_size
+        self.row_h = row_h
+        self.header_h = header_h
+        self.padding = padding
+        self.sample_size = sample_size
+        self.header_fill = header_fill
+        self.header_color = header_color
+        self.text_color = text_color
+        self.stripe_fill = stripe_fill
+        self.footer = footer
+        # Fixed column widths; by default they are sized from the first rows.
+        self.fixed_widths = list(widths) if widths is not None else None
+        self.widths: list[float] = []
+        self.rows = 0
+        self.pages = 0
+
+    @property
+    def rows_per_page(self) -> int:
+        """Rows that fit on a continuation page."""
+        return self._capacity(self.top)
+
+    def _capacity(self, top: float) -> int:
+        return int((self.bottom - top - self.header_h) // self.row_h)
+
+    def render(self, rows: Iterable[dict[str, str]], first_top: float | None = None) -> int:
+        """Render ``rows`` starting on the current page and return how many were written.
+
+        ``first_top`` is where the table starts on the current page (default:
+        the current y); continuation pages start at ``top``.
+        """
+        pdf = self.pdf
+        rows = iter(rows)
+        if self.fixed_widths is not None:
+            self.widths = self.fixed_widths
+        else:
+            sample = list(islice(rows, self.sample_size))
+            self.widths = self._column_widths(sample)
+            rows = chain(sample, rows)
+
+        top = pdf.get_y() if first_top is None else first_top
+        if self._capacity(top) < 1:
+            pdf.add_page()
+            top = self.top
+        page_rows = list(islice(rows, self._capacity(top)))
+        while True:
+            self._draw_page(top, page_rows)
+            if len(page_rows) < self._capacity(top):
+                break
+            page_rows = list(islice(rows, self.rows_per_page))
+            if not page_rows:
+                break
+            pdf.add_page()
+            top = self.top
+        return self.rows
+
+    # --- layout -----------------------------------------------------------
+
+    def _cells(self, row: dict[str, str]) -> Iterator[str]:
+        for column in self.columns:
+            value = row.get(column.key) or ""
+            yield column.format(value) if column.format else value
+
+    def _text_width(self, text: str, char_widths: dict[str, int], size: float) -> float:
+        return sum(char_widths.get(ch, 0) for ch in text) * size / 1000 / self.pdf.k
+
+    def _column_widths(self, sample: list[dict[str, str]]) -> list[float]:
+        """Size columns to the 95th-percentile width of the sampled cells and headings."""
+        pdf = self.pdf
+        pdf.set_font("Helvetica", "B", self.font_size)
+        bold = pdf.current_font.cw
+        pdf.set_font("Helvetica", "", self.font_size)
+        regular = pdf.current_font.cw
+
+        measured = [[] for _ in self.columns]
+        for row in sample:
+            for widths, text in zip(measured, self._cells(row)):
+                widths.append(self._text_width(text, regular, self.font_size))
+        natural = []
+        for column, widths in zip(self.columns, measured):
+            widths.sort()
+            typical = widths[int(0.95 * (len(widths) - 1))] if widths else 0.0
+            heading = self._text_width(column.title, bold, self.font_size)
+            width = max(typical, heading) + 2 * self.padding
+            natural.append(min(width, column.max_share * self.width))
+        scale = self.width / sum(natural)
+        return [width * scale for width in natural]
+
+    def _truncate(self, text: str, width: float, char_widths: dict[str, int]) -> tuple[str, float]:
+        """Return ``text`` cut to fit ``width`` (with a trailing ``...``) and its width."""
+        scale = self.font_size / 1000 / self.pdf.k
+        total = sum(char_widths.get(ch, 0) for ch in text) * scale
+        if total <= width:
+            return text, total
+        budget = width - 3 * char_widths.get(".", 0) * scale
+        used = 0.0
+        for end, ch in enumerate(text):
+            advance = char_widths.get(ch, 0) * scale
+            if used + advance > budget:
+                return text[:end] + "...", used + 3 * char_widths.get(".", 0) * scale
+            used += advance
+        return text, total
+
+    # --- drawing ----------------------------------------------------------
+
+    def _draw_page(self, top: float, rows: list[dict[str, str]]) -> None:
+        pdf = self.pdf
+        self.pages += 1
+
+        # Header row through fpdf, so the bold font lands in the page resources.
+        pdf.set_font("Helvetica", "B", self.font_size)
+        pdf.set_fill_color(*self.header_fill)
+        pdf.set_text_color(*self.header_color)
+        pdf.set_xy(self.x, top)
+        for column, width in zip(self.columns, self.widths):
+            pdf.cell(width, self.header_h, column.title, align=column.align, fill=True)
+
+        # Footer through fpdf as well, registering the regular body font.
+        pdf.set_font("Helvetica", "", self.font_size)
+        pdf.set_text_color(*self.text_color)
+        pdf.set_xy(self.x, self.bottom + 2)
+        pdf.cell(self.width, 4, self.footer(self.pages), align="C")
+
+        if rows:
+            pdf.pages[pdf.page].contents.extend(self._body_ops(top + self.header_h, rows))
+        self.rows += len(rows)
+        pdf.set_y(top + self.header_h + len(rows) * self.row_h)
+
+    def _body_ops(self, top: float, rows: list[dict[str, str]]) -> bytes:
+        """Return the content-stream operators for one page of body rows."""
+        pdf = self.pdf
+        k, page_h = pdf.k, pdf.h
+        font = pdf.current_font
+        char_widths = font.cw
+        row_h = self.row_h
+        baseline = 0.5 * row_h + 0.3 * self.font_size / k
+
+        lefts = []
+        left = self.x
+        for width in self.widths:
+            lefts.append(left)
+            left += width
+
+        out = ["q"]
+        if self.stripe_fill is not None:
+            out.append("%.3f %.3f %.3f rg" % tuple(c / 255 for c in self.stripe_fill))
+            for i in range(1, len(rows), 2):
+                y = top + i * row_h
+                out.append(f"{self.x * k:.2f} {(page_h - y) * k:.2f} {self.width * k:.2f} {-row_h * k:.2f} re f")
+        out.append("%.3f %.3f %.3f rg" % tuple(c / 255 for c in self.text_color))
+        out.append(f"BT /F{font.i} {self.font_size:.2f} Tf")
+        # Positions are tracked in hundredths of a point and emitted as
+        # relative Td moves, which repeat from row to row and compress well.
+        pen_x = pen_y = 0
+        for i, row in enumerate(rows):
+            y = round((page_h - (top + i * row_h + baseline)) * k * 100)
+            for column, left, width, text in zip(self.columns, lefts, self.widths, self._cells(row)):
+                if not text:
+                    continue
+                text, text_w = self._truncate(text, width - 2 * self.padding, char_widths)
+                if column.align == "R":
+                    x = left + width - self.padding - text_w
+                elif column.align == "C":
+                    x = left + (width - text_w) / 2
+                else:
+                    x = left + self.padding
+                x = round(x * k * 100)
+                out.append(f"{_hundredths(x - pen_x)} {_hundredths(y - pen_y)} Td ({text.translate(_ESCAPES)}) Tj")
+                pen_x, pen_y = x, y
+        out.append("ET Q\n")
+        try:
+            return "\n".join(out).encode("latin-1")
+        except UnicodeEncodeError as exc:
+            # The core fonts cover Latin-1 only; fold such columns with a ``format``.
+            raise ValueError(
+                f"table text {exc.object[exc.start:exc.end]!r} is outside the core fonts' Latin-1 range"
+            ) from None
@@ -0,0 +1,73 @@
+"""Regression tests for render_service: a bad render must not take the service down.
+
+Run with ``python -m pytest test_render_service.py``.
+"""
+
+import asyncio
+import os
+import pickle
+from urllib.parse import quote
+
+import pytest
+from fpdf.errors import FPDFUnicodeEncodingException
+
+import render_service
+
+
+async def _get(port: int, target: str) -> int:
+    """Send one GET request and return the response status."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode())
+    await writer.drain()
+    # Only the status line: a worker forked during this request holds the socket open.
+    status_line = await reader.readline()
+    writer.close()
+    return int(status_line.split(b" ", 2)[1])
+
+
+def _serve_and_check(check) -> None:
+    async def _run() -> None:
+        service = render_service.RenderService(workers=1, cache_bytes=1024 * 1024)
+        server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+        try:
+            await check(service, server.sockets[0].getsockname()[1])
+        finally:
+            server.close()
+            service.pool.shutdown(cancel_futures=True)
+    asyncio.run(_run())
+
+
+def test_diacritic_query_does_not_break_the_pool() -> None:
+    async def _check(service: render_service.RenderService, port: int) -> None:
+        # Folded for the core fonts on the one-pager and the memo.
+        assert await _get(port, f"/pdf/onepager?shop_id=x&shop_name={quote('Ọ̀jà')}") == 200
+        assert await _get(port, f"/pdf/memo?to={quote('Chief Ọ̀jà')}") == 200
+        # A render error in the worker is a client error, not a dead worker pool.
+        assert await _get(port, "/pdf/onepager?shop_name=x") == 400
+        assert await _get(port, "/pdf/memo") == 200
+        assert await _get(port, "/pdf/script") == 200
+        assert await _get(port, "/pdf/memo?bogus=1") == 400
+        assert service.pool_restarts == 0
+    _serve_and_check(_check)
+
+
+def test_broken_pool_is_replaced() -> None:
+    async def _check(service: render_service.RenderService, port: int) -> None:
+        # A worker that dies breaks the pool; the request that finds it broken fails...
+        broken = asyncio.wrap_future(service.pool.submit(os._exit, 1))
+        await asyncio.gather(broken, return_exceptions=True)
+        assert await _get(port, "/pdf/script") == 500
+        # ... and the next one is rendered by fresh workers.
+        assert await _get(port, "/pdf/script") == 200
+        assert service.pool_restarts == 1
+    _serve_and_check(_check)
+
+
+def test_worker_errors_unpickle(monkeypatch: pytest.MonkeyPatch) -> None:
+    # FPDFUnicodeEncodingException itself cannot be unpickled, which breaks the pool.
+    def _fail(name: str, **kwargs: object) -> bytes:
+        raise FPDFUnicodeEncodingException(0, "\u1ecc", "helvetica")
+    monkeypatch.setattr(render_service, "render_bytes", _fail)
+    with pytest.raises(ValueError) as raised:
+        render_service._render_in_worker("memo", {})
+    assert str(pickle.loads(pickle.dumps(raised.value))) == str(raised.value)
@@ -0,0 +1,249 @@
+"""Product and shop thumbnails for the PDF generators.
+
+Trader photos arrive straight off a phone: multi-megapixel JPEGs, often
+rotated by EXIF. A catalog prints thousands of them a few millimetres
+wide, so decoding and resizing them is most of its render time.
+``ThumbnailStage`` does that work in a thread pool, ahead of the page
+being laid out. Pillow releases the GIL while it decodes, resizes and
+encodes, so the threads run in parallel.
+
+* JPEGs are decoded in draft mode, at the smallest 1/2, 1/4 or 1/8 DCT
+  scale that still covers the target, which skips most of the decode.
+* The result is center-cropped to the target box with a Lanczos filter
+  and re-encoded as baseline JPEG. Photos are never upsampled.
+* Finished thumbnails live in a ``ThumbnailCache``, keyed by the source's
+  SHA-256 and the target size in pixels and bounded by total bytes
+  (least recently used first out). Renaming or copying a photo still
+  hits, and an edited photo misses.
+"""
+
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from fpdf import FPDF
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from assets import JPEG_QUALITY, PHOTO_DPI
+
+# Decoded thumbnails kept in memory, in bytes of JPEG data.
+CACHE_BYTES = 64 * 1024 * 1024
+# Thumbnails submitted ahead of the one being placed (see ``ThumbnailStage.map``).
+LOOKAHEAD = 64
+# Source digests remembered by path, mtime and size (oldest dropped first).
+DIGEST_ENTRIES = 65_536
+
+_MM_PER_INCH = 25.4
+
+T = TypeVar("T")
+# Cache key: source SHA-256, target width and height in pixels.
+ThumbnailKey = tuple[str, int, int]
+
+
+@dataclass(frozen=True)
+class Thumbnail:
+    """A resized photo as baseline JPEG bytes."""
+
+    data: bytes
+    width: int
+    height: int
+
+
+def make_thumbnail(data: bytes, width_px: int, height_px: int) -> Thumbnail:
+    """Decode the image ``data`` and center-crop it to ``width_px`` x ``height_px`` (or smaller)."""
+    with Image.open(io.BytesIO(data)) as original:
+        # EXIF rotation may swap the sides the draft has to cover.
+        side = max(width_px, height_px)
+        original.draft("RGB", (side, side))
+        image = ImageOps.exif_transpose(original).convert("RGB")
+    aspect = width_px / height_px
+    if width_px < image.width and height_px < image.height:
+        image = ImageOps.fit(image, (width_px, height_px), Image.Resampling.LANCZOS)
+    else:
+        box_w = min(image.width, round(image.height * aspect))
+        image = ImageOps.fit(image, (box_w, max(1, min(image.height, round(box_w / aspect)))))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=JPEG_QUALITY)
+    return Thumbnail(buffer.getvalue(), image.width, image.height)
+
+
+class ThumbnailCache:
+    """LRU cache of thumbnails, bounded by their total size in bytes; safe to share between threads."""
+
+    def __init__(self, max_bytes: int = CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[ThumbnailKey, Thumbnail] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: ThumbnailKey) -> Thumbnail | None:
+        with self._lock:
+            thumbnail = self._entries.get(key)
+            if thumbnail is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return thumbnail
+
+    def put(self, key: ThumbnailKey, thumbnail: Thumbnail) -> None:
+        if len(thumbnail.data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous.data)
+            self._entries[key] = thumbnail
+            self.size += len(thumbnail.data)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted.data)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def target_pixels(width_mm: float, height_mm: float, dpi: int = PHOTO_DPI) -> tuple[int, int]:
+    """Return the pixel size of a ``width_mm`` x ``height_mm`` box printed at ``dpi``."""
+    return (
+        max(1, round(width_mm / _MM_PER_INCH * dpi)),
+        max(1, round(height_mm / _MM_PER_INCH * dpi)),
+    )
+
+
+class ThumbnailStage:
+    """Decode and resize photos in a thread pool, through a shared ``ThumbnailCache``."""
+
+    def __init__(self, workers: int | None = None, cache: ThumbnailCache | None = None) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = cache if cache is not None else ThumbnailCache()
+        self.decoded = 0
+        self.failed = 0
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_pid = 0
+        self._lock = threading.Lock()
+        self._inflight: dict[tuple[Path, int, int], Future] = {}
+        # Source digests by (path, mtime, size), so a cache hit reads no file.
+        self._digests: dict[tuple[Path, int, int], str] = {}
+
+    def _executor(self) -> ThreadPoolExecutor:
+        # A forked render worker inherits the pool object but none of its threads.
+        if self._pool is None or self._pool_pid != os.getpid():
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="thumbnail")
+            self._pool_pid = os.getpid()
+            self._inflight.clear()
+        return self._pool
+
+    def submit(self, source: Path, width_mm: float, height_mm: float, dpi: int = PHOTO_DPI) -> Future:
+        """Start making the thumbnail of ``source`` for a ``width_mm`` x ``height_mm`` box.
+
+        The future's result is a ``Thumbnail``; it raises ``OSError`` or
+        ``ValueError`` if the photo cannot be read or decoded.
+        """
+        width_px, height_px = target_pixels(width_mm, height_mm, dpi)
+        job = (source, width_px, height_px)
+        with self._lock:
+            future = self._inflight.get(job)
+            if future is not None:
+                return future
+            future = self._executor().submit(self._thumbnail, source, width_px, height_px)
+            self._inflight[job] = future
+        # Outside the lock: a future that is already done runs the callback at once.
+        future.add_done_callback(lambda _: self._forget(job))
+        return future
+
+    def _forget(self, job: tuple[Path, int, int]) -> None:
+        with self._lock:
+            self._inflight.pop(job, None)
+
+    def _thumbnail(self, source: Path, width_px: int, height_px: int) -> Thumbnail:
+        stat = source.stat()
+        digest = self._digests.get((source, stat.st_mtime_ns, stat.st_size))
+        if digest is not None:
+            thumbnail = self.cache.get((digest, width_px, height_px))
+            if thumbnail is not None:
+                return thumbnail
+        data = source.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if len(self._digests) >= DIGEST_ENTRIES:
+                del self._digests[next(iter(self._digests))]
+            self._digests[source, stat.st_mtime_ns, stat.st_size] = digest
+        key = (digest, width_px, height_px)
+        thumbnail = self.cache.get(key)
+        if thumbnail is None:
+            try:
+                thumbnail = make_thumbnail(data, width_px, height_px)
+            except (UnidentifiedImageError, Image.DecompressionBombError, SyntaxError) as exc:
+                raise ValueError(f"{source.name}: not a readable image ({exc})") from None
+            self.cache.put(key, thumbnail)
+            self.decoded += 1
+        return thumbnail
+
+    def get(self, source: Path, width_mm: float, height_mm: float, dpi: int = PHOTO_DPI) -> Thumbnail:
+        """Return the thumbnail of ``source`` for a ``width_mm`` x ``height_mm`` box, waiting for it."""
+        return self.submit(source, width_mm, height_mm, dpi).result()
+
+    def map(
+        self, items: Iterable[T], source: Callable[[T], Path | None], width_mm: float, height_mm: float,
+        dpi: int = PHOTO_DPI, lookahead: int = LOOKAHEAD,
+    ) -> Iterator[tuple[T, Thumbnail | None]]:
+        """Yield ``(item, thumbnail)`` for each of ``items``, in order, resizing ``lookahead`` ahead.
+
+        ``source(item)`` gives the item's photo, or None for none. Photos
+        that cannot be read yield None and are counted in ``failed``, so
+        one bad upload does not stop a catalog. Items are consumed lazily:
+        at most ``lookahead`` are held at a time.
+        """
+        pending: deque[tuple[T, Future | None]] = deque()
+        items = iter(items)
+        while True:
+            while len(pending) < lookahead:
+                item = next(items, _END)
+                if item is _END:
+                    break
+                path = source(item)
+                pending.append((item, self.submit(path, width_mm, height_mm, dpi) if path else None))
+            if not pending:
+                return
+            item, future = pending.popleft()
+            if future is None:
+                yield item, None
+                continue
+            try:
+                yield item, future.result()
+            except (OSError, ValueError):
+                self.failed += 1
+                yield item, None
+
+    def stats(self) -> dict[str, Any]:
+        return {"workers": self.workers, "decoded": self.decoded, "failed": self.failed, "cache": self.cache.stats()}
+
+
+_END: Any = object()
+
+# Shared by every generator in the process, so documents reuse each other's thumbnails.
+THUMBNAILS = ThumbnailStage()
+
+
+def place_thumbnail(pdf: FPDF, thumbnail: Thumbnail, x: float, y: float, w: float, h: float) -> None:
+    """Draw ``thumbnail`` centered in the ``w`` x ``h`` box at ``(x, y)``, keeping its aspect ratio."""
+    scale = min(w / thumbnail.width, h / thumbnail.height)
+    draw_w, draw_h = thumbnail.width * scale, thumbnail.height * scale
+    pdf.image(io.BytesIO(thumbnail.data), x=x + (w - draw_w) / 2, y=y + (h - draw_h) / 2, w=draw_w, h=draw_h)
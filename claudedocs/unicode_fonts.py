@@ -0,0 +1,222 @@
+"""Embedded Unicode TTF fonts for localized documents.
+
+Core Helvetica only covers Latin-1, so Igbo, Yoruba and Hausa text (ọ, ẹ,
+ṣ, ụ, ɗ, ƙ, tone marks, ₦) cannot be drawn with it. ``UnicodePDF`` draws
+every Helvetica face of a document with a Unicode TTF family (DejaVu Sans
+by default), so the generators' ``set_font("Helvetica", ...)`` calls need
+no change. Fonts are embedded as subsets of the glyphs a document uses.
+
+With ``FPDF.add_font`` every document re-parses each face (cmap, glyph
+metrics, descriptor) and then subsets the whole 6,000-glyph font again when
+it is written. Here each face is prepared once and cached in build/fonts/:
+
+* ``<sha256>.ttf``: the face cut down to ``UNICODE_RANGES`` (the Latin
+  scripts, combining marks and punctuation the four languages use), which
+  makes the per-document subsetting several times cheaper;
+* ``<sha256>.json``: the parsed metrics of that cut-down face, which are
+  also kept per process.
+
+Every document then gets a fresh font object built from those metrics and
+a lazily loaded copy of the cut-down face for its own subset. That object
+is assembled from fpdf's private font attributes, so it is only built with
+the fpdf2 release it was written against (``FONT_OBJECT_FPDF_VERSION``);
+with any other release the cut-down faces go through ``FPDF.add_font``.
+"""
+
+import functools
+import hashlib
+import io
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from fontTools import subset, ttLib
+from fontTools import version as FONTTOOLS_VERSION
+from fpdf import FPDF
+from fpdf import __version__ as FPDF_VERSION
+from fpdf.enums import TextEmphasis
+from fpdf.fonts import FontDescriptorFlags, PDFFontDescriptor, SubsetMap, TTFFont
+
+FAMILY = "dejavusans"
+# Core families drawn with FAMILY instead.
+ALIASED_FAMILIES = ("helvetica", "arial")
+
+# Searched in order; the first directory holding a face's file wins.
+FONT_DIRS = (
+    Path(__file__).resolve().parent / "fonts",
+    Path("/usr/share/fonts/truetype/dejavu"),
+    Path("/usr/share/fonts/TTF"),
+    Path("/usr/share/fonts/dejavu"),
+)
+# Candidate files per style; italics fall back to the upright faces.
+FONT_FILES = {
+    "": ("DejaVuSans.ttf",),
+    "B": ("DejaVuSans-Bold.ttf",),
+    "I": ("DejaVuSans-Oblique.ttf", "DejaVuSans.ttf"),
+    "BI": ("DejaVuSans-BoldOblique.ttf", "DejaVuSans-Bold.ttf"),
+}
+
+# Code points kept in the prepared faces (inclusive ranges).
+UNICODE_RANGES = (
+    (0x0020, 0x007E),  # Basic Latin
+    (0x00A0, 0x024F),  # Latin-1 Supplement, Latin Extended-A and -B (ƙ, Ƙ)
+    (0x0250, 0x02FF),  # IPA extensions (ɓ, ɗ) and spacing modifiers
+    (0x0300, 0x036F),  # combining diacritics (tone marks)
+    (0x1E00, 0x1EFF),  # Latin Extended Additional (ẹ, ọ, ṣ, ụ)
+    (0x2000, 0x206F),  # general punctuation
+    (0x20A0, 0x20CF),  # currency signs (₦)
+    (0x2190, 0x21FF),  # arrows
+    (0x25A0, 0x25FF),  # geometric shapes
+)
+
+# The fpdf2 release whose TTFFont attributes ``_new_font`` sets.
+FONT_OBJECT_FPDF_VERSION = "2.8.9"
+
+CACHE_DIR = Path(__file__).resolve().parent / "build" / "fonts"
+# Bump when the cached fields change.
+CACHE_VERSION = 1
+
+_DESCRIPTOR_FIELDS = (
+    "ascent", "descent", "cap_height", "flags", "font_b_box", "italic_angle", "stem_v", "missing_width",
+)
+
+
+def find_font(style: str) -> Path:
+    """Return the font file used for ``style`` ("", "B", "I" or "BI")."""
+    for name in FONT_FILES[style]:
+        for directory in FONT_DIRS:
+            if (directory / name).is_file():
+                return directory / name
+    raise FileNotFoundError(
+        f"no Unicode font for style {style!r}: put one of {', '.join(FONT_FILES[style])} "
+        f"in {FONT_DIRS[0]}"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _font_file(path: Path) -> tuple[bytes, str]:
+    data = path.read_bytes()
+    return data, hashlib.sha256(data).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def prepared_font(source: Path) -> Path:
+    """Return ``source`` cut down to ``UNICODE_RANGES``, preparing it on a miss."""
+    _, digest = _font_file(source)
+    params = f"{digest}:{UNICODE_RANGES}:{CACHE_VERSION}:{FONTTOOLS_VERSION}"
+    target = CACHE_DIR / f"{hashlib.sha256(params.encode()).hexdigest()}.ttf"
+    if target.exists():
+        return target
+    options = subset.Options(notdef_outline=True, recommended_glyphs=True, glyph_names=True)
+    options.name_IDs = ["*"]
+    options.name_languages = ["*"]
+    # fpdf drops the layout tables when it embeds a subset anyway.
+    options.layout_features = []
+    options.drop_tables += ["GSUB", "GPOS", "GDEF", "FFTM", "hdmx"]
+    font = ttLib.TTFont(source, recalcTimestamp=False)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=[cp for first, last in UNICODE_RANGES for cp in range(first, last + 1)])
+    subsetter.subset(font)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(".tmp")
+    font.save(tmp)
+    tmp.replace(target)
+    return target
+
+
+def _parse_metrics(path: Path) -> dict[str, Any]:
+    """Parse ``path`` with fpdf and keep the fields that depend only on the file."""
+    font = TTFFont(FPDF(), path, "scratch", "")
+    return {
+        "name": font.name,
+        "scale": font.scale,
+        "up": font.up,
+        "ut": font.ut,
+        "sp": font.sp,
+        "ss": font.ss,
+        "is_cff": font.is_cff,
+        "is_cid_keyed": font.is_cid_keyed,
+        "is_symbol": font.is_symbol,
+        "desc": {name: getattr(font.desc, name) for name in _DESCRIPTOR_FIELDS} | {"flags": font.desc.flags.value},
+        # Pairs rather than objects: fpdf relies on the cmap's order.
+        "cmap": list(font.cmap.items()),
+        "glyph_ids": list(font.glyph_ids.items()),
+        "cw": list(font.cw.items()),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def font_metrics(path: Path) -> dict[str, Any]:
+    """Return the parsed metrics of ``path``, from the on-disk cache when possible."""
+    _, digest = _font_file(path)
+    cache = CACHE_DIR / f"{digest}.json"
+    stamp = f"{CACHE_VERSION}/{FPDF_VERSION}"
+    try:
+        cached = json.loads(cache.read_text())
+        if cached.get("stamp") == stamp:
+            return cached
+    except (OSError, ValueError):
+        pass
+    metrics = {"stamp": stamp, **_parse_metrics(path)}
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = cache.with_suffix(".tmp")
+    tmp.write_text(json.dumps(metrics, separators=(",", ":")))
+    tmp.replace(cache)
+    return metrics
+
+
+def _new_font(pdf: FPDF, source: Path, fontkey: str, style: str) -> TTFFont:
+    """Build a document's font object for ``source`` from the prepared face and its metrics."""
+    path = prepared_font(source)
+    metrics = font_metrics(path)
+    data, _ = _font_file(path)
+    desc = metrics["desc"]
+    font = TTFFont.__new__(TTFFont)
+    font.i = len(pdf.fonts) + 1
+    font.type = "TTF"
+    font.ttffile = path
+    font.fontkey = fontkey
+    font.emphasis = TextEmphasis.coerce(style)
+    # The subset is cut from this copy when the document is written.
+    font.ttfont = ttLib.TTFont(io.BytesIO(data), recalcTimestamp=False, lazy=True)
+    for name in ("name", "scale", "up", "ut", "sp", "ss", "is_cff", "is_cid_keyed", "is_symbol"):
+        setattr(font, name, metrics[name])
+    font.desc = PDFFontDescriptor(**{**desc, "flags": FontDescriptorFlags(desc["flags"])})
+    font.cw = defaultdict(lambda: desc["missing_width"], metrics["cw"])
+    font.cmap = dict(metrics["cmap"])
+    font.glyph_ids = dict(metrics["glyph_ids"])
+    font.is_compressed = False
+    font.cff_ros = None
+    font.collection_font_number = 0
+    font.unicode_range = None
+    font.palette_index = 0
+    font.color_font = None
+    font.biggest_size_pt = 0
+    font.missing_glyphs = []
+    font._hbfont = None
+    font.subset = SubsetMap(font)
+    return font
+
+
+def _add_face(pdf: FPDF, face: str) -> None:
+    source = find_font(face)
+    if FPDF_VERSION == FONT_OBJECT_FPDF_VERSION:
+        pdf.fonts[FAMILY + face] = _new_font(pdf, source, FAMILY + face, face)
+    else:
+        pdf.add_font(FAMILY, face, prepared_font(source))
+
+
+class UnicodePDF(FPDF):
+    """An FPDF that draws the Helvetica family with embedded Unicode TTF faces."""
+
+    def set_font(self, family: str | None = None, style: str | TextEmphasis = "", size: float = 0) -> None:
+        if isinstance(style, TextEmphasis):
+            style = style.style
+        # fpdf passes no family when switching styles inside markdown text.
+        if (family or self.font_family).lower() in (FAMILY, *ALIASED_FAMILIES):
+            family = FAMILY
+            face = "".join(sorted(style.upper().replace("U", "").replace("S", "")))
+            if FAMILY + face not in self.fonts:
+                _add_face(self, face)
+        super().set_font(family, style, size)
@@ -4,4 +4,10 @@ import react from '@vitejs/plugin-react'
 export default defineConfig({
   plugins: [react()],
   base: './',
+  server: {
+    // On-demand PDF downloads from claudedocs/render_service.py
+    proxy: {
+      '/pdf': 'http://127.0.0.1:8765',
+    },
+  },
 })